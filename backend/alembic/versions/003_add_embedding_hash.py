@@ -0,0 +1,33 @@
+"""Add embedding content hash and model columns
+
+Revision ID: 003_add_embedding_hash
+Revises: 002_add_indexes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_add_embedding_hash'
+down_revision = '002_add_indexes'
+branch_labels = None
+depends_on = None
+
+# 임베딩 컬럼이 있는 문서 테이블
+EMBEDDED_TABLES = ('academic_schedules', 'notices', 'support_programs', 'academic_glossary')
+
+
+def upgrade() -> None:
+    """증분 재임베딩용 내용 해시/모델 컬럼 추가 (기존 행은 NULL → 다음 백필에서 채워짐)"""
+    for table_name in EMBEDDED_TABLES:
+        op.add_column(table_name, sa.Column('embedding_hash', sa.String(64), nullable=True, comment='임베딩 생성 당시 텍스트 해시 (SHA-256)'))
+        op.add_column(table_name, sa.Column('embedding_model', sa.String(200), nullable=True, comment='임베딩 생성 모델'))
+
+
+def downgrade() -> None:
+    """내용 해시/모델 컬럼 제거"""
+    for table_name in EMBEDDED_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column('embedding_model')
+            batch_op.drop_column('embedding_hash')
@@ -0,0 +1,30 @@
+"""Add request id and stage timings to question logs
+
+Revision ID: 004_add_question_log_timings
+Revises: 003_add_embedding_hash
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_add_question_log_timings'
+down_revision = '003_add_embedding_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """요청 ID와 단계별 처리 시간 컬럼 추가 (기존 로그는 NULL)"""
+    op.add_column('question_logs', sa.Column('request_id', sa.String(64), nullable=True, comment='요청 ID (X-Request-ID)'))
+    op.add_column('question_logs', sa.Column('timings', sa.JSON(), nullable=True, comment='단계별 처리 시간 (ms)'))
+    op.create_index('ix_question_logs_request_id', 'question_logs', ['request_id'])
+
+
+def downgrade() -> None:
+    """요청 ID와 단계별 처리 시간 컬럼 제거"""
+    op.drop_index('ix_question_logs_request_id', table_name='question_logs')
+    with op.batch_alter_table('question_logs') as batch_op:
+        batch_op.drop_column('timings')
+        batch_op.drop_column('request_id')
@@ -0,0 +1,32 @@
+"""Add document table versions
+
+Revision ID: 005_add_table_versions
+Revises: 004_add_question_log_timings
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_add_table_versions'
+down_revision = '004_add_question_log_timings'
+branch_labels = None
+depends_on = None
+
+DOCUMENT_TABLES = ['academic_schedules', 'notices', 'support_programs', 'academic_glossary']
+
+
+def upgrade() -> None:
+    """문서 테이블 버전 테이블 생성 (문서 테이블별 버전 0으로 시작)"""
+    versions = op.create_table(
+        'table_versions',
+        sa.Column('table_name', sa.String(100), primary_key=True, comment='테이블 이름'),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0', comment='쓰기마다 1씩 증가하는 버전'),
+    )
+    op.bulk_insert(versions, [{'table_name': name, 'version': 0} for name in DOCUMENT_TABLES])
+
+
+def downgrade() -> None:
+    """문서 테이블 버전 테이블 제거"""
+    op.drop_table('table_versions')
@@ -1,24 +1,89 @@
 """
 챗봇 API 엔드포인트
 """
+import json
 import logging
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from typing import Any, AsyncIterator, Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.monitoring import get_performance_monitor
+from app.core.tracing import REQUEST_ID_HEADER, RequestTrace, resolve_request_id, start_trace
 from app.schemas.chat import ChatRequest, ChatResponse
-from app.services.ai.rag import get_rag_pipeline
 from app.services.ai.fallback import get_fallback_handler
-from app.models.question_log import QuestionLog, QuestionStatus, QuestionCategory
+from app.services.question_log_sink import get_question_log_sink
+from app.models.question_log import QuestionStatus, QuestionCategory
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# RAG 결과 카테고리 문자열 → 질문 로그 카테고리
+_CATEGORY_MAP = {
+    "학사일정": QuestionCategory.ACADEMIC_SCHEDULE,
+    "공지사항": QuestionCategory.NOTICE,
+    "지원프로그램": QuestionCategory.SUPPORT_PROGRAM,
+    "학사정보": QuestionCategory.ACADEMIC_INFO,
+}
+
+
+def get_rag_pipeline(db: AsyncSession):
+    """
+    RAG 파이프라인 생성
+    검색/임베딩/LLM 클라이언트 모듈은 무거우므로 앱 import 시점이 아니라 첫 채팅 요청(또는 워밍업) 때 import
+    """
+    from app.services.ai.rag import get_rag_pipeline as create_rag_pipeline
+    return create_rag_pipeline(db)
+
+
+def _parse_category(value: Any) -> QuestionCategory:
+    """RAG 결과의 카테고리 값을 QuestionCategory로 변환"""
+    try:
+        return QuestionCategory(value)
+    except ValueError:
+        return _CATEGORY_MAP.get(value, QuestionCategory.OTHER)
+
+
+def _save_question_log(
+    question: str,
+    answer: str,
+    category: QuestionCategory,
+    success: bool,
+    trace: Optional[RequestTrace] = None,
+):
+    """질문 로그 저장 요청 (백그라운드 배치 저장, 응답 지연 없음)"""
+    get_question_log_sink().submit({
+        "question": question,
+        "answer": answer,
+        "category": category,
+        "status": QuestionStatus.COMPLETED if success else QuestionStatus.FAILED,
+        "request_id": trace.request_id if trace else None,
+        "timings": trace.timings() if trace else None,
+        "created_at": datetime.now(),
+    })
+
+
+def _finish_trace(trace: RequestTrace) -> Dict[str, float]:
+    """요청 전체 시간을 성능 모니터에 기록하고 단계별 처리 시간 반환"""
+    timings = trace.timings()
+    get_performance_monitor().record("chat", timings["total"] / 1000)
+    logger.info(f"채팅 처리 시간 [{trace.request_id}]: {timings}")
+    return timings
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 
 @router.post("/api/v1/chat", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
-    db: Session = Depends(get_db),
+    http_request: Request,
+    http_response: Response,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     챗봇 질문 처리 엔드포인트
@@ -31,8 +96,12 @@ async def chat(
     3. 벡터 검색 + 키워드 검색 (하이브리드)
     4. Claude API를 사용하여 답변 생성
     5. 답변 구조화 및 출처 표기
-    6. 질문 로그 저장
+    6. 질문 로그 저장 (요청 ID, 단계별 처리 시간 포함)
+    
+    응답에는 `X-Request-ID` 헤더가 붙고, SERVER_TIMING_ENABLED면 `Server-Timing` 헤더로 단계별 처리 시간을 보냅니다.
     """
+    trace = start_trace(resolve_request_id(http_request.headers.get(REQUEST_ID_HEADER)))
+    http_response.headers[REQUEST_ID_HEADER] = trace.request_id
     try:
         logger.info(f"채팅 요청 받음: {request.message}")
         
@@ -47,33 +116,19 @@ async def chat(
             sources=rag_result.get("sources", []),
         )
         
-        # 질문 로그 저장
-        try:
-            # 카테고리 파싱
-            category_map = {
-                "학사일정": QuestionCategory.ACADEMIC_SCHEDULE,
-                "공지사항": QuestionCategory.NOTICE,
-                "지원프로그램": QuestionCategory.SUPPORT_PROGRAM,
-                "학사정보": QuestionCategory.ACADEMIC_INFO,
-            }
-            category_enum = category_map.get(
-                rag_result.get("category", "기타"),
-                QuestionCategory.OTHER
-            )
-            
-            question_log = QuestionLog(
-                question=request.message,
-                answer=response.answer,
-                category=category_enum,
-                status=QuestionStatus.COMPLETED if rag_result.get("success") else QuestionStatus.FAILED,
-                created_at=datetime.now(),
-            )
-            db.add(question_log)
-            db.commit()
-            logger.info(f"질문 로그 저장 완료: ID={question_log.id}")
-        except Exception as log_error:
-            logger.error(f"질문 로그 저장 실패: {log_error}")
-            # 로그 저장 실패해도 응답은 반환
+        # 질문 로그 저장 (백그라운드 배치 저장)
+        _finish_trace(trace)
+        _save_question_log(
+            request.message,
+            response.answer,
+            _parse_category(rag_result.get("category", "기타")),
+            bool(rag_result.get("success")),
+            trace,
+        )
+        if settings.SERVER_TIMING_ENABLED:
+            http_response.headers["Server-Timing"] = trace.server_timing()
+            # 다른 출처의 프론트엔드 스크립트가 PerformanceServerTiming으로 읽을 수 있도록 허용
+            http_response.headers["Timing-Allow-Origin"] = ", ".join(settings.CORS_ORIGINS)
         
         return response
         
@@ -91,18 +146,79 @@ async def chat(
         )
 
         # 에러 로그 저장
-        try:
-            question_log = QuestionLog(
-                question=request.message,
-                answer=response.answer,
-                category=QuestionCategory.OTHER,
-                status=QuestionStatus.FAILED,
-                created_at=datetime.now(),
-            )
-            db.add(question_log)
-            db.commit()
-        except:
-            pass  # 로그 저장도 실패하면 무시
+        _finish_trace(trace)
+        _save_question_log(request.message, response.answer, QuestionCategory.OTHER, False, trace)
 
         # 에러가 발생했어도 폴백 답변은 반환
         return response
+
+
+@router.post("/api/v1/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    http_request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    챗봇 질문 처리 스트리밍 엔드포인트 (Server-Sent Events)
+    
+    답변 전체가 생성될 때까지 기다리지 않고 검색이 끝나는 즉시 출처를 보내고,
+    이후 모델이 생성하는 답변을 조각 단위로 보냅니다.
+    
+    **이벤트 순서:**
+    1. `meta`: 카테고리, 출처, 검색 결과 수
+    2. `token`: 답변 조각 (여러 번)
+    3. `done`: 전체 답변 및 성공 여부 (스트림 종료 후 질문 로그 저장)
+    
+    헤더는 본문보다 먼저 나가므로 단계별 처리 시간은 SERVER_TIMING_ENABLED일 때 `done` 이벤트의 `timings`로 보냅니다.
+    """
+    logger.info(f"스트리밍 채팅 요청 받음: {request.message}")
+    request_id = resolve_request_id(http_request.headers.get(REQUEST_ID_HEADER))
+    
+    async def event_stream() -> AsyncIterator[str]:
+        trace = start_trace(request_id)
+        category = QuestionCategory.OTHER
+        answer_parts = []
+        answer = None
+        success = False
+        try:
+            rag_pipeline = get_rag_pipeline(db)
+            async for event in rag_pipeline.stream_question(request.message):
+                data = event["data"]
+                if event["event"] == "meta":
+                    category = _parse_category(data.get("category", "기타"))
+                elif event["event"] == "token":
+                    answer_parts.append(data["text"])
+                elif event["event"] == "done":
+                    answer = data.get("answer")
+                    success = bool(data.get("success"))
+                    if settings.SERVER_TIMING_ENABLED:
+                        data = {**data, "timings": trace.timings()}
+                yield _sse_event(event["event"], data)
+        except Exception as e:
+            logger.error(f"스트리밍 채팅 API 에러: {str(e)}", exc_info=True)
+            fallback_result = get_fallback_handler().get_error_response(str(e))
+            answer = fallback_result["answer"]
+            yield _sse_event("error", {"answer": answer, "category": fallback_result.get("category", "error")})
+        finally:
+            # 스트림 종료(완료, 오류, 클라이언트 연결 끊김) 시 질문 로그 저장
+            _finish_trace(trace)
+            _save_question_log(
+                request.message,
+                answer if answer is not None else "".join(answer_parts),
+                category,
+                success,
+                trace,
+            )
+            # 의존성 정리는 스트리밍 전에 끝나므로, 스트리밍 중 다시 연 연결은 여기서 반환
+            await db.close()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 리버스 프록시(nginx) 버퍼링 비활성화
+            REQUEST_ID_HEADER: request_id,
+        },
+    )
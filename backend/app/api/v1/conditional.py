@@ -0,0 +1,39 @@
+"""
+조회 API 조건부 요청 처리 (ETag / If-None-Match)
+"""
+from typing import Any, Optional
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def not_modified(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    table_name: str,
+    *variant: Any,
+) -> Optional[Response]:
+    """
+    응답에 ETag를 설정하고, If-None-Match가 일치하면 304 응답 반환
+
+    행을 조회하기 전에 호출하므로 재검증 요청은 테이블 시그니처 확인만으로 끝남
+
+    Args:
+        request: 요청 (경로와 쿼리 파라미터가 ETag에 포함됨)
+        response: 200 응답 헤더를 설정할 응답
+        db: DB 세션
+        table_name: 응답이 의존하는 테이블
+        variant: 경로/쿼리 외에 응답을 바꾸는 값 (예: 기준 날짜)
+
+    Returns:
+        304 응답 (일치하지 않으면 None)
+    """
+    from app.services.etags import etag_matches, get_table_etags
+
+    etags = get_table_etags()
+    query = tuple(sorted(request.query_params.multi_items()))
+    etag = await etags.etag(db, table_name, request.url.path, query, *variant)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
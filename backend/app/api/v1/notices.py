@@ -1,10 +1,12 @@
 """
 공지사항 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.api.v1.conditional import not_modified
+from app.core.database import get_async_db
 from app.models.notice import Notice
 from app.schemas.notice import NoticeResponse
 
@@ -13,10 +15,12 @@ router = APIRouter()
 
 @router.get("/api/v1/notices", response_model=List[NoticeResponse])
 async def get_notices(
+    request: Request,
+    response: Response,
     category: str = None,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     공지사항 조회 엔드포인트
@@ -27,12 +31,18 @@ async def get_notices(
     - offset: 건너뛸 결과 수 (기본값: 0)
     """
     try:
-        query = db.query(Notice)
+        # 재검증 요청은 행을 조회하지 않고 304 응답
+        not_modified_response = await not_modified(request, response, db, Notice.__tablename__)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        query = select(Notice)
 
         if category:
-            query = query.filter(Notice.category == category)
+            query = query.where(Notice.category == category)
 
-        notices = query.order_by(Notice.created_at.desc()).offset(offset).limit(limit).all()
+        query = query.order_by(Notice.created_at.desc()).offset(offset).limit(limit)
+        notices = (await db.execute(query)).scalars().all()
 
         return notices
 
@@ -42,14 +52,21 @@ async def get_notices(
 
 @router.get("/api/v1/notices/{notice_id}", response_model=NoticeResponse)
 async def get_notice(
+    request: Request,
+    response: Response,
     notice_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     특정 공지사항 조회 엔드포인트
     """
     try:
-        notice = db.query(Notice).filter(Notice.id == notice_id).first()
+        # 재검증 요청은 행을 조회하지 않고 304 응답
+        not_modified_response = await not_modified(request, response, db, Notice.__tablename__)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        notice = await db.get(Notice, notice_id)
 
         if not notice:
             raise HTTPException(status_code=404, detail="공지사항을 찾을 수 없습니다")
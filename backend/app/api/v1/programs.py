@@ -1,10 +1,12 @@
 """
 지원 프로그램 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.api.v1.conditional import not_modified
+from app.core.database import get_async_db
 from app.models.support_program import SupportProgram
 from app.schemas.support_program import SupportProgramResponse
 
@@ -13,10 +15,12 @@ router = APIRouter()
 
 @router.get("/api/v1/programs", response_model=List[SupportProgramResponse])
 async def get_programs(
+    request: Request,
+    response: Response,
     program_type: str = None,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     지원 프로그램 조회 엔드포인트
@@ -27,12 +31,18 @@ async def get_programs(
     - offset: 건너뛸 결과 수 (기본값: 0)
     """
     try:
-        query = db.query(SupportProgram)
+        # 재검증 요청은 행을 조회하지 않고 304 응답
+        not_modified_response = await not_modified(request, response, db, SupportProgram.__tablename__)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        query = select(SupportProgram)
 
         if program_type:
-            query = query.filter(SupportProgram.program_type == program_type)
+            query = query.where(SupportProgram.program_type == program_type)
 
-        programs = query.order_by(SupportProgram.created_at.desc()).offset(offset).limit(limit).all()
+        query = query.order_by(SupportProgram.created_at.desc()).offset(offset).limit(limit)
+        programs = (await db.execute(query)).scalars().all()
 
         return programs
 
@@ -42,14 +52,21 @@ async def get_programs(
 
 @router.get("/api/v1/programs/{program_id}", response_model=SupportProgramResponse)
 async def get_program(
+    request: Request,
+    response: Response,
     program_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     특정 지원 프로그램 조회 엔드포인트
     """
     try:
-        program = db.query(SupportProgram).filter(SupportProgram.id == program_id).first()
+        # 재검증 요청은 행을 조회하지 않고 304 응답
+        not_modified_response = await not_modified(request, response, db, SupportProgram.__tablename__)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        program = await db.get(SupportProgram, program_id)
 
         if not program:
             raise HTTPException(status_code=404, detail="프로그램을 찾을 수 없습니다")
@@ -1,10 +1,12 @@
 """
 학사 일정 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.api.v1.conditional import not_modified
+from app.core.database import get_async_db
 from app.models.academic_schedule import AcademicSchedule
 from app.schemas.academic_schedule import AcademicScheduleResponse
 from datetime import datetime
@@ -14,9 +16,11 @@ router = APIRouter()
 
 @router.get("/schedules", response_model=List[AcademicScheduleResponse])
 async def get_schedules(
+    request: Request,
+    response: Response,
     semester: str = None,
     schedule_type: str = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     학사 일정 조회 엔드포인트
@@ -26,18 +30,24 @@ async def get_schedules(
     - schedule_type: 일정 유형 필터 (예: "수강신청", "등록금 납부")
     """
     try:
-        query = db.query(AcademicSchedule)
+        today = datetime.now().date()
+        # 재검증 요청은 행을 조회하지 않고 304 응답
+        not_modified_response = await not_modified(request, response, db, AcademicSchedule.__tablename__, today)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        query = select(AcademicSchedule)
 
         if semester:
-            query = query.filter(AcademicSchedule.semester == semester)
+            query = query.where(AcademicSchedule.semester == semester)
 
         if schedule_type:
-            query = query.filter(AcademicSchedule.schedule_type == schedule_type)
+            query = query.where(AcademicSchedule.schedule_type == schedule_type)
 
         # 현재 날짜 이후의 일정만 조회
-        query = query.filter(AcademicSchedule.start_date >= datetime.now().date())
+        query = query.where(AcademicSchedule.start_date >= today)
 
-        schedules = query.order_by(AcademicSchedule.start_date).all()
+        schedules = (await db.execute(query.order_by(AcademicSchedule.start_date))).scalars().all()
 
         return schedules
 
@@ -47,16 +57,21 @@ async def get_schedules(
 
 @router.get("/api/v1/schedules/{schedule_id}", response_model=AcademicScheduleResponse)
 async def get_schedule(
+    request: Request,
+    response: Response,
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     특정 학사 일정 조회 엔드포인트
     """
     try:
-        schedule = db.query(AcademicSchedule).filter(
-            AcademicSchedule.id == schedule_id
-        ).first()
+        # 재검증 요청은 행을 조회하지 않고 304 응답
+        not_modified_response = await not_modified(request, response, db, AcademicSchedule.__tablename__)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        schedule = await db.get(AcademicSchedule, schedule_id)
 
         if not schedule:
             raise HTTPException(status_code=404, detail="일정을 찾을 수 없습니다")
@@ -1,24 +1,112 @@
 """
-Redis 캐싱 서비스
+Redis 캐싱 서비스 (L1 프로세스 내 LRU + L2 Redis)
 """
 import json
 import hashlib
-from typing import Any, Optional
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import numpy as np
 from redis import Redis
 from redis.exceptions import RedisError
 from app.core.config import settings
+from app.utils.embedding_codec import decode_embedding, encode_embedding
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 워커 간 L1 캐시/상주 인덱스 무효화 채널
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class LocalCache:
+    """프로세스 내 LRU + TTL 캐시 (프리픽스별 용량 제한)"""
+    
+    def __init__(self, default_capacity: int, prefix_capacity: Dict[str, int], ttl: int):
+        """
+        로컬 캐시 초기화
+        
+        Args:
+            default_capacity: 프리픽스별 기본 최대 항목 수
+            prefix_capacity: 프리픽스별 최대 항목 수 (기본값 덮어쓰기)
+            ttl: 최대 보관 시간 (초, 다른 워커의 변경이 반영되는 최대 지연)
+        """
+        self._default_capacity = default_capacity
+        self._prefix_capacity = prefix_capacity
+        self._ttl = ttl
+        self._stores: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = defaultdict(OrderedDict)
+        self._lock = threading.Lock()
+    
+    def _capacity(self, prefix: str) -> int:
+        return self._prefix_capacity.get(prefix, self._default_capacity)
+    
+    def get(self, prefix: str, key: str) -> Optional[Any]:
+        """값 조회 (만료 항목은 삭제 후 None)"""
+        with self._lock:
+            store = self._stores.get(prefix)
+            if not store:
+                return None
+            item = store.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del store[key]
+                return None
+            store.move_to_end(key)
+            return value
+    
+    def set(self, prefix: str, key: str, value: Any, ttl: Optional[int] = None):
+        """값 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        capacity = self._capacity(prefix)
+        if capacity <= 0:
+            return
+        ttl = min(ttl, self._ttl) if ttl else self._ttl
+        with self._lock:
+            store = self._stores[prefix]
+            store[key] = (time.monotonic() + ttl, value)
+            store.move_to_end(key)
+            while len(store) > capacity:
+                store.popitem(last=False)
+    
+    def delete(self, prefix: str, key: Optional[str] = None):
+        """값 삭제 (key가 None이면 프리픽스 전체)"""
+        with self._lock:
+            if key is None:
+                self._stores.pop(prefix, None)
+            elif prefix in self._stores:
+                self._stores[prefix].pop(key, None)
+    
+    def size(self, prefix: Optional[str] = None) -> int:
+        """저장된 항목 수"""
+        with self._lock:
+            if prefix is not None:
+                return len(self._stores.get(prefix, ()))
+            return sum(len(store) for store in self._stores.values())
+
 
 class CacheService:
-    """Redis 기반 캐싱 서비스"""
+    """2계층 캐싱 서비스 (L1 프로세스 내 LRU → L2 Redis)"""
     
     def __init__(self):
         """캐시 서비스 초기화"""
         self._client: Optional[Redis] = None
+        self._binary_client: Optional[Redis] = None  # 바이너리 값(임베딩) 전용, 디코딩 없이 bytes 반환
         self._enabled = settings.REDIS_ENABLED
+        self._local: Optional[LocalCache] = None
+        self._instance_id = uuid.uuid4().hex
+        self._pubsub_thread = None
+        self._table_listeners: List[Callable[[str], None]] = []
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        
+        if settings.CACHE_L1_ENABLED:
+            self._local = LocalCache(
+                default_capacity=settings.CACHE_L1_MAX_ITEMS,
+                prefix_capacity=settings.CACHE_L1_PREFIX_CAPACITY,
+                ttl=settings.CACHE_L1_TTL,
+            )
         
         if self._enabled:
             try:
@@ -29,6 +117,13 @@ class CacheService:
                     socket_keepalive=True,
                     health_check_interval=30,
                 )
+                self._binary_client = Redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_keepalive=True,
+                    health_check_interval=30,
+                )
                 # 연결 테스트
                 self._client.ping()
                 logger.info("Redis 캐시 연결 성공")
@@ -36,6 +131,78 @@ class CacheService:
                 logger.warning(f"Redis 연결 실패, 캐싱 비활성화: {e}")
                 self._enabled = False
                 self._client = None
+                self._binary_client = None
+        
+        if self._enabled:
+            self._start_invalidation_listener()
+    
+    def _start_invalidation_listener(self):
+        """다른 워커/스크립트의 무효화 요청(L1 캐시 삭제, 테이블 변경)을 받는 구독 스레드 시작"""
+        try:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{INVALIDATION_CHANNEL: self._on_invalidation})
+            self._pubsub_thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        except RedisError as e:
+            logger.warning(f"캐시 무효화 채널 구독 실패: {e}")
+    
+    def _on_invalidation(self, message: dict):
+        """무효화 메시지 처리"""
+        try:
+            data = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if data.get("sender") == self._instance_id:
+            return
+        if "table" in data:
+            self._notify_table_change(data["table"])
+        elif self._local:
+            if "keys" in data:
+                for key in data["keys"]:
+                    self._local.delete(data["prefix"], key)
+            else:
+                self._local.delete(data["prefix"], data.get("key"))
+    
+    def _notify_table_change(self, table_name: str):
+        """등록된 테이블 변경 콜백 호출 (콜백 오류는 구독 스레드를 멈추지 않음)"""
+        for listener in list(self._table_listeners):
+            try:
+                listener(table_name)
+            except Exception as e:
+                logger.warning(f"테이블 변경 알림 처리 실패: {e}")
+    
+    def _publish_invalidation(self, prefix: str, key: Optional[str] = None, keys: Optional[List[str]] = None):
+        """다른 워커에 L1 캐시 무효화 전파 (keys: 여러 키를 메시지 하나로 전파)"""
+        if not self._local:
+            return
+        message = {"sender": self._instance_id, "prefix": prefix}
+        if keys is not None:
+            message["keys"] = keys
+        else:
+            message["key"] = key
+        try:
+            self._client.publish(INVALIDATION_CHANNEL, json.dumps(message))
+        except RedisError as e:
+            logger.warning(f"캐시 무효화 전파 실패: {e}")
+    
+    def add_table_listener(self, listener: Callable[[str], None]):
+        """다른 프로세스가 알린 문서 테이블 변경을 받을 콜백 등록 (상주 인덱스 갱신용)"""
+        self._table_listeners.append(listener)
+    
+    def publish_table_change(self, table_name: str):
+        """
+        문서 테이블 변경을 모든 워커에 알림 (상주 인덱스/ETag/답변 캐시 버전을 즉시 갱신 대상으로 표시)
+        
+        Args:
+            table_name: 변경된 문서 테이블 이름
+        """
+        if not self._enabled or not self._client:
+            return
+        try:
+            self._client.publish(
+                INVALIDATION_CHANNEL, json.dumps({"sender": self._instance_id, "table": table_name})
+            )
+        except RedisError as e:
+            logger.warning(f"테이블 변경 알림 실패: {e}")
     
     def _make_key(self, prefix: str, key: str) -> str:
         """캐시 키 생성"""
@@ -49,51 +216,114 @@ class CacheService:
             data_str = str(data)
         return hashlib.sha256(data_str.encode()).hexdigest()[:16]
     
-    def get(self, prefix: str, key: str) -> Optional[Any]:
-        """캐시에서 값 가져오기"""
-        if not self._enabled or not self._client:
+    def _get_raw(self, prefix: str, key: str, client: Optional[Redis]) -> Optional[Union[str, bytes]]:
+        """직렬화된 값 조회 (L1 → L2 순서, L2 히트는 L1에 채움)"""
+        stats = self._stats[prefix]
+        
+        # L1: 직렬화된 값을 보관하므로 호출자가 결과를 수정해도 캐시가 오염되지 않음
+        if self._local:
+            value = self._local.get(prefix, key)
+            if value is not None:
+                stats["l1_hits"] += 1
+                return value
+            stats["l1_misses"] += 1
+        
+        if not self._enabled or not client:
             return None
         
         try:
             cache_key = self._make_key(prefix, key)
-            value = self._client.get(cache_key)
+            value = client.get(cache_key)
             if value:
                 logger.debug(f"캐시 히트: {cache_key}")
-                return json.loads(value)
+                stats["l2_hits"] += 1
+                if self._local:
+                    self._local.set(prefix, key, value)
+                return value
             logger.debug(f"캐시 미스: {cache_key}")
+            stats["l2_misses"] += 1
             return None
-        except (RedisError, json.JSONDecodeError) as e:
+        except RedisError as e:
             logger.error(f"캐시 읽기 오류: {e}")
             return None
     
-    def set(self, prefix: str, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """캐시에 값 저장"""
-        if not self._enabled or not self._client:
-            return False
+    def _set_raw(
+        self,
+        prefix: str,
+        key: str,
+        value: Union[str, bytes],
+        ttl: Optional[int],
+        client: Optional[Redis],
+    ) -> bool:
+        """
+        직렬화된 값 저장 (L1, L2 모두)
+        
+        기존 키를 덮어쓴 경우 L2 저장이 끝난 뒤 다른 워커에 L1 무효화를 전파
+        (기존 값 존재 여부는 저장과 같은 파이프라인에서 확인하므로 왕복 횟수는 그대로)
+        """
+        if self._local:
+            self._local.set(prefix, key, value, ttl)
+        
+        if not self._enabled or not client:
+            return self._local is not None
         
         try:
             cache_key = self._make_key(prefix, key)
-            value_json = json.dumps(value, ensure_ascii=False)
             
+            pipeline = client.pipeline(transaction=False)
+            pipeline.exists(cache_key)
             if ttl:
-                self._client.setex(cache_key, ttl, value_json)
+                pipeline.setex(cache_key, ttl, value)
             else:
-                self._client.set(cache_key, value_json)
+                pipeline.set(cache_key, value)
+            overwritten = pipeline.execute()[0]
             
+            if overwritten:
+                self._publish_invalidation(prefix, key)
             logger.debug(f"캐시 저장: {cache_key} (TTL: {ttl}s)")
             return True
-        except (RedisError, TypeError, ValueError) as e:
+        except RedisError as e:
             logger.error(f"캐시 저장 오류: {e}")
             return False
     
+    def _decode(self, prefix: str, key: str, value: Any, decoder: Callable[[Any], Any]) -> Optional[Any]:
+        """직렬화된 값 역직렬화 (형식이 맞지 않는 항목은 미스로 처리하고 삭제)"""
+        try:
+            return decoder(value)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"캐시 값 형식 오류, 항목 삭제: {prefix}:{key} ({e})")
+            self.delete(prefix, key)
+            return None
+    
+    def get(self, prefix: str, key: str) -> Optional[Any]:
+        """캐시에서 값 가져오기 (L1 → L2 순서)"""
+        value = self._get_raw(prefix, key, self._client)
+        if value is None:
+            return None
+        return self._decode(prefix, key, value, json.loads)
+    
+    def set(self, prefix: str, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """캐시에 값 저장 (L1, L2 모두)"""
+        try:
+            value_json = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.error(f"캐시 저장 오류: {e}")
+            return False
+        
+        return self._set_raw(prefix, key, value_json, ttl, self._client)
+    
     def delete(self, prefix: str, key: str) -> bool:
-        """캐시에서 값 삭제"""
+        """캐시에서 값 삭제 (다른 워커의 L1에도 전파)"""
+        if self._local:
+            self._local.delete(prefix, key)
+        
         if not self._enabled or not self._client:
-            return False
+            return self._local is not None
         
         try:
             cache_key = self._make_key(prefix, key)
             self._client.delete(cache_key)
+            self._publish_invalidation(prefix, key)
             logger.debug(f"캐시 삭제: {cache_key}")
             return True
         except RedisError as e:
@@ -101,31 +331,47 @@ class CacheService:
             return False
     
     def clear_prefix(self, prefix: str) -> int:
-        """특정 프리픽스의 모든 캐시 삭제"""
+        """특정 프리픽스의 모든 캐시 삭제 (L2 삭제 후 다른 워커의 L1에도 전파)"""
+        if self._local:
+            self._local.delete(prefix)
+        
         if not self._enabled or not self._client:
             return 0
         
         try:
             pattern = f"{prefix}:*"
             keys = self._client.keys(pattern)
-            if keys:
-                deleted = self._client.delete(*keys)
+            deleted = self._client.delete(*keys) if keys else 0
+            # 삭제 전에 전파하면 다른 워커가 아직 남은 L2 값을 다시 L1에 채울 수 있음
+            self._publish_invalidation(prefix)
+            if deleted:
                 logger.info(f"캐시 삭제: {deleted}개 ({prefix}:*)")
-                return deleted
-            return 0
+            return deleted
         except RedisError as e:
             logger.error(f"캐시 일괄 삭제 오류: {e}")
             return 0
     
-    def get_embedding(self, text: str) -> Optional[list]:
-        """임베딩 캐시 조회"""
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
+        """
+        임베딩 캐시 조회 (바이너리 형식, JSON 파싱 없이 float32 배열로 디코딩)
+        
+        변환 전 JSON 형식 항목은 형식 오류로 미스 처리되어 다시 계산 후 바이너리로 저장됨
+        """
         key = self._hash_key(text)
-        return self.get("embedding", key)
+        value = self._get_raw("embedding", key, self._binary_client)
+        if value is None:
+            return None
+        return self._decode("embedding", key, value, decode_embedding)
     
-    def set_embedding(self, text: str, embedding: list) -> bool:
-        """임베딩 캐시 저장"""
+    def set_embedding(self, text: str, embedding: Any) -> bool:
+        """임베딩 캐시 저장 (EMBEDDING_STORAGE_DTYPE 형식의 바이너리)"""
         key = self._hash_key(text)
-        return self.set("embedding", key, embedding, settings.CACHE_TTL_EMBEDDING)
+        try:
+            value = encode_embedding(embedding, settings.EMBEDDING_STORAGE_DTYPE)
+        except (TypeError, ValueError) as e:
+            logger.error(f"캐시 저장 오류: {e}")
+            return False
+        return self._set_raw("embedding", key, value, settings.CACHE_TTL_EMBEDDING, self._binary_client)
     
     def get_search_result(self, query: str, filters: Optional[dict] = None) -> Optional[Any]:
         """검색 결과 캐시 조회"""
@@ -134,10 +380,71 @@ class CacheService:
         return self.get("search", key)
     
     def set_search_result(self, query: str, result: Any, filters: Optional[dict] = None) -> bool:
-        """검색 결과 캐시 저장"""
+        """검색 결과 캐시 저장 (결과에 포함된 문서 → 캐시 키 역색인 기록)"""
         key_data = {"query": query, "filters": filters or {}}
         key = self._hash_key(key_data)
-        return self.set("search", key, result, settings.CACHE_TTL_SEARCH)
+        stored = self.set("search", key, result, settings.CACHE_TTL_SEARCH)
+        if stored and isinstance(result, list):
+            self._add_document_refs(key, result)
+        return stored
+    
+    def _document_ref_key(self, table_name: str, doc_id: Any) -> str:
+        """문서별 검색 캐시 키 집합의 Redis 키"""
+        return self._make_key("search_doc", f"{table_name}:{doc_id}")
+    
+    def _add_document_refs(self, key: str, results: List[Any]):
+        """결과 문서마다 검색 캐시 키를 집합에 추가 (검색 캐시와 같은 TTL)"""
+        if not self._enabled or not self._client:
+            return
+        refs = {
+            self._document_ref_key(item["doc_table"], item.get("id"))
+            for item in results
+            if isinstance(item, dict) and item.get("doc_table")
+        }
+        if not refs:
+            return
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for ref in refs:
+                pipeline.sadd(ref, key)
+                pipeline.expire(ref, settings.CACHE_TTL_SEARCH)
+            pipeline.execute()
+        except RedisError as e:
+            logger.error(f"검색 캐시 문서 색인 저장 오류: {e}")
+    
+    def invalidate_documents(self, table_name: str, doc_ids: List[Any]) -> int:
+        """
+        지정한 문서가 포함된 검색 결과 캐시만 삭제 (다른 워커의 L1에도 전파)
+        
+        Args:
+            table_name: 문서 테이블 이름
+            doc_ids: 내용(임베딩)이 바뀐 문서 ID
+            
+        Returns:
+            삭제한 검색 캐시 항목 수
+        """
+        if not self._enabled or not self._client or not doc_ids:
+            return 0
+        
+        try:
+            refs = [self._document_ref_key(table_name, doc_id) for doc_id in doc_ids]
+            pipeline = self._client.pipeline(transaction=False)
+            for ref in refs:
+                pipeline.smembers(ref)
+            keys = sorted(set().union(*pipeline.execute()))
+            
+            if keys:
+                self._client.delete(*(self._make_key("search", key) for key in keys))
+                if self._local:
+                    for key in keys:
+                        self._local.delete("search", key)
+                self._publish_invalidation("search", keys=keys)
+            self._client.delete(*refs)
+            logger.info(f"검색 캐시 무효화: {table_name} 문서 {len(doc_ids)}개 → {len(keys)}개 항목")
+            return len(keys)
+        except RedisError as e:
+            logger.error(f"검색 캐시 문서 무효화 오류: {e}")
+            return 0
     
     def get_api_response(self, endpoint: str, params: Optional[dict] = None) -> Optional[Any]:
         """API 응답 캐시 조회"""
@@ -151,6 +458,41 @@ class CacheService:
         key = self._hash_key(key_data)
         return self.set("api", key, response, settings.CACHE_TTL_API)
     
+    def get_stats(self) -> Dict[str, Any]:
+        """L1/L2 캐시 적중률 통계"""
+        def _rate(hits: int, misses: int) -> float:
+            total = hits + misses
+            return hits / total if total else 0.0
+        
+        totals: Dict[str, int] = defaultdict(int)
+        prefixes = {}
+        for prefix, stats in list(self._stats.items()):
+            for name, count in stats.items():
+                totals[name] += count
+            prefixes[prefix] = {
+                "l1_hit_rate": _rate(stats["l1_hits"], stats["l1_misses"]),
+                "l2_hit_rate": _rate(stats["l2_hits"], stats["l2_misses"]),
+                "l1_size": self._local.size(prefix) if self._local else 0,
+                **stats,
+            }
+        
+        return {
+            "l1_enabled": self._local is not None,
+            "l2_enabled": self._enabled,
+            "l1": {
+                "hits": totals["l1_hits"],
+                "misses": totals["l1_misses"],
+                "hit_rate": _rate(totals["l1_hits"], totals["l1_misses"]),
+                "size": self._local.size() if self._local else 0,
+            },
+            "l2": {
+                "hits": totals["l2_hits"],
+                "misses": totals["l2_misses"],
+                "hit_rate": _rate(totals["l2_hits"], totals["l2_misses"]),
+            },
+            "prefixes": prefixes,
+        }
+    
     def healthcheck(self) -> bool:
         """Redis 연결 상태 확인"""
         if not self._enabled or not self._client:
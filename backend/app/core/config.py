@@ -2,7 +2,7 @@
 애플리케이션 설정
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -24,10 +24,32 @@ class Settings(BaseSettings):
     CACHE_TTL_SEARCH: int = 3600  # 검색 결과 캐시 1시간
     CACHE_TTL_API: int = 300  # API 응답 캐시 5분
     
+    # L1 (프로세스 내) 캐시 설정
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_TTL: int = 300  # L1 최대 보관 시간 (워커 간 불일치 허용 시간)
+    CACHE_L1_MAX_ITEMS: int = 1024  # 프리픽스별 기본 최대 항목 수
+    CACHE_L1_PREFIX_CAPACITY: Dict[str, int] = {"embedding": 4096, "search": 1024, "api": 256}
+    
     # AI API 설정
     OPENAI_API_KEY: str = ""
     GEMINI_API_KEY: str = ""
+    GEMINI_MODEL: str = "gemini-2.0-flash-exp"
+    GEMINI_API_BASE_URL: str = "https://generativelanguage.googleapis.com/v1beta"
+    GEMINI_TIMEOUT: float = 30.0  # 호출당 제한 시간 (초, 동시성 대기 포함)
+    GEMINI_CONNECT_TIMEOUT: float = 5.0
+    GEMINI_MAX_CONCURRENCY: int = 16  # 워커당 동시 Gemini 호출 수
     EMBEDDING_MODEL: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    EMBEDDING_STORAGE_DTYPE: str = "float32"  # Redis/SQLite 저장 형식 (float32, float16, int8)
+    EMBEDDING_BACKEND: str = "torch"  # 추론 백엔드 (torch, onnx)
+    EMBEDDING_ONNX_DIR: str = "./models/embedding-onnx"  # scripts/export_onnx.py 출력 디렉터리
+    EMBEDDING_ONNX_QUANTIZED: bool = True  # int8 동적 양자화 ONNX 모델 사용
+    EMBEDDING_THREADS: int = 0  # 프로세스당 추론 스레드 수 (0이면 런타임 기본값)
+    EMBEDDING_BATCH_ENABLED: bool = True  # 동시 질문 임베딩 요청을 모아 한 번에 인코딩
+    EMBEDDING_BATCH_MAX_SIZE: int = 32  # 배치당 최대 텍스트 수
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0  # 첫 요청 이후 배치를 모으는 최대 대기 시간 (ms)
+    EMBEDDING_SIDECAR_SOCKET: str = ""  # 임베딩 사이드카 Unix 소켓 경로 (빈 값이면 워커마다 모델 로드)
+    EMBEDDING_SIDECAR_TIMEOUT: float = 5.0  # 사이드카 요청 제한 시간 (초)
+    EMBEDDING_SIDECAR_RETRY_INTERVAL: float = 30.0  # 사이드카 실패 후 현재 프로세스 추론 유지 시간 (초)
     
     # CORS 설정
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:3001"]
@@ -36,11 +58,43 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     
     # 성능 설정
+    WARMUP_ENABLED: bool = True  # 시작 시 모델/인덱스/연결 풀 워밍업 (완료 전까지 /ready 503)
+    WARMUP_RETRY_ATTEMPTS: int = 3  # 필수 워밍업 단계 실패 시 재시도 횟수
+    WARMUP_RETRY_BACKOFF: float = 1.0  # 첫 재시도 대기 시간(초), 재시도마다 두 배 (최대 30초)
+    WARMUP_RETRY_COOLDOWN: float = 60.0  # 재시도까지 실패한 뒤 /ready 요청이 워밍업을 다시 시작하기까지 대기 시간(초)
+    SERVER_TIMING_ENABLED: bool = False  # 채팅 응답에 단계별 처리 시간(Server-Timing 헤더) 포함
     MAX_WORKERS: int = 4  # 비동기 작업 워커 수
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
     API_RATE_LIMIT: int = 100  # 분당 요청 제한
     
+    # 검색 인덱스 설정
+    SEARCH_INDEX_REFRESH_INTERVAL: int = 60  # 인메모리 검색 인덱스 변경 확인 주기 (초)
+    # PostgreSQL에서도 상주 키워드 인덱스(BM25) 사용 (기본값: DB 쿼리로 키워드 검색)
+    # 켜면 워커마다 활성 문서 원문과 토큰 포스팅을 보관해 문서 텍스트 크기의 약 5배 메모리를 쓰고
+    # (고유 바이그램이 많을수록 증가, 워커 수만큼 곱해짐), 문서 테이블이 바뀔 때마다 워커별로 테이블 전체를 다시 읽어 재구성함
+    # SQLite는 항상 상주 인덱스 사용
+    KEYWORD_INDEX_POSTGRESQL: bool = False
+    ETAG_REFRESH_INTERVAL: float = 5.0  # 조회 API ETag용 테이블 시그니처 확인 주기 (초, 0이면 매 요청)
+    HYBRID_SEARCH_CONCURRENT: bool = True  # 하이브리드 검색의 키워드/벡터 분기 동시 실행
+    HYBRID_SEARCH_DEADLINE: float = 2.0  # 동시 실행 시 분기 대기 한도 (초, 초과 시 완료된 결과만 사용)
+    HYBRID_SEARCH_CANDIDATE_FACTOR: float = 1.0  # 분기별 후보 수 = limit × 배수
+    SEARCH_FUSION_STRATEGY: str = "rrf"  # 결과 통합 전략 (rrf, minmax, zscore, weighted)
+    SEARCH_FUSION_CATEGORY_STRATEGIES: Dict[str, str] = {}  # 카테고리별 전략 (예: {"공지사항": "zscore"})
+    SEARCH_FUSION_KEYWORD_WEIGHT: float = 0.4  # 키워드 점수 가중치 (벡터는 1 - 가중치)
+    SEARCH_FUSION_RRF_K: int = 60  # RRF 순위 평활 상수
+    
+    # 의미 답변 캐시 설정
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_THRESHOLD: float = 0.9  # 캐시 히트로 인정할 질문 임베딩 최소 코사인 유사도
+    ANSWER_CACHE_TTL: int = 21600  # 답변 보관 시간 (6시간)
+    ANSWER_CACHE_MAX_ENTRIES: int = 2048
+    
+    # 질문 로그 비동기 저장 설정
+    QUESTION_LOG_QUEUE_SIZE: int = 10000  # 최대 대기 로그 수 (초과 시 버림)
+    QUESTION_LOG_BATCH_SIZE: int = 200  # 한 번에 INSERT하는 최대 로그 수
+    QUESTION_LOG_FLUSH_INTERVAL: float = 1.0  # 배치가 차지 않아도 저장하는 주기 (초)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
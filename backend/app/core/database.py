@@ -1,11 +1,31 @@
 """
 데이터베이스 연결 설정
 """
+from typing import AsyncIterator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
+# 동기 드라이버 → 비동기 드라이버
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """동기 DATABASE_URL을 같은 DB를 가리키는 비동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.drivername in _ASYNC_DRIVERS.values():
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
 # 데이터베이스 엔진 생성 (연결 풀 최적화)
 engine = create_engine(
     settings.DATABASE_URL,
@@ -19,6 +39,21 @@ engine = create_engine(
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (API 라우터용, 연결 풀 크기는 동기 엔진과 같은 설정 사용)
+# (aiosqlite 기본값은 NullPool이므로 명시적으로 큐 풀 사용)
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    poolclass=AsyncAdaptedQueuePool,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=3600,
+    echo=settings.DEBUG,
+)
+
+# 비동기 세션 팩토리 (커밋 후에도 로드된 속성에 접근할 수 있도록 만료하지 않음)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 # 베이스 모델 클래스
 Base = declarative_base()
 
@@ -30,3 +65,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """비동기 데이터베이스 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,76 +1,147 @@
 """
 API 미들웨어 (성능 최적화)
+
+BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현
+- 요청마다 추가 태스크와 응답 래핑이 생기지 않고, 스트리밍 응답 본문을 그대로 통과시킴
+- 응답 헤더는 http.response.start 메시지에서 직접 수정
 """
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.gzip import GZIPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, Optional
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 캐시하지 않는 응답의 Cache-Control (기본값)
+NO_CACHE = "no-cache, no-store, must-revalidate"
+
+# GET 응답 캐시 정책: 목록 경로 → Cache-Control (상세 경로 /목록/{id}도 같은 정책)
+CACHE_CONTROL_ROUTES: Dict[str, str] = {
+    "/api/v1/schedules": "public, max-age=3600",  # 학사 일정: 1시간
+    "/api/v1/notices": "public, max-age=300",  # 공지사항: 5분
+    "/api/v1/programs": "public, max-age=1800",  # 지원 프로그램: 30분
+}
+
+
+# GZip 압축에서 제외하는 Content-Type (조각을 받는 즉시 전달해야 하는 SSE 스트림)
+UNCOMPRESSED_CONTENT_TYPES = ("text/event-stream",)
+
+
+def cache_control_for(path: str, routes: Dict[str, str] = CACHE_CONTROL_ROUTES) -> str:
+    """
+    경로의 Cache-Control 값 (경로 또는 상위 경로가 캐시 경로표에 있으면 해당 정책, 없으면 NO_CACHE)
+
+    문자열 포함 검사가 아니라 경로 단위로 비교하므로 /api/v1/notices-archive 같은 경로는 일치하지 않음
+    """
+    path = path.rstrip("/") or "/"
+    policy = routes.get(path)
+    if policy is None:
+        policy = routes.get(path.rsplit("/", 1)[0], NO_CACHE)
+    return policy
+
+
+class _StreamingAwareGZipResponder(GZipResponder):
+    """SSE 응답은 압축하지 않고 그대로 통과시키는 GZip 응답기"""
+
+    async def send_with_gzip(self, message: Message):
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith(UNCOMPRESSED_CONTENT_TYPES):
+                # 이미 인코딩된 응답과 같은 경로(본문 그대로 전달)를 타도록 표시
+                self.content_encoding_set = True
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip 압축 미들웨어 (text/event-stream 제외)
+
+    기본 GZipMiddleware는 스트리밍 응답 조각을 압축 버퍼에 모아 보내므로 SSE 토큰이 늦게 도착함
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _StreamingAwareGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class PerformanceMiddleware:
+    """성능 측정 미들웨어 (응답 시작까지의 처리 시간을 X-Process-Time 헤더로 전달)"""
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    """성능 측정 미들웨어"""
-    
-    async def dispatch(self, request: Request, call_next):
-        """요청 처리 시간 측정"""
-        start_time = time.time()
-        
-        # 요청 처리
-        response = await call_next(request)
-        
-        # 처리 시간 계산
-        process_time = time.time() - start_time
-        
-        # 응답 헤더에 처리 시간 추가
-        response.headers["X-Process-Time"] = str(process_time)
-        
-        # 느린 요청 로깅 (1초 이상)
-        if process_time > 1.0:
-            logger.warning(
-                f"느린 요청 감지: {request.method} {request.url.path} - {process_time:.2f}s"
-            )
-        
-        return response
-
-
-class CacheMiddleware(BaseHTTPMiddleware):
-    """캐시 헤더 추가 미들웨어"""
-    
-    async def dispatch(self, request: Request, call_next):
-        """캐시 정책 설정"""
-        response = await call_next(request)
-        
-        # GET 요청에 대해 캐시 헤더 추가
-        if request.method == "GET":
-            # API 엔드포인트별 캐시 정책
-            if "/api/v1/schedules" in request.url.path:
-                # 학사 일정: 1시간 캐시
-                response.headers["Cache-Control"] = "public, max-age=3600"
-            elif "/api/v1/notices" in request.url.path:
-                # 공지사항: 5분 캐시
-                response.headers["Cache-Control"] = "public, max-age=300"
-            elif "/api/v1/programs" in request.url.path:
-                # 지원 프로그램: 30분 캐시
-                response.headers["Cache-Control"] = "public, max-age=1800"
-            else:
-                # 기본: 캐시 안함
-                response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        
-        return response
+    def __init__(self, app: ASGIApp, slow_threshold: float = 1.0):
+        """
+        Args:
+            app: 다음 ASGI 앱
+            slow_threshold: 느린 요청 경고 기준 (초, 스트리밍 응답은 본문 전송 완료까지 기준)
+        """
+        self.app = app
+        self.slow_threshold = slow_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                # 응답 헤더에 처리 시간 추가
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{time.perf_counter() - start_time:.6f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # 느린 요청 로깅 (1초 이상)
+            process_time = time.perf_counter() - start_time
+            if process_time > self.slow_threshold:
+                logger.warning(
+                    f"느린 요청 감지: {scope['method']} {scope['path']} - {process_time:.2f}s"
+                )
+
+
+class CacheMiddleware:
+    """캐시 헤더 추가 미들웨어 (GET 응답에 경로표 기반 Cache-Control 설정)"""
+
+    def __init__(self, app: ASGIApp, routes: Optional[Dict[str, str]] = None):
+        self.app = app
+        self.routes = CACHE_CONTROL_ROUTES if routes is None else routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        policy = cache_control_for(scope["path"], self.routes)
+
+        async def send_with_cache_control(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                # 오류 응답은 공유 캐시에 남기지 않고, 엔드포인트가 직접 정한 정책은 유지
+                headers.setdefault(
+                    "Cache-Control", policy if message["status"] < 400 else NO_CACHE
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
 
 
 def setup_middlewares(app):
     """미들웨어 설정"""
-    
-    # GZIP 압축 (응답 크기 1KB 이상일 때)
-    app.add_middleware(GZIPMiddleware, minimum_size=1000)
-    
+
+    # GZIP 압축 (응답 크기 1KB 이상일 때, SSE 스트림 제외)
+    app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1000)
+
     # 성능 측정
     app.add_middleware(PerformanceMiddleware)
-    
+
     # 캐시 정책
     app.add_middleware(CacheMiddleware)
-    
+
     logger.info("미들웨어 설정 완료")
@@ -1,87 +1,405 @@
 """
 성능 모니터링 서비스
+관측값 수와 무관하게 메모리가 일정한 메트릭(카운터, 게이지, 고정 버킷 히스토그램)과 Prometheus 텍스트 출력
+
+- 기록 경로는 락 없음: 카운터/히스토그램은 스레드마다 자기 샤드에만 쓰고, 조회 시 샤드를 합산
+- 조회 비용은 버킷 수에 비례 (샘플 수와 무관)
+- 메트릭은 워커 프로세스별로 집계되며, 워커 간 합산은 Prometheus 쿼리(sum by)로 처리
 """
+import math
 import time
+import bisect
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
-from datetime import datetime
-from collections import defaultdict
-import statistics
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# 처리 시간 히스토그램 기본 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
-@dataclass
-class PerformanceMetrics:
-    """성능 메트릭 데이터"""
-    operation: str
-    duration: float
-    timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+# 레이블 값 튜플 (레이블이 없으면 빈 튜플)
+LabelValues = Tuple[str, ...]
 
 
-class PerformanceMonitor:
-    """성능 모니터링 시스템"""
-    
+class _Shards:
+    """스레드별 샤드 목록 (샤드 생성 시에만 락 사용)"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.all: List[Any] = []
+
+    def get(self) -> Any:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._factory()
+            with self._lock:
+                self.all.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def reset(self):
+        """모든 샤드를 새로 만듦 (스레드는 다음 기록 시 새 샤드 생성)"""
+        with self._lock:
+            self.all = []
+            self._local = threading.local()
+
+
+class _CounterShard:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+
+class Counter:
+    """단조 증가 카운터"""
+
     def __init__(self):
-        """모니터 초기화"""
-        self.metrics: Dict[str, list] = defaultdict(list)
-        self._max_samples = 1000  # 각 작업당 최대 샘플 수
-    
+        self._shards = _Shards(_CounterShard)
+
+    def inc(self, amount: float = 1.0):
+        self._shards.get().value += amount
+
+    @property
+    def value(self) -> float:
+        return sum(shard.value for shard in list(self._shards.all))
+
+    def reset(self):
+        self._shards.reset()
+
+
+class Gauge:
+    """현재 값 게이지 (set은 단일 대입, inc/dec는 드물게 쓰는 값에만 사용)"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def reset(self):
+        self._value = 0.0
+
+
+class _HistogramShard:
+    __slots__ = ("counts", "sum", "sum_sq", "count", "min", "max")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (관측값 수와 무관하게 메모리 일정)
+
+    버킷 경계는 각 버킷의 상한(이하)이며, 마지막 경계를 넘는 값은 +Inf 버킷에 집계
+    분위수는 버킷 안에서 선형 보간한 근사값 (Prometheus histogram_quantile과 같은 방식)
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = sorted(buckets)
+        size = len(self.buckets) + 1
+        self._shards = _Shards(lambda: _HistogramShard(size))
+
+    def observe(self, value: float):
+        """관측값 추가"""
+        shard = self._shards.get()
+        shard.counts[bisect.bisect_left(self.buckets, value)] += 1
+        shard.sum += value
+        shard.sum_sq += value * value
+        shard.count += 1
+        if value < shard.min:
+            shard.min = value
+        if value > shard.max:
+            shard.max = value
+
+    def reset(self):
+        self._shards.reset()
+
+    def _merged(self) -> _HistogramShard:
+        """스레드별 샤드 합산"""
+        merged = _HistogramShard(len(self.buckets) + 1)
+        for shard in list(self._shards.all):
+            merged.counts = [a + b for a, b in zip(merged.counts, shard.counts)]
+            merged.sum += shard.sum
+            merged.sum_sq += shard.sum_sq
+            merged.count += shard.count
+            merged.min = min(merged.min, shard.min)
+            merged.max = max(merged.max, shard.max)
+        return merged
+
+    def _quantile(self, merged: _HistogramShard, q: float) -> float:
+        if merged.count == 0:
+            return 0.0
+        rank = q * merged.count
+        seen = 0
+        for index, count in enumerate(merged.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]  # +Inf 버킷은 마지막 경계
+                lower = self.buckets[index - 1] if index > 0 else min(0.0, self.buckets[0])
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def quantile(self, q: float) -> float:
+        """근사 분위수 (관측값이 없으면 0, +Inf 버킷이면 마지막 경계)"""
+        return self._quantile(self._merged(), q)
+
+    def cumulative_counts(self) -> Tuple[List[Tuple[str, int]], float, int]:
+        """(le 레이블, 누적 개수) 목록, 합계, 개수"""
+        merged = self._merged()
+        cumulative, running = [], 0
+        for bound, count in zip([*self.buckets, math.inf], merged.counts):
+            running += count
+            cumulative.append(("+Inf" if bound == math.inf else f"{bound:g}", running))
+        return cumulative, merged.sum, merged.count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """누적 버킷 개수, 합계, 평균, 최소/최대, 표준편차, 근사 분위수"""
+        merged = self._merged()
+        cumulative, _, _ = self.cumulative_counts()
+        count = merged.count
+        mean = merged.sum / count if count else 0.0
+        variance = merged.sum_sq / count - mean * mean if count > 1 else 0.0
+        return {
+            "count": count,
+            "sum": merged.sum,
+            "mean": mean,
+            "min": merged.min if count else 0.0,
+            "max": merged.max if count else 0.0,
+            "stdev": math.sqrt(max(variance, 0.0) * count / (count - 1)) if count > 1 else 0.0,
+            "p50": self._quantile(merged, 0.5),
+            "p95": self._quantile(merged, 0.95),
+            "p99": self._quantile(merged, 0.99),
+            "buckets": dict(cumulative),
+        }
+
+
+Metric = Union[Counter, Gauge, Histogram]
+# 조회 시점에 값을 계산하는 함수: 숫자/히스토그램 하나 또는 {레이블 값: 숫자/히스토그램}
+Callback = Callable[[], Union[float, Histogram, Dict[LabelValues, Union[float, Histogram]]]]
+
+
+class MetricFamily:
+    """이름, 설명, 종류, 레이블 이름이 같은 메트릭 묶음 (레이블 값별 자식 메트릭)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str] = (),
+        factory: Optional[Callable[[], Metric]] = None,
+        callback: Optional[Callback] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._callback = callback
+        self._children: Dict[LabelValues, Metric] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Metric:
+        """레이블 값에 해당하는 자식 메트릭 (처음이면 생성)"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames}가 필요합니다")
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def samples(self) -> Dict[LabelValues, Union[float, Metric]]:
+        """레이블 값별 현재 메트릭"""
+        if self._callback is None:
+            return dict(self._children)
+        value = self._callback()
+        return value if isinstance(value, dict) else {(): value}
+
+    def reset(self):
+        with self._lock:
+            self._children.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values)) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 Prometheus 텍스트 출력 (같은 이름으로 다시 등록하면 기존 메트릭 반환)"""
+
+    def __init__(self, namespace: str = "app"):
+        self.namespace = namespace
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, name: str, documentation: str, kind: str, labelnames: Sequence[str], **kwargs) -> MetricFamily:
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            family = self._families.get(full_name)
+            if family is None:
+                family = MetricFamily(full_name, documentation, kind, labelnames, **kwargs)
+                self._families[full_name] = family
+            elif family.kind != kind:
+                raise ValueError(f"{full_name}은 이미 {family.kind}로 등록되어 있습니다")
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(name, documentation, "counter", labelnames, factory=Counter)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(name, documentation, "gauge", labelnames, factory=Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> MetricFamily:
+        return self._register(
+            name, documentation, "histogram", labelnames, factory=lambda: Histogram(buckets)
+        )
+
+    def register_callback(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        callback: Callback,
+        labelnames: Sequence[str] = (),
+    ) -> MetricFamily:
+        """조회 시점에 값을 계산하는 메트릭 등록 (기존 get_stats() 통계 노출용)"""
+        return self._register(name, documentation, kind, labelnames, callback=callback)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            try:
+                samples = family.samples()
+            except Exception as e:
+                logger.warning(f"메트릭 수집 실패: {family.name} - {e}")
+                continue
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for values, metric in samples.items():
+                if isinstance(metric, Histogram):
+                    cumulative, total, count = metric.cumulative_counts()
+                    for le, bucket_count in cumulative:
+                        labels = _format_labels(family.labelnames, values, ("le", le))
+                        lines.append(f"{family.name}_bucket{labels} {bucket_count}")
+                    labels = _format_labels(family.labelnames, values)
+                    lines.append(f"{family.name}_sum{labels} {_format_value(total)}")
+                    lines.append(f"{family.name}_count{labels} {count}")
+                else:
+                    value = metric.value if isinstance(metric, (Counter, Gauge)) else metric
+                    labels = _format_labels(family.labelnames, values)
+                    lines.append(f"{family.name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class PerformanceMonitor:
+    """성능 모니터링 시스템 (작업별 처리 시간 히스토그램)"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, slow_threshold: float = 1.0):
+        """
+        모니터 초기화
+
+        Args:
+            registry: 메트릭을 등록할 레지스트리 (기본값: 전역 레지스트리)
+            slow_threshold: 느린 작업 경고 기준 (초)
+        """
+        self.registry = registry or get_metrics_registry()
+        self.slow_threshold = slow_threshold
+        self._durations = self.registry.histogram(
+            "operation_duration_seconds", "작업별 처리 시간 (초)", labelnames=("operation",)
+        )
+        self._slow = self.registry.counter(
+            "slow_operations_total", "느린 작업 수", labelnames=("operation",)
+        )
+
     def record(self, operation: str, duration: float, metadata: Optional[Dict[str, Any]] = None):
         """성능 메트릭 기록"""
-        metric = PerformanceMetrics(
-            operation=operation,
-            duration=duration,
-            metadata=metadata or {}
-        )
-        
-        self.metrics[operation].append(metric)
-        
-        # 최대 샘플 수 제한
-        if len(self.metrics[operation]) > self._max_samples:
-            self.metrics[operation].pop(0)
-        
+        self._durations.labels(operation).observe(duration)
+
         # 느린 작업 경고
-        if duration > 1.0:
+        if duration > self.slow_threshold:
+            self._slow.labels(operation).inc()
             logger.warning(
                 f"느린 작업 감지: {operation} - {duration:.2f}s",
                 extra={"metadata": metadata}
             )
-    
+
     def get_stats(self, operation: str) -> Optional[Dict[str, Any]]:
         """작업별 통계 조회"""
-        if operation not in self.metrics or not self.metrics[operation]:
+        histogram = self._durations.samples().get((operation,))
+        if histogram is None:
             return None
-        
-        durations = [m.duration for m in self.metrics[operation]]
-        
-        return {
-            "operation": operation,
-            "count": len(durations),
-            "mean": statistics.mean(durations),
-            "median": statistics.median(durations),
-            "min": min(durations),
-            "max": max(durations),
-            "stdev": statistics.stdev(durations) if len(durations) > 1 else 0,
-        }
-    
+        snapshot = histogram.snapshot()
+        if snapshot["count"] == 0:
+            return None
+        return {"operation": operation, "median": snapshot["p50"], **snapshot}
+
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """모든 작업의 통계 조회"""
-        return {
-            operation: self.get_stats(operation)
-            for operation in self.metrics
-            if self.get_stats(operation)
-        }
-    
+        stats = {}
+        for (operation,) in self._durations.samples():
+            operation_stats = self.get_stats(operation)
+            if operation_stats:
+                stats[operation] = operation_stats
+        return stats
+
     def reset(self, operation: Optional[str] = None):
         """메트릭 초기화"""
         if operation:
-            self.metrics[operation] = []
+            histogram = self._durations.samples().get((operation,))
+            if histogram is not None:
+                histogram.reset()
         else:
-            self.metrics.clear()
-    
+            self._durations.reset()
+            self._slow.reset()
+
     def timer(self, operation: str, metadata: Optional[Dict[str, Any]] = None):
         """컨텍스트 매니저로 작업 시간 측정"""
         return _PerformanceTimer(self, operation, metadata)
@@ -89,26 +407,35 @@ class PerformanceMonitor:
 
 class _PerformanceTimer:
     """성능 측정 컨텍스트 매니저"""
-    
+
     def __init__(self, monitor: PerformanceMonitor, operation: str, metadata: Optional[Dict[str, Any]]):
         self.monitor = monitor
         self.operation = operation
         self.metadata = metadata
         self.start_time = None
-    
+
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         self.monitor.record(self.operation, duration, self.metadata)
 
 
-# 전역 모니터 인스턴스
+# 전역 레지스트리 및 모니터 인스턴스
+_metrics_registry: Optional[MetricsRegistry] = None
 _performance_monitor: Optional[PerformanceMonitor] = None
 
 
+def get_metrics_registry() -> MetricsRegistry:
+    """메트릭 레지스트리 싱글톤 인스턴스 반환"""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
 def get_performance_monitor() -> PerformanceMonitor:
     """성능 모니터 싱글톤 인스턴스 반환"""
     global _performance_monitor
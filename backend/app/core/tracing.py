@@ -0,0 +1,99 @@
+"""
+요청 단위 처리 시간 추적
+채팅 요청 하나의 단계별(분류, 임베딩, 캐시, 키워드/벡터 검색, 프롬프트, LLM) 소요 시간을 모아
+성능 모니터, 질문 로그, Server-Timing 헤더로 전달
+
+- 현재 요청의 추적은 contextvars로 전달되므로 함수 인자를 바꾸지 않고 어느 계층에서든 span() 사용
+- asyncio 태스크는 생성 시 컨텍스트를 복사하므로 동시 분기(키워드/벡터 검색)도 같은 추적에 기록
+- 같은 단계가 여러 번(동시 분기 포함) 실행되면 시간을 합산하므로 단계 합계가 전체 시간보다 클 수 있음
+"""
+import re
+import time
+import uuid
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+from app.core.monitoring import get_performance_monitor
+
+logger = logging.getLogger(__name__)
+
+# 요청 ID 헤더 (클라이언트/프록시가 보낸 값을 그대로 사용, 없으면 생성)
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# 받아들이는 요청 ID 형식 (헤더/로그 주입 방지)
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestTrace:
+    """요청 하나의 단계별 누적 소요 시간 (ms)"""
+
+    def __init__(self, request_id: Optional[str] = None):
+        self.request_id = request_id or uuid.uuid4().hex
+        self.spans: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    def add(self, name: str, duration_ms: float):
+        """단계 소요 시간 추가 (같은 단계는 합산)"""
+        self.spans[name] = self.spans.get(name, 0.0) + duration_ms
+
+    def elapsed_ms(self) -> float:
+        """추적 시작 후 경과 시간 (ms)"""
+        return (time.perf_counter() - self._started) * 1000
+
+    def timings(self) -> Dict[str, float]:
+        """단계별 소요 시간과 전체 시간 (ms, 소수점 둘째 자리)"""
+        return {
+            **{name: round(duration, 2) for name, duration in self.spans.items()},
+            "total": round(self.elapsed_ms(), 2),
+        }
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: classify;dur=0.4, llm;dur=812.3, total;dur=840.1)"""
+        return ", ".join(f"{name};dur={duration:.1f}" for name, duration in self.timings().items())
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+def resolve_request_id(value: Optional[str]) -> str:
+    """요청 헤더의 ID가 올바른 형식이면 사용하고, 아니면 새로 생성"""
+    if value and _REQUEST_ID_PATTERN.match(value):
+        return value
+    return uuid.uuid4().hex
+
+
+def start_trace(request_id: Optional[str] = None) -> RequestTrace:
+    """현재 컨텍스트(요청)의 추적 시작"""
+    trace = RequestTrace(request_id)
+    _current_trace.set(trace)
+    return trace
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """현재 요청의 추적 (추적 중이 아니면 None)"""
+    return _current_trace.get()
+
+
+def record_span(name: str, duration: float):
+    """
+    단계 소요 시간 기록
+
+    Args:
+        name: 단계 이름 (성능 모니터의 operation 레이블, Server-Timing 항목 이름)
+        duration: 소요 시간 (초)
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, duration * 1000)
+    get_performance_monitor().record(name, duration)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """블록 실행 시간을 단계 소요 시간으로 기록 (예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, time.perf_counter() - started)
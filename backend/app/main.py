@@ -2,13 +2,16 @@
 FastAPI 메인 애플리케이션 (성능 최적화)
 """
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1 import api_router
 from app.core.middleware import setup_middlewares
 from app.core.rate_limiter import setup_rate_limiter
 from app.core.logging_config import setup_logging
-from app.core.monitoring import get_performance_monitor
+from app.core.monitoring import get_metrics_registry, get_performance_monitor
+from app.core.tracing import REQUEST_ID_HEADER
+from app.services.warmup import get_warmup_state, retry_failed_warmup, start_warmup, stop_warmup
 import logging
 
 # 로깅 설정
@@ -28,6 +31,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[REQUEST_ID_HEADER],
 )
 
 # 성능 최적화 미들웨어 설정
@@ -50,6 +54,7 @@ async def root():
 
 
 @app.get("/health")
+@limiter.exempt  # 로드 밸런서 상태 확인은 레이트 리미팅 제외
 async def health_check():
     """헬스 체크 엔드포인트"""
     from app.core.cache import get_cache_service
@@ -63,15 +68,118 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+@limiter.exempt
+async def readiness_check():
+    """준비 상태 확인 엔드포인트 (워밍업 완료 전이나 필수 단계 실패 시 503, 실패 시 쿨다운 후 재시작)"""
+    state = get_warmup_state()
+    retry_failed_warmup()
+    return JSONResponse(status_code=200 if state.ready else 503, content=state.snapshot())
+
+
+# Prometheus 텍스트 형식 Content-Type
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _register_metric_callbacks():
+    """기존 서비스 통계를 조회 시점에 읽어 Prometheus 메트릭으로 노출 (서비스 모듈은 조회 시 import)"""
+    def cache_stats():
+        from app.core.cache import get_cache_service
+        return get_cache_service().get_stats()
+    
+    def answer_cache_stats():
+        from app.services.answer_cache import get_answer_cache
+        return get_answer_cache().get_stats()
+    
+    def question_log_stats():
+        from app.services.question_log_sink import get_question_log_sink
+        return get_question_log_sink().get_stats()
+    
+    def batcher():
+        from app.services.ai.embeddings import get_embedding_service
+        return get_embedding_service().get_batcher()
+    
+    def cache_requests():
+        return {
+            (prefix, level, result): stats[f"{level}_{result}"]
+            for prefix, stats in cache_stats()["prefixes"].items()
+            for level in ("l1", "l2") for result in ("hits", "misses")
+        }
+    
+    registry = get_metrics_registry()
+    registry.register_callback(
+        "cache_requests_total", "캐시 조회 수", "counter", cache_requests,
+        labelnames=("prefix", "level", "result"),
+    )
+    registry.register_callback(
+        "answer_cache_events_total", "답변 캐시 이벤트 수", "counter",
+        lambda: {(name,): value for name, value in answer_cache_stats().items()
+                 if name not in ("size", "hit_rate")},
+        labelnames=("event",),
+    )
+    registry.register_callback(
+        "answer_cache_entries", "답변 캐시 항목 수", "gauge",
+        lambda: answer_cache_stats()["size"],
+    )
+    registry.register_callback(
+        "question_log_events_total", "질문 로그 저장 이벤트 수", "counter",
+        lambda: {(name,): value for name, value in question_log_stats().items()
+                 if name != "queue_size"},
+        labelnames=("event",),
+    )
+    registry.register_callback(
+        "question_log_queue_size", "저장 대기 중인 질문 로그 수", "gauge",
+        lambda: question_log_stats()["queue_size"],
+    )
+    registry.register_callback(
+        "embedding_batch_size", "임베딩 마이크로배치 크기", "histogram",
+        lambda: batcher().batch_sizes,
+    )
+    registry.register_callback(
+        "embedding_queue_wait_ms", "임베딩 요청 대기 시간 (ms)", "histogram",
+        lambda: batcher().queue_wait_ms,
+    )
+    registry.register_callback(
+        "embedding_latency_ms", "임베딩 요청 전체 지연시간 (ms)", "histogram",
+        lambda: batcher().latency_ms,
+    )
+    registry.register_callback(
+        "ready", "워밍업 완료 여부", "gauge", lambda: float(get_warmup_state().ready),
+    )
+
+
+_register_metric_callbacks()
+
+
 @app.get("/metrics")
-async def metrics():
-    """성능 메트릭 조회"""
+@limiter.exempt  # 주기적 스크레이프는 레이트 리미팅 제외
+async def metrics(request: Request, format: str = "json"):
+    """
+    성능 메트릭 조회
+    
+    Accept 헤더가 text/plain 또는 OpenMetrics이거나 ?format=prometheus이면 Prometheus 텍스트 형식,
+    그 외에는 JSON
+    """
+    accept = request.headers.get("accept", "")
+    if format == "prometheus" or "text/plain" in accept or "openmetrics" in accept:
+        return PlainTextResponse(get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE)
+    
+    from app.core.cache import get_cache_service
+    from app.services.answer_cache import get_answer_cache
+    from app.services.ai.embeddings import get_embedding_service
+    from app.services.question_log_sink import get_question_log_sink
+    
     monitor = get_performance_monitor()
     stats = monitor.get_all_stats()
     
     return {
         "status": "ok",
         "metrics": stats,
+        "cache": get_cache_service().get_stats(),
+        "answer_cache": get_answer_cache().get_stats(),
+        "question_log": get_question_log_sink().get_stats(),
+        "embedding_batcher": get_embedding_service().get_batcher().get_stats(),
+        "startup": get_warmup_state().snapshot(),
     }
 
 
@@ -81,9 +189,24 @@ async def startup_event():
     logger.info(f"{settings.APP_NAME} v{settings.APP_VERSION} 시작")
     logger.info(f"디버그 모드: {settings.DEBUG}")
     logger.info(f"Redis 캐싱: {'활성화' if settings.REDIS_ENABLED else '비활성화'}")
+    
+    # 질문 로그 백그라운드 저장 스레드 시작
+    from app.services.question_log_sink import get_question_log_sink
+    get_question_log_sink()
+    
+    # 모델/인덱스/연결 풀 워밍업 (백그라운드, 완료되면 /ready 200)
+    start_warmup()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    from app.services.ai.client import close_gemini_client
+    from app.services.ai.embeddings import get_embedding_service
+    from app.services.question_log_sink import shutdown_question_log_sink
+    
+    await stop_warmup()
+    await close_gemini_client()
+    await get_embedding_service().get_batcher().close()
+    shutdown_question_log_sink()
     logger.info(f"{settings.APP_NAME} 종료")
@@ -7,6 +7,7 @@ from app.models.support_program import SupportProgram, ProgramType
 from app.models.academic_term import AcademicTerm
 from app.models.question_log import QuestionLog, QuestionCategory, QuestionStatus, FeedbackType
 from app.models.academic_glossary import AcademicGlossary
+from app.models.table_version import TableVersion
 
 __all__ = [
     "AcademicSchedule",
@@ -23,4 +24,5 @@ __all__ = [
     "QuestionStatus",
     "FeedbackType",
     "AcademicGlossary",
+    "TableVersion",
 ]
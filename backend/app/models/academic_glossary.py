@@ -2,8 +2,8 @@
 학사 용어 사전 모델
 """
 from sqlalchemy import Column, Integer, String, Text, Date
-from pgvector.sqlalchemy import Vector
 from app.core.database import Base
+from app.models.types import EmbeddingVector
 
 
 class AcademicGlossary(Base):
@@ -16,6 +16,8 @@ class AcademicGlossary(Base):
     definition = Column(Text, nullable=False, comment="정의 및 설명")
     examples = Column(Text, nullable=True, comment="예시")
     category = Column(String(100), nullable=True, comment="카테고리")
-    embedding = Column(Vector(384), nullable=True, comment="벡터 임베딩 (384차원)")
+    embedding = Column(EmbeddingVector(384), nullable=True, comment="벡터 임베딩 (384차원)")
+    embedding_hash = Column(String(64), nullable=True, comment="임베딩 생성 당시 텍스트 해시 (SHA-256)")
+    embedding_model = Column(String(200), nullable=True, comment="임베딩 생성 모델")
     created_at = Column(Date, nullable=False, comment="생성일")
     updated_at = Column(Date, nullable=True, comment="수정일")
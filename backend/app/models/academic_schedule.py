@@ -3,9 +3,9 @@
 """
 from sqlalchemy import Column, Integer, String, Date, Text, Enum
 from sqlalchemy.types import Enum as SQLEnum
-from pgvector.sqlalchemy import Vector
 import enum
 from app.core.database import Base
+from app.models.types import EmbeddingVector
 
 
 class SemesterType(str, enum.Enum):
@@ -38,6 +38,8 @@ class AcademicSchedule(Base):
     schedule_type = Column(SQLEnum(ScheduleType), nullable=False, comment="일정 유형")
     description = Column(Text, nullable=True, comment="설명")
     importance = Column(Integer, default=0, comment="중요도 (0-10)")
-    embedding = Column(Vector(384), nullable=True, comment="벡터 임베딩 (384차원)")
+    embedding = Column(EmbeddingVector(384), nullable=True, comment="벡터 임베딩 (384차원)")
+    embedding_hash = Column(String(64), nullable=True, comment="임베딩 생성 당시 텍스트 해시 (SHA-256)")
+    embedding_model = Column(String(200), nullable=True, comment="임베딩 생성 모델")
     created_at = Column(Date, nullable=False, comment="생성일")
     updated_at = Column(Date, nullable=True, comment="수정일")
@@ -3,9 +3,9 @@
 """
 from sqlalchemy import Column, Integer, String, Text, Date, Enum
 from sqlalchemy.types import Enum as SQLEnum
-from pgvector.sqlalchemy import Vector
 import enum
 from app.core.database import Base
+from app.models.types import EmbeddingVector
 
 
 class NoticeType(str, enum.Enum):
@@ -34,7 +34,9 @@ class Notice(Base):
     notice_type = Column(SQLEnum(NoticeType), nullable=False, comment="공지 유형")
     importance = Column(SQLEnum(ImportanceLevel), default=ImportanceLevel.MEDIUM, comment="중요도")
     department = Column(String(100), nullable=True, comment="부서 또는 학과")
-    embedding = Column(Vector(384), nullable=True, comment="벡터 임베딩 (384차원)")
+    embedding = Column(EmbeddingVector(384), nullable=True, comment="벡터 임베딩 (384차원)")
+    embedding_hash = Column(String(64), nullable=True, comment="임베딩 생성 당시 텍스트 해시 (SHA-256)")
+    embedding_model = Column(String(200), nullable=True, comment="임베딩 생성 모델")
     created_at = Column(Date, nullable=False, comment="작성일")
     updated_at = Column(Date, nullable=True, comment="수정일")
     is_active = Column(Integer, default=1, comment="활성화 여부 (1: 활성, 0: 비활성)")
@@ -1,7 +1,7 @@
 """
 질문 로그 모델
 """
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, JSON
 from sqlalchemy.types import Enum as SQLEnum
 import enum
 from app.core.database import Base
@@ -42,5 +42,7 @@ class QuestionLog(Base):
     source = Column(String(500), nullable=True, comment="출처")
     feedback = Column(SQLEnum(FeedbackType), nullable=True, comment="피드백")
     feedback_comment = Column(Text, nullable=True, comment="피드백 코멘트")
+    request_id = Column(String(64), nullable=True, index=True, comment="요청 ID (X-Request-ID)")
+    timings = Column(JSON, nullable=True, comment="단계별 처리 시간 (ms)")
     created_at = Column(DateTime, nullable=False, comment="생성일시")
     updated_at = Column(DateTime, nullable=True, comment="수정일시")
@@ -0,0 +1,98 @@
+"""
+문서 테이블 버전 모델
+문서 테이블에 쓰기가 있으면 같은 트랜잭션에서 버전을 올려
+상주 인덱스/ETag가 행 수나 수정일로 드러나지 않는 변경(같은 날 수정, 활성 상태 변경,
+임베딩 재생성 등)도 감지할 수 있게 함
+
+- ORM flush(insert/update/delete)와 ORM 일괄 update/delete/insert 문 모두 대상
+- 세션 이벤트로 처리하므로 API, 데이터 입력/임베딩 생성 스크립트 등 모든 프로세스에 적용
+- 변경된 테이블은 세션에 모아 두고 커밋 직전에 테이블당 한 번만 증가 (flush/일괄 문마다 올리지 않음)
+
+직렬화 비용: 버전 행은 테이블당 하나를 모든 쓰기 트랜잭션이 공유하므로, 같은 문서 테이블에
+쓰는 트랜잭션은 버전 upsert부터 커밋까지 행 잠금을 기다림. 커밋 직전에 올리므로 잠금 구간은
+커밋 자체로 짧고, 문서 테이블 쓰기는 관리 작업(데이터 입력/임베딩 스크립트)이라 빈도가 낮음
+"""
+from typing import Iterable, Set
+from sqlalchemy import Column, Integer, String, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import ORMExecuteState, Session
+from app.core.database import Base
+
+# 버전을 관리하는 문서 테이블
+VERSIONED_TABLES = frozenset({
+    "academic_schedules",
+    "notices",
+    "support_programs",
+    "academic_glossary",
+})
+
+# 커밋 시 버전을 올릴 테이블을 모아 두는 Session.info 키
+_CHANGED_TABLES_KEY = "changed_versioned_tables"
+
+# 버전 upsert를 지원하는 방언별 insert
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class TableVersion(Base):
+    """문서 테이블 버전 모델"""
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(100), primary_key=True, comment="테이블 이름")
+    version = Column(Integer, nullable=False, default=0, comment="쓰기마다 1씩 증가하는 버전")
+
+
+def bump_table_versions(connection: Connection, table_names: Iterable[str]):
+    """테이블 버전 증가 (행이 없으면 버전 1로 생성, INSERT … ON CONFLICT DO UPDATE 한 문장)"""
+    names = sorted(table_names)  # 여러 테이블 잠금 순서를 고정해 교착 방지
+    if not names:
+        return
+    versions = TableVersion.__table__
+    statement = _UPSERT_INSERTS[connection.dialect.name](versions).values(
+        [{"table_name": name, "version": 1} for name in names]
+    )
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[versions.c.table_name],
+        set_={"version": versions.c.version + 1},
+    ))
+
+
+def _table_name(obj) -> str:
+    return getattr(type(obj), "__tablename__", "")
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault(_CHANGED_TABLES_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_after_flush(session: Session, flush_context):
+    """flush된 문서 행의 테이블 기록"""
+    changed: Set[str] = {_table_name(obj) for obj in session.new}
+    changed.update(_table_name(obj) for obj in session.deleted)
+    changed.update(_table_name(obj) for obj in session.dirty if session.is_modified(obj))
+    _changed_tables(session).update(changed & VERSIONED_TABLES)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statement(state: ORMExecuteState):
+    """ORM 일괄 update/delete/insert 문(session.execute(update(Model)) 등)의 테이블 기록"""
+    if not (state.is_update or state.is_delete or state.is_insert):
+        return
+    changed = {mapper.local_table.name for mapper in state.all_mappers} & VERSIONED_TABLES
+    _changed_tables(state.session).update(changed)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session: Session):
+    """커밋 직전에 남은 변경을 flush하고 트랜잭션에서 바뀐 테이블 버전을 한 번씩 증가"""
+    session.flush()
+    changed = session.info.pop(_CHANGED_TABLES_KEY, None)
+    if changed:
+        bump_table_versions(session.connection(), changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session):
+    """롤백된 트랜잭션의 변경 기록 폐기"""
+    session.info.pop(_CHANGED_TABLES_KEY, None)
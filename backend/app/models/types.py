@@ -0,0 +1,47 @@
+"""
+공용 컬럼 타입
+"""
+from typing import Optional
+from sqlalchemy.types import LargeBinary, TypeDecorator
+from app.core.config import settings
+from app.utils.embedding_codec import encode_embedding, to_vector
+
+
+class EmbeddingVector(TypeDecorator):
+    """
+    임베딩 컬럼 타입
+    PostgreSQL은 pgvector VECTOR, 그 외(SQLite)는 바이너리 BLOB (embedding_codec 형식)
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, dim: int, storage_dtype: Optional[str] = None):
+        """
+        Args:
+            dim: 벡터 차원
+            storage_dtype: BLOB 저장 형식 (기본값: settings.EMBEDDING_STORAGE_DTYPE)
+        """
+        super().__init__()
+        self.dim = dim
+        self.storage_dtype = storage_dtype
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            from pgvector.sqlalchemy import Vector  # PostgreSQL에서만 필요하므로 지연 import
+            return dialect.type_descriptor(Vector(self.dim))
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+        return encode_embedding(
+            to_vector(value), self.storage_dtype or settings.EMBEDDING_STORAGE_DTYPE
+        )
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        # 바이너리 행은 복사 없이, 변환 전 JSON 텍스트 행은 파싱해서 반환
+        return to_vector(value)
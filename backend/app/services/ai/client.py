@@ -1,32 +1,85 @@
 """
 Google Gemini API 클라이언트
 """
-import google.generativeai as genai
+import asyncio
+import json
+import time
+import httpx
 from app.core.config import settings
-from typing import List, Dict, Optional
+from app.core.tracing import record_span, span
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class GeminiAPIError(Exception):
+    """Gemini API 호출 실패 (HTTP 오류, 시간 초과, 빈 응답)"""
+
+
 class GeminiClient:
-    """Gemini API 클라이언트 클래스"""
+    """
+    Gemini API 비동기 클라이언트 클래스
+    
+    REST API를 httpx.AsyncClient로 호출하므로 응답을 기다리는 동안 이벤트 루프를 막지 않음
+    - 연결 재사용: 이벤트 루프당 하나의 AsyncClient (keep-alive 커넥션 풀)
+    - 동시성 제한: 세마포어로 워커당 동시 호출 수 제한 (GEMINI_MAX_CONCURRENCY)
+    - 세마포어와 AsyncClient는 생성한 이벤트 루프에 묶이므로 실행 중인 루프별로 지연 생성
+      (테스트, 스크립트의 asyncio.run 등 다른 루프에서 싱글톤을 재사용해도 안전)
+    - 시간 제한: 대기 시간을 포함한 호출당 제한 시간 (GEMINI_TIMEOUT)
+    """
     
     def __init__(self):
         """Gemini 클라이언트 초기화"""
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model_name = "gemini-2.0-flash-exp"  # 최신 Gemini 2.0 Flash 모델
-        self.model = genai.GenerativeModel(
-            model_name=self.model_name,
-            generation_config={
-                "temperature": 0.7,  # 답변 다양성 확보
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 2048,
-            }
-        )
+        self.model_name = settings.GEMINI_MODEL
+        self.generation_config = {
+            "temperature": 0.7,  # 답변 다양성 확보
+            "topP": 0.95,
+            "topK": 40,
+            "maxOutputTokens": 2048,
+        }
+        self.timeout = settings.GEMINI_TIMEOUT
+        self.max_concurrency = settings.GEMINI_MAX_CONCURRENCY
+        self._transport: Optional[httpx.AsyncBaseTransport] = None  # 테스트용 전송 계층 교체
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._http: Optional[httpx.AsyncClient] = None
         logger.info("✓ Gemini 클라이언트 초기화 완료")
     
+    def _resources(self) -> Tuple[asyncio.Semaphore, httpx.AsyncClient]:
+        """현재 이벤트 루프의 동시성 세마포어와 HTTP 클라이언트 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이전 루프의 클라이언트는 그 루프에서만 닫을 수 있으므로 참조만 버림
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._http = None
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=settings.GEMINI_API_BASE_URL.rstrip("/"),
+                headers={"x-goog-api-key": settings.GEMINI_API_KEY},
+                timeout=httpx.Timeout(self.timeout, connect=settings.GEMINI_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                transport=self._transport,
+            )
+        return self._semaphore, self._http
+    
+    def warm(self):
+        """현재 이벤트 루프의 HTTP 커넥션 풀 미리 생성 (시작 시 워밍업, 루프 안에서 호출)"""
+        self._resources()
+    
+    async def aclose(self):
+        """현재 이벤트 루프의 HTTP 커넥션 풀 종료"""
+        http = self._http
+        if http is not None and self._loop is asyncio.get_running_loop():
+            await http.aclose()
+        self._loop = None
+        self._semaphore = None
+        self._http = None
+    
     async def generate_response(
         self,
         user_message: str,
@@ -45,41 +98,154 @@ class GeminiClient:
             
         Returns:
             생성된 응답
+            
+        Raises:
+            GeminiAPIError: API 오류, 시간 초과 또는 빈 응답
         """
+        prompt = self._build_prompt(user_message, system_prompt, context)
+        
         try:
-            # 컨텍스트가 있으면 메시지에 포함
-            if context:
-                context_text = self._format_context(context)
-                full_message = f"{context_text}\n\n질문: {user_message}"
-            else:
-                full_message = user_message
+            # 세마포어 대기 시간까지 포함해 호출당 제한 시간 적용
+            with span("llm"):
+                data = await asyncio.wait_for(
+                    self._post("generateContent", self._request_body(prompt, max_tokens)),
+                    timeout=self.timeout,
+                )
+        except asyncio.TimeoutError:
+            logger.error(f"Gemini API 응답 시간 초과 ({self.timeout}s)")
+            raise GeminiAPIError(f"Gemini API 응답 시간 초과 ({self.timeout}s)")
+        except GeminiAPIError as e:
+            logger.error(f"Gemini API 호출 중 오류: {e}")
+            raise
+        
+        answer = self._extract_text(data)
+        if not answer:
+            raise GeminiAPIError("Gemini API가 유효한 응답을 생성하지 못했습니다.")
+        
+        logger.info("Gemini API 호출 성공")
+        return answer
+    
+    async def stream_response(
+        self,
+        user_message: str,
+        system_prompt: str,
+        context: Optional[List[Dict[str, str]]] = None,
+        max_tokens: int = 2000,
+    ) -> AsyncIterator[str]:
+        """
+        Gemini API를 사용하여 응답을 스트리밍으로 생성 (streamGenerateContent, SSE)
+        
+        동시성 슬롯 대기와 청크 간 대기 각각에 GEMINI_TIMEOUT 적용
+        첫 조각까지의 시간(llm_first_token)과 전체 시간(llm)을 기록하며,
+        전체 시간에는 호출자가 조각을 소비(클라이언트 전송)하는 시간도 포함
+        
+        Args:
+            user_message: 사용자 메시지
+            system_prompt: 시스템 프롬프트
+            context: 검색된 컨텍스트 (선택)
+            max_tokens: 최대 토큰 수
             
-            # 시스템 프롬프트와 사용자 메시지를 결합
-            # Gemini는 시스템 프롬프트를 별도로 받지 않으므로 메시지 앞에 추가
-            combined_prompt = f"{system_prompt}\n\n{full_message}"
+        Yields:
+            모델이 생성한 텍스트 조각
             
-            # Gemini API 호출
-            response = self.model.generate_content(
-                combined_prompt,
-                generation_config=genai.GenerationConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=0.7,
+        Raises:
+            GeminiAPIError: API 오류 또는 시간 초과
+        """
+        prompt = self._build_prompt(user_message, system_prompt, context)
+        started = time.perf_counter()
+        first_token = True
+        semaphore, http = self._resources()
+        
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise GeminiAPIError(f"Gemini API 응답 시간 초과 ({self.timeout}s)")
+        
+        try:
+            async with http.stream(
+                "POST",
+                f"/models/{self.model_name}:streamGenerateContent",
+                params={"alt": "sse"},
+                json=self._request_body(prompt, max_tokens),
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    raise GeminiAPIError(
+                        f"Gemini API 오류 (HTTP {response.status_code}): {response.text[:200]}"
+                    )
+                async for line in response.aiter_lines():
+                    text = self._parse_sse_line(line)
+                    if text:
+                        if first_token:
+                            record_span("llm_first_token", time.perf_counter() - started)
+                            first_token = False
+                        yield text
+        except httpx.TimeoutException as e:
+            logger.error(f"Gemini API 스트리밍 시간 초과 ({self.timeout}s)")
+            raise GeminiAPIError(f"Gemini API 응답 시간 초과 ({self.timeout}s)") from e
+        except httpx.HTTPError as e:
+            logger.error(f"Gemini API 스트리밍 중 오류: {e!r}")
+            raise GeminiAPIError(f"Gemini API 요청 실패: {e!r}") from e
+        finally:
+            semaphore.release()
+            record_span("llm", time.perf_counter() - started)
+    
+    async def _post(self, method: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """동시성 제한 안에서 모델 메서드 호출"""
+        semaphore, http = self._resources()
+        async with semaphore:
+            try:
+                response = await http.post(
+                    f"/models/{self.model_name}:{method}", json=body
                 )
+            except httpx.HTTPError as e:
+                raise GeminiAPIError(f"Gemini API 요청 실패: {e!r}") from e
+        
+        if response.status_code >= 400:
+            raise GeminiAPIError(
+                f"Gemini API 오류 (HTTP {response.status_code}): {response.text[:200]}"
             )
-            
-            # 응답 추출
-            if response.candidates and len(response.candidates) > 0:
-                answer = response.candidates[0].content.parts[0].text
-            else:
-                raise Exception("Gemini API가 유효한 응답을 생성하지 못했습니다.")
-            
-            logger.info(f"Gemini API 호출 성공")
-            
-            return answer
-            
-        except Exception as e:
-            logger.error(f"Gemini API 호출 중 오류: {e}")
-            raise
+        return response.json()
+    
+    def _build_prompt(
+        self,
+        user_message: str,
+        system_prompt: str,
+        context: Optional[List[Dict[str, str]]],
+    ) -> str:
+        """시스템 프롬프트, 컨텍스트, 사용자 메시지를 하나의 프롬프트로 결합"""
+        # 컨텍스트가 있으면 메시지에 포함
+        if context:
+            context_text = self._format_context(context)
+            full_message = f"{context_text}\n\n질문: {user_message}"
+        else:
+            full_message = user_message
+        
+        # Gemini는 시스템 프롬프트를 별도로 받지 않으므로 메시지 앞에 추가
+        return f"{system_prompt}\n\n{full_message}"
+    
+    def _request_body(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """generateContent 요청 본문"""
+        return {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {**self.generation_config, "maxOutputTokens": max_tokens},
+        }
+    
+    @classmethod
+    def _parse_sse_line(cls, line: str) -> str:
+        """SSE 한 줄에서 텍스트 조각 추출 (data: 줄이 아니면 빈 문자열)"""
+        if not line.startswith("data:"):
+            return ""
+        return cls._extract_text(json.loads(line[5:]))
+    
+    @staticmethod
+    def _extract_text(data: Dict[str, Any]) -> str:
+        """응답에서 첫 번째 후보의 텍스트 추출"""
+        candidates = data.get("candidates") or []
+        if not candidates:
+            return ""
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts)
     
     def _format_context(self, context: List[Dict[str, str]]) -> str:
         """
@@ -117,7 +283,7 @@ class GeminiClient:
 
 
 # 싱글톤 인스턴스
-_gemini_client = None
+_gemini_client: Optional[GeminiClient] = None
 
 
 def get_gemini_client() -> GeminiClient:
@@ -126,3 +292,9 @@ def get_gemini_client() -> GeminiClient:
     if _gemini_client is None:
         _gemini_client = GeminiClient()
     return _gemini_client
+
+
+async def close_gemini_client():
+    """Gemini 클라이언트 커넥션 풀 종료 (애플리케이션 종료 시)"""
+    if _gemini_client is not None:
+        await _gemini_client.aclose()
@@ -0,0 +1,175 @@
+"""
+임베딩 추론 백엔드
+EmbeddingService가 사용하는 모델 실행 방식 (SentenceTransformer.encode와 같은 호출 형식)
+
+- torch: sentence-transformers (PyTorch) 모델 그대로 사용
+- onnx: scripts/export_onnx.py로 변환한 ONNX 모델을 ONNX Runtime으로 실행
+  (torch를 import하지 않아 워커별 메모리가 작고, int8 동적 양자화 모델 선택 가능)
+"""
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional, Union
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# export_onnx.py가 출력 디렉터리에 쓰는 파일
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_QUANTIZED_MODEL_FILE = "model.int8.onnx"
+ONNX_TOKENIZER_FILE = "tokenizer.json"
+ONNX_CONFIG_FILE = "embedding_config.json"
+
+
+class EmbeddingBackend(ABC):
+    """추론 백엔드 공통 인터페이스 (하위 클래스는 dimension과 _encode_batch()를 구현)"""
+
+    name = ""
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """
+        텍스트 인코딩 (문자열 하나면 1차원, 리스트면 2차원 float32 배열)
+
+        Args:
+            sentences: 텍스트 또는 텍스트 리스트
+            batch_size: 한 번에 추론하는 텍스트 수
+            convert_to_numpy: SentenceTransformer 호환용 (항상 numpy 배열 반환)
+            show_progress_bar: SentenceTransformer 호환용
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        embeddings = np.concatenate([
+            self._encode_batch(texts[start:start + batch_size])
+            for start in range(0, len(texts), batch_size)
+        ])
+        return embeddings[0] if single else embeddings
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """임베딩 차원"""
+
+    @abstractmethod
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """텍스트 배치 하나를 (N, dimension) float32 배열로 인코딩"""
+
+
+class TorchBackend(EmbeddingBackend):
+    """sentence-transformers (PyTorch) 백엔드"""
+
+    name = "torch"
+
+    def __init__(self, model_name: str, threads: Optional[int] = None):
+        import torch
+        from sentence_transformers import SentenceTransformer
+        if threads:
+            torch.set_num_threads(threads)
+        self.model = SentenceTransformer(model_name)
+
+    @property
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, show_progress_bar=False):
+        return self.model.encode(
+            sentences, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=show_progress_bar
+        ).astype(np.float32, copy=False)
+
+
+def mean_pooling(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """패딩을 제외한 토큰 임베딩 평균 (sentence-transformers Pooling(mean)과 동일)"""
+    mask = attention_mask[..., np.newaxis].astype(np.float32)
+    summed = (token_embeddings * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return summed / counts
+
+
+class OnnxBackend(EmbeddingBackend):
+    """
+    ONNX Runtime 백엔드
+
+    export_onnx.py 출력 디렉터리(ONNX 모델, tokenizer.json, embedding_config.json)를 읽어
+    토큰화 → 트랜스포머 추론 → 평균 풀링(→ 필요 시 정규화)을 직접 수행
+    """
+
+    name = "onnx"
+
+    def __init__(self, model_dir: Union[str, Path], quantized: bool = True, threads: Optional[int] = None):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_dir = Path(model_dir)
+        model_path = model_dir / (ONNX_QUANTIZED_MODEL_FILE if quantized else ONNX_MODEL_FILE)
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"ONNX 임베딩 모델이 없습니다: {model_path} (scripts/export_onnx.py로 변환 필요)"
+            )
+        self.config = json.loads((model_dir / ONNX_CONFIG_FILE).read_text(encoding="utf-8"))
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / ONNX_TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(max_length=self.config["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(str(model_path), options, providers=["CPUExecutionProvider"])
+        self._input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.model_path = model_path
+
+    @property
+    def dimension(self) -> int:
+        return self.config["dimension"]
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        inputs = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        token_embeddings = self.session.run(
+            None, {name: value for name, value in inputs.items() if name in self._input_names}
+        )[0]
+        embeddings = mean_pooling(token_embeddings, attention_mask)
+        if self.config.get("normalize"):
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings.astype(np.float32, copy=False)
+
+
+def load_backend(
+    backend: str,
+    model_name: str,
+    onnx_dir: Optional[Union[str, Path]] = None,
+    quantized: bool = True,
+    threads: Optional[int] = None,
+) -> EmbeddingBackend:
+    """
+    설정에 맞는 추론 백엔드 생성
+
+    Args:
+        backend: "torch" 또는 "onnx"
+        model_name: sentence-transformers 모델명 (torch)
+        onnx_dir: export_onnx.py 출력 디렉터리 (onnx)
+        quantized: int8 동적 양자화 모델 사용 여부 (onnx)
+        threads: 추론 스레드 수 (None/0이면 런타임 기본값)
+    """
+    if backend == "torch":
+        return TorchBackend(model_name, threads=threads)
+    if backend == "onnx":
+        if onnx_dir is None:
+            raise ValueError("onnx 백엔드는 모델 디렉터리(EMBEDDING_ONNX_DIR)가 필요합니다")
+        return OnnxBackend(onnx_dir, quantized=quantized, threads=threads)
+    raise ValueError(f"알 수 없는 임베딩 백엔드: {backend}")
@@ -0,0 +1,150 @@
+"""
+질문 임베딩 마이크로 배처
+동시에 들어온 질문 임베딩 요청을 잠깐(최대 max_wait_ms) 모아 한 번의 model.encode로 처리
+
+요청마다 배치 크기 1로 추론하면 동시 요청이 CPU를 두고 경쟁하므로,
+배치 하나를 인코딩하는 동안 들어온 요청은 다음 배치로 모아 처리량을 높임
+"""
+import asyncio
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from app.core.monitoring import Histogram
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷: 배치 크기, 지연시간 (ms)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+LATENCY_MS_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# (텍스트, 결과 future, 요청 시각)
+_Request = Tuple[str, asyncio.Future, float]
+
+
+class EmbeddingBatcher:
+    """
+    임베딩 요청 마이크로 배처
+
+    - 이벤트 루프마다 수집 태스크 1개가 큐에서 요청을 꺼내 max_batch_size개 또는 max_wait_ms까지 모음
+    - 인코딩은 전용 스레드 1개에서 실행 (이벤트 루프를 막지 않고, 배치끼리 CPU 경쟁 없음)
+    - 취소된 요청(하이브리드 검색 제한 시간 초과 등)은 인코딩에서 제외
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        배처 초기화
+
+        Args:
+            encode: 텍스트 리스트를 임베딩 리스트로 변환하는 함수 (전용 스레드에서 호출)
+            max_batch_size: 한 번에 인코딩하는 최대 텍스트 수
+            max_wait_ms: 첫 요청 이후 배치를 모으는 최대 대기 시간 (ms)
+        """
+        self._encode = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-batcher")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms = Histogram(LATENCY_MS_BUCKETS)
+        self.latency_ms = Histogram(LATENCY_MS_BUCKETS)
+        self._stats: Dict[str, int] = {"requests": 0, "batches": 0, "cancelled": 0, "errors": 0}
+
+    async def embed(self, text: str) -> np.ndarray:
+        """텍스트 하나의 임베딩 (다른 동시 요청과 함께 배치 인코딩)"""
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((text, future, time.perf_counter()))
+        self._stats["requests"] += 1
+        return await future
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """현재 이벤트 루프의 수집 태스크 시작 (루프가 바뀌면 새로 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _collect(self, queue: asyncio.Queue) -> List[_Request]:
+        """첫 요청을 기다린 뒤 max_batch_size개 또는 max_wait까지 요청 수집"""
+        batch = [await queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self, queue: asyncio.Queue):
+        """수집 → 인코딩 → 결과 전달 반복"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect(queue)
+            live = [request for request in batch if not request[1].done()]
+            self._stats["cancelled"] += len(batch) - len(live)
+            if not live:
+                continue
+
+            started = time.perf_counter()
+            for _, _, enqueued in live:
+                self.queue_wait_ms.observe((started - enqueued) * 1000)
+            self.batch_sizes.observe(len(live))
+            self._stats["batches"] += 1
+            try:
+                embeddings = await loop.run_in_executor(
+                    self._executor, self._encode, [text for text, _, _ in live]
+                )
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"임베딩 배치 인코딩 실패 ({len(live)}개): {e}")
+                for _, future, _ in live:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            finished = time.perf_counter()
+            for (_, future, enqueued), embedding in zip(live, embeddings):
+                self.latency_ms.observe((finished - enqueued) * 1000)
+                if not future.done():
+                    future.set_result(embedding)
+
+    async def close(self):
+        """수집 태스크 종료 (대기 중인 요청은 취소)"""
+        if self._worker is not None and self._loop is asyncio.get_running_loop():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            while not self._queue.empty():
+                self._queue.get_nowait()[1].cancel()
+        self._worker = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청/배치 수와 배치 크기, 대기 시간, 전체 지연시간 히스토그램"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            **self._stats,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+            "latency_ms": self.latency_ms.snapshot(),
+        }
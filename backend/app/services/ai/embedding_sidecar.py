@@ -0,0 +1,214 @@
+"""
+임베딩 사이드카 (모델 서버)
+서버(컨테이너)당 임베딩 모델을 한 번만 로드하고, uvicorn 워커들은 Unix 도메인 소켓으로 요청
+워커 수가 늘어도 모델 메모리는 사이드카 하나 분량이고, 워커의 첫 질문에서 모델 로드 지연이 없음
+
+프로토콜 (길이 접두 바이너리 프레임, 정수는 빅엔디언):
+    요청: [u32 프레임 길이][u32 텍스트 수][u32 길이 + UTF-8 텍스트]...
+    응답: [u32 프레임 길이][u8 상태]
+          상태 0: [u32 행 수][u32 차원][float32 리틀엔디언 행렬]
+          상태 1: [UTF-8 오류 메시지]
+
+실행:
+    python -m app.services.ai.embedding_sidecar --socket /tmp/embedding.sock
+    EMBEDDING_SIDECAR_SOCKET=/tmp/embedding.sock gunicorn app.main:app ...
+"""
+import asyncio
+import os
+import socket
+import struct
+import logging
+import argparse
+import threading
+from typing import List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_U32 = struct.Struct(">I")
+_MATRIX_HEADER = struct.Struct(">BII")
+_STATUS_OK = 0
+_STATUS_ERROR = 1
+_MAX_FRAME = 64 * 1024 * 1024  # 비정상 프레임 차단
+
+
+class EmbeddingSidecarError(Exception):
+    """사이드카가 오류 응답을 보냈거나 프레임이 잘못됨"""
+
+
+def encode_request(texts: List[str]) -> bytes:
+    """텍스트 리스트 → 요청 프레임"""
+    parts = [_U32.pack(len(texts))]
+    for text in texts:
+        data = text.encode("utf-8")
+        parts.append(_U32.pack(len(data)))
+        parts.append(data)
+    payload = b"".join(parts)
+    return _U32.pack(len(payload)) + payload
+
+
+def decode_request(payload: bytes) -> List[str]:
+    """요청 프레임 본문 → 텍스트 리스트"""
+    (count,), offset = _U32.unpack_from(payload), _U32.size
+    texts = []
+    for _ in range(count):
+        (length,) = _U32.unpack_from(payload, offset)
+        offset += _U32.size
+        texts.append(payload[offset:offset + length].decode("utf-8"))
+        offset += length
+    return texts
+
+
+def encode_response(embeddings: np.ndarray) -> bytes:
+    """임베딩 행렬 → 성공 응답 프레임"""
+    matrix = np.ascontiguousarray(embeddings, dtype="<f4")
+    payload = _MATRIX_HEADER.pack(_STATUS_OK, *matrix.shape) + matrix.tobytes()
+    return _U32.pack(len(payload)) + payload
+
+
+def encode_error(message: str) -> bytes:
+    """오류 응답 프레임"""
+    payload = bytes([_STATUS_ERROR]) + message.encode("utf-8")
+    return _U32.pack(len(payload)) + payload
+
+
+def decode_response(payload: bytes) -> np.ndarray:
+    """응답 프레임 본문 → 임베딩 행렬 (오류 응답이면 EmbeddingSidecarError)"""
+    if payload[0] != _STATUS_OK:
+        raise EmbeddingSidecarError(payload[1:].decode("utf-8", errors="replace"))
+    _, rows, dim = _MATRIX_HEADER.unpack_from(payload)
+    return np.frombuffer(payload, dtype="<f4", offset=_MATRIX_HEADER.size).reshape(rows, dim)
+
+
+class EmbeddingSidecarClient:
+    """
+    사이드카 클라이언트 (스레드마다 연결 1개 유지)
+
+    EmbeddingService의 스레드 풀에서 호출되며, 실패하면 연결을 닫고 예외를 올림
+    (재연결은 다음 호출에서)
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 5.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._local.sock = sock
+        return sock
+
+    def _recv_exactly(self, sock: socket.socket, size: int) -> bytes:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = sock.recv_into(view[received:])
+            if count == 0:
+                raise ConnectionError("임베딩 사이드카 연결이 끊어졌습니다")
+            received += count
+        return bytes(buffer)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """텍스트 리스트 인코딩 (행 순서 = 입력 순서)"""
+        sock = self._connection()
+        try:
+            sock.sendall(encode_request(texts))
+            (length,) = _U32.unpack(self._recv_exactly(sock, _U32.size))
+            if length > _MAX_FRAME:
+                raise EmbeddingSidecarError(f"응답 프레임이 너무 큽니다: {length}")
+            return decode_response(self._recv_exactly(sock, length))
+        except (OSError, EmbeddingSidecarError):
+            self.close()
+            raise
+
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+
+class EmbeddingSidecarServer:
+    """
+    사이드카 서버
+
+    모든 워커의 요청을 EmbeddingService의 마이크로 배처로 보내므로,
+    여러 워커에서 동시에 들어온 질문도 한 번의 forward pass로 인코딩
+    """
+
+    def __init__(self, embedding_service, socket_path: str):
+        self.embedding_service = embedding_service
+        self.socket_path = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """모델 로드 후 소켓 생성 (소켓이 보이면 바로 요청 처리 가능)"""
+        self.embedding_service.load_model()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # 이전 실행이 남긴 소켓
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        logger.info(f"✓ 임베딩 사이드카 시작: {self.socket_path} ({self.embedding_service.model.name})")
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나의 요청을 순서대로 처리"""
+        batcher = self.embedding_service.get_batcher()
+        try:
+            while True:
+                try:
+                    (length,) = _U32.unpack(await reader.readexactly(_U32.size))
+                except asyncio.IncompleteReadError:
+                    return  # 클라이언트 종료
+                if length > _MAX_FRAME:
+                    logger.warning(f"임베딩 사이드카: 너무 큰 요청 프레임 {length}, 연결 종료")
+                    return
+                texts = decode_request(await reader.readexactly(length))
+                try:
+                    embeddings = await asyncio.gather(*(batcher.embed(text) for text in texts))
+                    dim = self.embedding_service.model.dimension
+                    writer.write(encode_response(
+                        np.stack(embeddings) if embeddings else np.zeros((0, dim), dtype=np.float32)
+                    ))
+                except Exception as e:
+                    logger.error(f"임베딩 사이드카 인코딩 실패: {e}")
+                    writer.write(encode_error(str(e)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def main():
+    """사이드카 실행"""
+    from app.core.config import settings
+    from app.core.logging_config import setup_logging
+    from app.services.ai.embeddings import EmbeddingService
+
+    parser = argparse.ArgumentParser(description="임베딩 모델 사이드카")
+    parser.add_argument("--socket", default=settings.EMBEDDING_SIDECAR_SOCKET or "/tmp/embedding.sock")
+    args = parser.parse_args()
+
+    setup_logging()
+    # 사이드카 자신은 현재 프로세스에서 추론 (사이드카 설정 무시)
+    service = EmbeddingService(model_name=settings.EMBEDDING_MODEL, sidecar_socket="")
+    asyncio.run(EmbeddingSidecarServer(service, args.socket).serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,64 @@
 """
 임베딩 서비스
-sentence-transformers를 사용한 텍스트 임베딩 생성 (캐싱 및 배치 처리 최적화)
+sentence-transformers 모델을 사용한 텍스트 임베딩 생성 (캐싱 및 배치 처리 최적화)
+추론은 설정된 백엔드(PyTorch 또는 ONNX Runtime)가 담당
 """
+import asyncio
+import time
 from typing import List, Optional
 import numpy as np
-from sentence_transformers import SentenceTransformer
-import json
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
+from functools import lru_cache, partial
+from app.core.tracing import span
+from app.services.ai.embedding_backends import EmbeddingBackend, load_backend
+from app.services.ai.embedding_batcher import EmbeddingBatcher
+from app.services.ai.embedding_sidecar import EmbeddingSidecarClient, EmbeddingSidecarError
+from app.utils.embedding_codec import encode_embedding, to_vector
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingService:
     """텍스트 임베딩 생성 서비스 (캐싱 및 배치 처리 최적화)"""
     
-    def __init__(self, model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"):
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        backend: Optional[str] = None,
+        onnx_dir: Optional[str] = None,
+        quantized: Optional[bool] = None,
+        threads: Optional[int] = None,
+        sidecar_socket: Optional[str] = None,
+    ):
         """
         임베딩 서비스 초기화
         
         Args:
             model_name: 사용할 sentence-transformers 모델명
+            backend: 추론 백엔드 ("torch", "onnx", 기본값 EMBEDDING_BACKEND)
+            onnx_dir: ONNX 모델 디렉터리 (기본값 EMBEDDING_ONNX_DIR)
+            quantized: int8 양자화 ONNX 모델 사용 여부 (기본값 EMBEDDING_ONNX_QUANTIZED)
+            threads: 추론 스레드 수 (기본값 EMBEDDING_THREADS, 0이면 런타임 기본값)
+            sidecar_socket: 임베딩 사이드카 소켓 경로 (기본값 EMBEDDING_SIDECAR_SOCKET, 빈 값이면 사용 안 함)
         """
+        from app.core.config import settings
         self.model_name = model_name
-        self.model: Optional[SentenceTransformer] = None
+        self.backend = backend or settings.EMBEDDING_BACKEND
+        self.onnx_dir = onnx_dir or settings.EMBEDDING_ONNX_DIR
+        self.quantized = settings.EMBEDDING_ONNX_QUANTIZED if quantized is None else quantized
+        self.threads = settings.EMBEDDING_THREADS if threads is None else threads
+        self.model: Optional[EmbeddingBackend] = None
         self.embedding_dimension = 384  # MiniLM-L12-v2의 차원
         self._cache = None  # 캐시 서비스 (지연 로딩)
         self._executor = ThreadPoolExecutor(max_workers=4)  # 병렬 처리용
+        self._batcher: Optional[EmbeddingBatcher] = None  # 질문 임베딩 마이크로 배처 (지연 생성)
+        socket_path = settings.EMBEDDING_SIDECAR_SOCKET if sidecar_socket is None else sidecar_socket
+        self._sidecar = (
+            EmbeddingSidecarClient(socket_path, timeout=settings.EMBEDDING_SIDECAR_TIMEOUT)
+            if socket_path else None
+        )
+        self._sidecar_retry_interval = settings.EMBEDDING_SIDECAR_RETRY_INTERVAL
+        self._sidecar_down_until = 0.0  # 사이드카 실패 후 재시도 전까지 현재 프로세스에서 추론
         
     def _get_cache(self):
         """캐시 서비스 가져오기 (지연 로딩)"""
@@ -42,9 +74,39 @@ class EmbeddingService:
     def load_model(self):
         """모델 로드 (지연 로딩)"""
         if self.model is None:
-            logger.info(f"임베딩 모델 로드 중: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
-            logger.info(f"✓ 임베딩 모델 로드 완료")
+            logger.info(f"임베딩 모델 로드 중: {self.model_name} ({self.backend})")
+            try:
+                self.model = load_backend(
+                    self.backend, self.model_name, self.onnx_dir, self.quantized, self.threads
+                )
+            except (ImportError, FileNotFoundError) as e:
+                if self.backend == "torch":
+                    raise
+                # ONNX 모델/런타임이 없으면 PyTorch 모델로 대체
+                logger.warning(f"{self.backend} 백엔드 로드 실패, torch 백엔드 사용: {e}")
+                self.model = load_backend("torch", self.model_name, threads=self.threads)
+            exported_from = getattr(self.model, "config", {}).get("model_name")
+            if exported_from and exported_from != self.model_name:
+                logger.warning(f"ONNX 모델({exported_from})이 EMBEDDING_MODEL({self.model_name})과 다릅니다")
+            logger.info(f"✓ 임베딩 모델 로드 완료 ({self.model.name})")
+    
+    def _encode(self, texts: List[str], batch_size: int = 32, show_progress_bar: bool = False) -> np.ndarray:
+        """
+        텍스트 리스트 인코딩
+        사이드카가 설정돼 있으면 사이드카로 요청하고, 실패하면 재시도 간격 동안 현재 프로세스에서 추론
+        """
+        if self._sidecar is not None and time.monotonic() >= self._sidecar_down_until:
+            try:
+                return self._sidecar.encode(texts)
+            except (OSError, EmbeddingSidecarError) as e:
+                self._sidecar_down_until = time.monotonic() + self._sidecar_retry_interval
+                logger.warning(
+                    f"임베딩 사이드카 요청 실패, {self._sidecar_retry_interval:.0f}초 동안 현재 프로세스에서 추론: {e}"
+                )
+        self.load_model()
+        return self.model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=show_progress_bar
+        )
     
     def get_embedding(self, text: str, use_cache: bool = True) -> List[float]:
         """
@@ -66,23 +128,89 @@ class EmbeddingService:
             cache = self._get_cache()
             if cache:
                 cached_embedding = cache.get_embedding(text)
-                if cached_embedding:
+                if cached_embedding is not None:
                     logger.debug(f"임베딩 캐시 히트: {text[:50]}...")
-                    return cached_embedding
-        
-        self.load_model()
+                    return cached_embedding.tolist()
         
         # 임베딩 생성
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        embedding_list = embedding.tolist()
+        embedding = self._encode([text])[0]
         
         # 캐시 저장
         if use_cache:
             cache = self._get_cache()
             if cache:
-                cache.set_embedding(text, embedding_list)
+                cache.set_embedding(text, embedding)
         
-        return embedding_list
+        return embedding.tolist()
+    
+    def get_batcher(self) -> EmbeddingBatcher:
+        """질문 임베딩 마이크로 배처 (지연 생성)"""
+        if self._batcher is None:
+            from app.core.config import settings
+            self._batcher = EmbeddingBatcher(
+                self._encode_texts,
+                max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+                max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS,
+            )
+        return self._batcher
+    
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """텍스트 리스트를 한 번의 forward pass로 인코딩 (마이크로 배처용)"""
+        return self._encode(texts, batch_size=len(texts))
+    
+    def _lookup_cache(self, text: str) -> Optional[np.ndarray]:
+        """캐시된 임베딩 조회 (없으면 None)"""
+        cache = self._get_cache()
+        return cache.get_embedding(text) if cache else None
+    
+    def _store_cache(self, text: str, embedding: np.ndarray):
+        """임베딩 캐시 저장"""
+        cache = self._get_cache()
+        if cache:
+            cache.set_embedding(text, embedding)
+    
+    async def get_embedding_async(self, text: str, use_cache: bool = True) -> List[float]:
+        """
+        텍스트를 벡터로 변환 (비동기, 모델 추론 중 이벤트 루프를 막지 않도록 전용 스레드에서 실행)
+        
+        EMBEDDING_BATCH_ENABLED면 캐시 미스 요청을 마이크로 배처로 보내
+        동시에 들어온 다른 질문과 한 번에 인코딩 (사이드카 사용 시에는 사이드카가 워커 전체 요청을 배치)
+        
+        Args:
+            text: 임베딩할 텍스트
+            use_cache: 캐시 사용 여부
+            
+        Returns:
+            384차원 벡터 (리스트)
+        """
+        with span("embedding"):
+            return await self._embed_async(text, use_cache)
+    
+    async def _embed_async(self, text: str, use_cache: bool) -> List[float]:
+        """get_embedding_async 본문 (캐시 조회 → 사이드카/배처/현재 프로세스 추론)"""
+        from app.core.config import settings
+        loop = asyncio.get_running_loop()
+        if (
+            not settings.EMBEDDING_BATCH_ENABLED
+            or self._sidecar is not None
+            or not text or not text.strip()
+        ):
+            return await loop.run_in_executor(
+                self._executor, partial(self.get_embedding, text, use_cache)
+            )
+        
+        if use_cache:
+            cached_embedding = await loop.run_in_executor(self._executor, self._lookup_cache, text)
+            if cached_embedding is not None:
+                logger.debug(f"임베딩 캐시 히트: {text[:50]}...")
+                return cached_embedding.tolist()
+        
+        embedding = await self.get_batcher().embed(text)
+        
+        if use_cache:
+            # 캐시 저장은 응답을 기다리게 하지 않음
+            loop.run_in_executor(self._executor, self._store_cache, text, embedding)
+        return embedding.tolist()
     
     def get_embeddings_batch(self, texts: List[str], use_cache: bool = True, batch_size: int = 32) -> List[List[float]]:
         """
@@ -114,8 +242,8 @@ class EmbeddingService:
             # 캐시 확인
             if cache:
                 cached_embedding = cache.get_embedding(text)
-                if cached_embedding:
-                    results.append(cached_embedding)
+                if cached_embedding is not None:
+                    results.append(cached_embedding.tolist())
                     continue
             
             # 캐시 미스 - 인코딩 대상에 추가
@@ -126,24 +254,20 @@ class EmbeddingService:
         # 캐시되지 않은 텍스트만 인코딩
         if texts_to_encode:
             logger.info(f"임베딩 생성: {len(texts_to_encode)}/{len(texts)}개 (캐시 히트: {len(texts) - len(texts_to_encode)}개)")
-            self.load_model()
-            
             # 배치 임베딩 생성
-            embeddings = self.model.encode(
-                texts_to_encode, 
-                convert_to_numpy=True, 
+            embeddings = self._encode(
+                texts_to_encode,
                 batch_size=batch_size,
                 show_progress_bar=len(texts_to_encode) > 100  # 100개 이상일 때만 진행률 표시
             )
             
             # 결과 저장 및 캐시 업데이트
             for idx, embedding in zip(text_indices, embeddings):
-                embedding_list = embedding.tolist()
-                results[idx] = embedding_list
+                results[idx] = embedding.tolist()
                 
                 # 캐시 저장
                 if cache:
-                    cache.set_embedding(texts[idx], embedding_list)
+                    cache.set_embedding(texts[idx], embedding)
         
         return results
     
@@ -174,36 +298,33 @@ class EmbeddingService:
         # -1 ~ 1 범위를 0 ~ 1 범위로 변환
         return (similarity + 1) / 2
     
-    def embedding_to_db_format(self, embedding: List[float]) -> str:
+    def embedding_to_db_format(self, embedding: List[float]) -> bytes:
         """
         임베딩을 데이터베이스 저장 형식으로 변환
-        PostgreSQL의 pgvector는 벡터를 직접 받지만, SQLite는 JSON 문자열로 저장
+        PostgreSQL은 EmbeddingVector 컬럼이 pgvector로 그대로 전달하고,
+        SQLite는 바이너리(embedding_codec 형식)로 저장
         
         Args:
             embedding: 임베딩 벡터
             
         Returns:
-            JSON 문자열 (SQLite용) 또는 벡터 그대로 (PostgreSQL용)
+            인코딩된 바이트 (EMBEDDING_STORAGE_DTYPE 형식)
         """
-        # SQLite는 JSON 문자열로 저장
-        return json.dumps(embedding)
+        from app.core.config import settings
+        return encode_embedding(embedding, settings.EMBEDDING_STORAGE_DTYPE)
     
-    def db_format_to_embedding(self, db_value: str) -> List[float]:
+    def db_format_to_embedding(self, db_value) -> List[float]:
         """
         데이터베이스 형식을 임베딩 벡터로 변환
         
         Args:
-            db_value: 데이터베이스 저장 값
+            db_value: 데이터베이스 저장 값 (바이트, 기존 JSON 문자열, pgvector 값)
             
         Returns:
             임베딩 벡터
         """
-        if isinstance(db_value, str):
-            # SQLite에서 JSON 문자열로 저장된 경우
-            return json.loads(db_value)
-        else:
-            # PostgreSQL에서 벡터로 저장된 경우
-            return db_value
+        vector = to_vector(db_value)
+        return vector.tolist() if vector is not None else []
 
 
 # 전역 임베딩 서비스 인스턴스
@@ -1,9 +1,12 @@
 """
 RAG (Retrieval-Augmented Generation) 파이프라인
 """
-from typing import Dict, Any, List
-from sqlalchemy.orm import Session
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.tracing import span
 from app.services.search import SearchService
+from app.services.answer_cache import get_answer_cache
 from app.services.ai.client import get_gemini_client
 from app.services.ai.prompts import SYSTEM_PROMPT, create_rag_prompt
 from app.services.classifier import QuestionClassifier
@@ -16,7 +19,7 @@ logger = logging.getLogger(__name__)
 class RAGPipeline:
     """RAG 파이프라인 클래스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """
         RAG 파이프라인 초기화
         
@@ -27,6 +30,7 @@ class RAGPipeline:
         self.search_service = SearchService(db)
         self.gemini_client = get_gemini_client()
         self.classifier = QuestionClassifier()
+        self.answer_cache = get_answer_cache() if settings.ANSWER_CACHE_ENABLED else None
     
     async def process_question(
         self,
@@ -47,31 +51,24 @@ class RAGPipeline:
             logger.info(f"질문 처리 시작: {question}")
             
             # 1. 질문 분류
-            category = self.classifier.classify(question)
-            logger.info(f"질문 카테고리: {category}")
+            category = self._classify(question)
             
-            # 2. 관련 정보 검색
-            if use_hybrid_search:
-                search_results = self.search_service.hybrid_search(
-                    query=question,
-                    category=category,
-                    limit=5
-                )
-            else:
-                search_results = self.search_service.search_by_vector(
-                    query=question,
-                    category=category,
-                    limit=5
-                )
+            # 2. 의미 답변 캐시 확인 (거의 같은 질문이면 저장된 답변 재사용)
+            question_embedding = await self._question_embedding(question)
+            cached_response = await self._lookup_answer(question_embedding, category)
+            if cached_response:
+                return cached_response
             
-            logger.info(f"검색 결과 수: {len(search_results)}")
+            # 3. 관련 정보 검색
+            search_results = await self._search(question, category, use_hybrid_search, question_embedding)
             
-            # 3. 검색 결과 없을 때 폴백
+            # 검색 결과 없을 때 폴백
             if not search_results:
                 return self._create_fallback_response(question, category)
             
             # 4. RAG 프롬프트 생성
-            rag_prompt = create_rag_prompt(question, search_results)
+            with span("prompt"):
+                rag_prompt = create_rag_prompt(question, search_results)
             
             # 5. Gemini API를 사용하여 답변 생성
             answer = await self.gemini_client.generate_response(
@@ -87,11 +84,13 @@ class RAGPipeline:
             response = {
                 "answer": answer,
                 "sources": sources,
-                "category": category.value if isinstance(category, QuestionCategory) else category,
+                "category": self._category_value(category),
                 "search_results_count": len(search_results),
                 "success": True
             }
             
+            await self._store_answer(question, question_embedding, category, response)
+            
             logger.info("질문 처리 완료")
             return response
             
@@ -99,6 +98,202 @@ class RAGPipeline:
             logger.error(f"RAG 파이프라인 오류: {e}")
             return self._create_error_response(str(e))
     
+    async def stream_question(
+        self,
+        question: str,
+        use_hybrid_search: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        질문 처리 (스트리밍)
+        
+        검색이 끝나는 즉시 출처/카테고리를 보내고, 이후 모델이 생성하는 답변 조각을 순서대로 보냄
+        
+        Args:
+            question: 사용자 질문
+            use_hybrid_search: 하이브리드 검색 사용 여부
+            
+        Yields:
+            {"event": "meta", "data": 카테고리/출처} → {"event": "token", "data": {"text": 답변 조각}} ...
+            → {"event": "done", "data": 전체 답변 및 성공 여부}
+        """
+        category, question_embedding, search_results, early_response = await self._prepare_stream(
+            question, use_hybrid_search
+        )
+        if early_response is not None:
+            for event in self._response_events(early_response):
+                yield event
+            return
+        
+        meta = {
+            "category": self._category_value(category),
+            "sources": self._extract_sources(search_results),
+            "search_results_count": len(search_results),
+        }
+        yield {"event": "meta", "data": meta}
+        
+        with span("prompt"):
+            rag_prompt = create_rag_prompt(question, search_results)
+        
+        chunks: List[str] = []
+        try:
+            async for text in self.gemini_client.stream_response(
+                user_message=rag_prompt,
+                system_prompt=SYSTEM_PROMPT,
+                max_tokens=2000,
+            ):
+                chunks.append(text)
+                yield {"event": "token", "data": {"text": text}}
+        except Exception as e:
+            logger.error(f"RAG 스트리밍 오류: {e}")
+            for event in self._stream_error_events(chunks, e):
+                yield event
+            return
+        
+        answer = "".join(chunks)
+        await self._store_answer(question, question_embedding, category, {**meta, "answer": answer, "success": True})
+        
+        logger.info("스트리밍 질문 처리 완료")
+        yield {"event": "done", "data": {"answer": answer, "success": True}}
+    
+    async def _prepare_stream(
+        self,
+        question: str,
+        use_hybrid_search: bool,
+    ) -> Tuple[Optional[QuestionCategory], Optional[List[float]], List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        스트리밍 전 단계: 분류, 답변 캐시 확인, 검색
+        
+        Returns:
+            (카테고리, 질문 임베딩, 검색 결과, 생성 없이 바로 보낼 응답)
+            바로 보낼 응답은 캐시 히트/검색 결과 없음/오류일 때만 있음
+        """
+        try:
+            logger.info(f"스트리밍 질문 처리 시작: {question}")
+            category = self._classify(question)
+            question_embedding = await self._question_embedding(question)
+            cached_response = await self._lookup_answer(question_embedding, category)
+            if cached_response:
+                return category, question_embedding, [], cached_response
+            search_results = await self._search(question, category, use_hybrid_search, question_embedding)
+        except Exception as e:
+            logger.error(f"RAG 파이프라인 오류: {e}")
+            return None, None, [], self._create_error_response(str(e))
+        
+        if not search_results:
+            return category, question_embedding, [], self._create_fallback_response(question, category)
+        return category, question_embedding, search_results, None
+    
+    def _stream_error_events(self, chunks: List[str], error: Exception) -> List[Dict[str, Any]]:
+        """답변 생성 중 실패했을 때 보낼 이벤트"""
+        if not chunks:
+            # 답변이 시작되기 전 실패: 일반 응답과 같은 오류 안내문 전송
+            error_response = self._create_error_response(str(error))
+            return [
+                {"event": "token", "data": {"text": error_response["answer"]}},
+                {"event": "done", "data": error_response},
+            ]
+        return [{
+            "event": "done",
+            "data": {"answer": "".join(chunks), "success": False, "error": str(error)},
+        }]
+    
+    def _classify(self, question: str) -> QuestionCategory:
+        """질문 분류"""
+        with span("classify"):
+            category = self.classifier.classify(question)
+        logger.info(f"질문 카테고리: {category}")
+        return category
+    
+    async def _search(
+        self,
+        question: str,
+        category: QuestionCategory,
+        use_hybrid_search: bool,
+        question_embedding: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """관련 정보 검색 (답변 캐시용으로 계산한 질문 임베딩이 있으면 검색에 재사용)"""
+        with span("search"):
+            if use_hybrid_search:
+                search_results = await self.search_service.hybrid_search(
+                    query=question,
+                    category=category,
+                    limit=5,
+                    query_embedding=question_embedding,
+                )
+            else:
+                search_results = await self.search_service.search_by_vector(
+                    query=question,
+                    category=category,
+                    limit=5,
+                    query_embedding=question_embedding,
+                )
+        
+        logger.info(f"검색 결과 수: {len(search_results)}")
+        return search_results
+    
+    async def _question_embedding(self, question: str) -> Optional[List[float]]:
+        """답변 캐시용 질문 임베딩 (검색 단계에 그대로 넘겨 다시 계산하지 않음)"""
+        if self.answer_cache is None:
+            return None
+        try:
+            return await self.search_service.embedding_service.get_embedding_async(question)
+        except Exception as e:
+            logger.warning(f"답변 캐시용 임베딩 생성 실패: {e}")
+            return None
+    
+    async def _lookup_answer(
+        self,
+        question_embedding: Optional[List[float]],
+        category: QuestionCategory,
+    ) -> Optional[Dict[str, Any]]:
+        """의미 답변 캐시 조회"""
+        if self.answer_cache is None or question_embedding is None:
+            return None
+        cache = self.answer_cache
+        with span("answer_cache"):
+            return await self.db.run_sync(
+                lambda session: cache.lookup(session, question_embedding, category)
+            )
+    
+    async def _store_answer(
+        self,
+        question: str,
+        question_embedding: Optional[List[float]],
+        category: QuestionCategory,
+        response: Dict[str, Any],
+    ):
+        """검색 결과에 근거해 성공적으로 생성된 답변만 의미 답변 캐시에 저장"""
+        if self.answer_cache is None or question_embedding is None:
+            return
+        try:
+            cache = self.answer_cache
+            with span("answer_cache_store"):
+                await self.db.run_sync(
+                    lambda session: cache.store(session, question_embedding, category, response, question=question)
+                )
+        except Exception as e:
+            logger.warning(f"답변 캐시 저장 실패: {e}")
+    
+    @staticmethod
+    def _category_value(category) -> str:
+        return category.value if isinstance(category, QuestionCategory) else category
+    
+    @staticmethod
+    def _response_events(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """완성된 응답(폴백/오류)을 스트리밍 이벤트 순서로 변환"""
+        return [
+            {
+                "event": "meta",
+                "data": {
+                    "category": response["category"],
+                    "sources": response["sources"],
+                    "search_results_count": response["search_results_count"],
+                },
+            },
+            {"event": "token", "data": {"text": response["answer"]}},
+            {"event": "done", "data": response},
+        ]
+    
     def _extract_sources(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """
         검색 결과에서 출처 정보 추출
@@ -151,7 +346,7 @@ class RAGPipeline:
         return {
             "answer": fallback_answer,
             "sources": [],
-            "category": category.value if isinstance(category, QuestionCategory) else category,
+            "category": self._category_value(category),
             "search_results_count": 0,
             "success": True,
             "is_fallback": True
@@ -177,6 +372,6 @@ class RAGPipeline:
         }
 
 
-def get_rag_pipeline(db: Session) -> RAGPipeline:
+def get_rag_pipeline(db: AsyncSession) -> RAGPipeline:
     """RAG 파이프라인 인스턴스 생성"""
     return RAGPipeline(db)
@@ -0,0 +1,310 @@
+"""
+의미 기반 답변 캐시
+질문 임베딩의 코사인 유사도로 거의 같은 질문을 찾아 저장된 답변을 재사용 (LLM 호출 생략)
+
+- 근사 최근접 이웃(ANN): 랜덤 초평면 LSH 버킷으로 후보를 좁힌 뒤 후보만 정확한 코사인 계산
+- 무효화: 항목마다 TTL, 그리고 답변이 의존하는 테이블의 버전이 바뀌면 제거
+"""
+import itertools
+import threading
+import time
+import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
+from app.models.question_log import QuestionCategory
+from app.services.documents import DOCUMENT_TABLES, DocumentTable, tables_for_category
+from app.services.resident_index import ResidentIndex
+
+logger = logging.getLogger(__name__)
+
+# LSH 파라미터: 코사인 0.9(약 26°)인 쌍이 같은 버킷에 들어갈 확률
+# 테이블당 (1 - 26/180)^8 ≈ 0.29, 테이블 8개 중 하나 이상 ≈ 0.94
+LSH_TABLES = 8
+LSH_BITS = 8
+
+
+class DocumentVersions(ResidentIndex):
+    """
+    문서 테이블별 버전 번호
+    ResidentIndex의 변경 감지(ORM 이벤트 + 주기적 시그니처 확인)를 재사용해
+    테이블 내용이 바뀔 때마다 새 버전 번호를 발급
+    """
+
+    def __init__(self, refresh_interval: float = 60.0):
+        super().__init__(refresh_interval)
+        self._generation = itertools.count(1)
+
+    def version(self, db: Session, table_name: str) -> int:
+        """테이블의 현재 버전 번호"""
+        return self._ensure(db, DOCUMENT_TABLES[table_name])
+
+    def _row_filter(self, table: DocumentTable) -> List[Any]:
+        return table.active_filter()
+
+    def _build_table(self, db: Session, table: DocumentTable) -> int:
+        return next(self._generation)
+
+
+class _LSHIndex:
+    """랜덤 초평면 LSH (코사인 유사도용 근사 최근접 이웃 후보 탐색)"""
+
+    def __init__(self, dim: int, tables: int = LSH_TABLES, bits: int = LSH_BITS, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((tables * bits, dim)).astype(np.float32)
+        self._tables = tables
+        self._weights = 1 << np.arange(bits, dtype=np.int64)
+        self._buckets: List[Dict[int, Set[int]]] = [defaultdict(set) for _ in range(tables)]
+
+    def keys(self, vector: np.ndarray) -> Tuple[int, ...]:
+        """테이블별 버킷 키"""
+        bits = (self._planes @ vector > 0).reshape(self._tables, -1)
+        return tuple(int(key) for key in bits @ self._weights)
+
+    def add(self, item_id: int, keys: Sequence[int]):
+        for bucket, key in zip(self._buckets, keys):
+            bucket[key].add(item_id)
+
+    def remove(self, item_id: int, keys: Sequence[int]):
+        for bucket, key in zip(self._buckets, keys):
+            members = bucket.get(key)
+            if members is not None:
+                members.discard(item_id)
+                if not members:
+                    del bucket[key]
+
+    def candidates(self, keys: Sequence[int]) -> Set[int]:
+        """하나 이상의 테이블에서 같은 버킷에 있는 항목"""
+        found: Set[int] = set()
+        for bucket, key in zip(self._buckets, keys):
+            found.update(bucket.get(key, ()))
+        return found
+
+
+@dataclass
+class _CachedAnswer:
+    """캐시된 답변 하나"""
+    vector: np.ndarray  # L2 정규화된 질문 임베딩
+    keys: Tuple[int, ...]
+    category: Optional[str]
+    response: Dict[str, Any]
+    versions: Dict[str, int]  # 의존 테이블 → 저장 시점 버전
+    expires_at: float
+    question: str = ""
+    hits: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class SemanticAnswerCache:
+    """질문 임베딩 기반 의미 답변 캐시 (프로세스 내)"""
+
+    def __init__(
+        self,
+        versions: DocumentVersions,
+        dim: int = 384,
+        threshold: float = 0.9,
+        ttl: int = 21600,
+        max_entries: int = 2048,
+    ):
+        """
+        답변 캐시 초기화
+
+        Args:
+            versions: 문서 테이블 버전 제공자
+            dim: 임베딩 차원
+            threshold: 캐시 히트로 인정할 최소 코사인 유사도
+            ttl: 항목 보관 시간 (초)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._versions = versions
+        self._lsh = _LSHIndex(dim)
+        self._entries: "OrderedDict[int, _CachedAnswer]" = OrderedDict()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _dependencies(category: Optional[QuestionCategory]) -> List[str]:
+        """답변이 의존하는 테이블 (카테고리 검색 대상, 없으면 전체)"""
+        tables = tables_for_category(category) or list(DOCUMENT_TABLES.values())
+        return [table.name for table in tables]
+
+    @staticmethod
+    def _category_key(category: Optional[QuestionCategory]) -> Optional[str]:
+        return category.value if isinstance(category, QuestionCategory) else category
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0:
+            return None
+        return vector / norm
+
+    def lookup(
+        self,
+        db: Session,
+        embedding: Sequence[float],
+        category: Optional[QuestionCategory],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        유사한 질문의 캐시된 답변 조회
+
+        Args:
+            db: 데이터베이스 세션 (의존 테이블 버전 확인용)
+            embedding: 질문 임베딩
+            category: 질문 카테고리 (같은 카테고리 항목만 히트)
+
+        Returns:
+            캐시된 응답 (similarity, cached 필드 포함) 또는 None
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+        keys = self._lsh.keys(vector)
+        category_key = self._category_key(category)
+        now = time.monotonic()
+
+        with self._lock:
+            self._stats["lookups"] += 1
+            candidates = [
+                item_id for item_id in self._lsh.candidates(keys)
+                if self._entries[item_id].category == category_key
+            ]
+            best_id, best_score = None, self.threshold
+            if candidates:
+                matrix = np.stack([self._entries[item_id].vector for item_id in candidates])
+                scores = matrix @ vector
+                order = np.argsort(-scores)
+                for position in order:
+                    if scores[position] < self.threshold:
+                        break
+                    item_id = candidates[position]
+                    entry = self._entries[item_id]
+                    if entry.expires_at < now:
+                        self._remove(item_id)
+                        self._stats["expired"] += 1
+                        continue
+                    best_id, best_score = item_id, float(scores[position])
+                    break
+
+            if best_id is None:
+                self._stats["misses"] += 1
+                return None
+            entry = self._entries[best_id]
+
+        # 버전 확인은 DB 조회가 있을 수 있으므로 락 밖에서 수행
+        if any(self._versions.version(db, name) != version for name, version in entry.versions.items()):
+            with self._lock:
+                if best_id in self._entries:
+                    self._remove(best_id)
+                self._stats["stale"] += 1
+                self._stats["misses"] += 1
+            logger.debug(f"답변 캐시 항목 만료 (문서 변경): {entry.question[:50]}")
+            return None
+
+        with self._lock:
+            if best_id in self._entries:
+                self._entries.move_to_end(best_id)
+            entry.hits += 1
+            self._stats["hits"] += 1
+
+        logger.info(f"답변 캐시 히트 (유사도 {best_score:.3f}): {entry.question[:50]}")
+        return {**entry.response, "cached": True, "cache_similarity": best_score}
+
+    def store(
+        self,
+        db: Session,
+        embedding: Sequence[float],
+        category: Optional[QuestionCategory],
+        response: Dict[str, Any],
+        question: str = "",
+    ) -> bool:
+        """
+        답변 저장
+
+        Args:
+            db: 데이터베이스 세션 (의존 테이블 버전 기록용)
+            embedding: 질문 임베딩
+            category: 질문 카테고리
+            response: 저장할 응답 (answer, sources, category 등)
+            question: 원본 질문 (로그용)
+
+        Returns:
+            저장 여부
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return False
+        versions = {name: self._versions.version(db, name) for name in self._dependencies(category)}
+        entry = _CachedAnswer(
+            vector=vector,
+            keys=self._lsh.keys(vector),
+            category=self._category_key(category),
+            response=dict(response),
+            versions=versions,
+            expires_at=time.monotonic() + self.ttl,
+            question=question,
+        )
+
+        with self._lock:
+            item_id = next(self._ids)
+            self._entries[item_id] = entry
+            self._lsh.add(item_id, entry.keys)
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+        return True
+
+    def clear(self):
+        """전체 항목 삭제"""
+        with self._lock:
+            for item_id in list(self._entries):
+                self._remove(item_id)
+
+    def _remove(self, item_id: int):
+        entry = self._entries.pop(item_id)
+        self._lsh.remove(item_id, entry.keys)
+
+    def warm(self, db: Session):
+        """테이블 버전 미리 구성 (시작 시 워밍업)"""
+        self._versions.warm(db)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트율 및 항목 수 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            size = len(self._entries)
+        lookups = stats.get("lookups", 0)
+        return {
+            "size": size,
+            "hit_rate": stats.get("hits", 0) / lookups if lookups else 0.0,
+            **{name: stats.get(name, 0) for name in
+               ("lookups", "hits", "misses", "stale", "expired", "evictions", "stores")},
+        }
+
+
+# 전역 답변 캐시 인스턴스
+_answer_cache: Optional[SemanticAnswerCache] = None
+
+
+def get_answer_cache() -> SemanticAnswerCache:
+    """답변 캐시 싱글톤 인스턴스 반환"""
+    global _answer_cache
+    if _answer_cache is None:
+        from app.core.config import settings
+        versions = DocumentVersions(refresh_interval=settings.SEARCH_INDEX_REFRESH_INTERVAL)
+        versions.register_listeners()
+        _answer_cache = SemanticAnswerCache(
+            versions,
+            threshold=settings.ANSWER_CACHE_THRESHOLD,
+            ttl=settings.ANSWER_CACHE_TTL,
+            max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+        )
+    return _answer_cache
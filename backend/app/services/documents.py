@@ -0,0 +1,141 @@
+"""
+검색 대상 문서 테이블 정의
+검색 인덱스와 검색 서비스가 공통으로 사용하는 테이블별 메타데이터
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.models.question_log import QuestionCategory
+from app.models.academic_schedule import AcademicSchedule
+from app.models.notice import Notice
+from app.models.support_program import SupportProgram
+from app.models.academic_glossary import AcademicGlossary
+
+
+def _schedule_payload(schedule: AcademicSchedule) -> Dict[str, Any]:
+    """학사 일정 검색 결과 형식"""
+    return {
+        "doc_table": AcademicSchedule.__tablename__,
+        "id": schedule.id,
+        "name": schedule.name,
+        "description": schedule.description,
+        "start_date": schedule.start_date.isoformat() if schedule.start_date else None,
+        "end_date": schedule.end_date.isoformat() if schedule.end_date else None,
+        "source": f"{schedule.semester.value} 학사일정",
+    }
+
+
+def _notice_payload(notice: Notice) -> Dict[str, Any]:
+    """공지사항 검색 결과 형식"""
+    return {
+        "doc_table": Notice.__tablename__,
+        "id": notice.id,
+        "title": notice.title,
+        "content": notice.content,
+        "source": f"{notice.notice_type.value} 공지사항",
+    }
+
+
+def _program_payload(program: SupportProgram) -> Dict[str, Any]:
+    """지원 프로그램 검색 결과 형식"""
+    return {
+        "doc_table": SupportProgram.__tablename__,
+        "id": program.id,
+        "name": program.name,
+        "description": program.description,
+        "application_method": program.application_method,
+        "source": f"{program.program_type.value} 프로그램",
+    }
+
+
+def _glossary_payload(term: AcademicGlossary) -> Dict[str, Any]:
+    """학사 용어 검색 결과 형식"""
+    return {
+        "doc_table": AcademicGlossary.__tablename__,
+        "id": term.id,
+        "term": term.term_ko,
+        "definition": term.definition,
+        "examples": term.examples,
+        "source": "학사 용어 사전",
+    }
+
+
+@dataclass(frozen=True)
+class DocumentTable:
+    """검색 대상 테이블 메타데이터"""
+    name: str
+    model: Any
+    category: QuestionCategory
+    to_payload: Callable[[Any], Dict[str, Any]]
+    text_fields: Tuple[str, str]  # (제목 필드, 본문 필드)
+    active_only: bool = False
+
+    def active_filter(self) -> List[Any]:
+        """검색 대상 행 필터 (비활성 행 제외)"""
+        if self.active_only:
+            return [self.model.is_active == 1]
+        return []
+
+    def texts(self, row: Any) -> Tuple[str, str]:
+        """행의 (제목, 본문) 텍스트"""
+        title_field, body_field = self.text_fields
+        return getattr(row, title_field) or "", getattr(row, body_field) or ""
+
+    def text_columns(self) -> List[Any]:
+        """(제목, 본문) 컬럼 (전체 행 대신 텍스트만 조회할 때 사용)"""
+        return [getattr(self.model, field) for field in self.text_fields]
+
+    def embedding_text(self, row: Any) -> str:
+        """임베딩 입력 텍스트 ("제목. 본문")"""
+        title, body = self.texts(row)
+        return f"{title}. {body}"
+
+    def content_hash(self, row: Any) -> str:
+        """임베딩 입력 텍스트의 SHA-256 (내용이 바뀐 행만 다시 임베딩하기 위한 비교값)"""
+        return hashlib.sha256(self.embedding_text(row).encode("utf-8")).hexdigest()
+
+
+DOCUMENT_TABLES: Dict[str, DocumentTable] = {
+    table.name: table
+    for table in (
+        DocumentTable(
+            name=AcademicSchedule.__tablename__,
+            model=AcademicSchedule,
+            category=QuestionCategory.ACADEMIC_SCHEDULE,
+            to_payload=_schedule_payload,
+            text_fields=("name", "description"),
+        ),
+        DocumentTable(
+            name=Notice.__tablename__,
+            model=Notice,
+            category=QuestionCategory.NOTICE,
+            to_payload=_notice_payload,
+            text_fields=("title", "content"),
+            active_only=True,
+        ),
+        DocumentTable(
+            name=SupportProgram.__tablename__,
+            model=SupportProgram,
+            category=QuestionCategory.SUPPORT_PROGRAM,
+            to_payload=_program_payload,
+            text_fields=("name", "description"),
+            active_only=True,
+        ),
+        DocumentTable(
+            name=AcademicGlossary.__tablename__,
+            model=AcademicGlossary,
+            category=QuestionCategory.ACADEMIC_INFO,
+            to_payload=_glossary_payload,
+            text_fields=("term_ko", "definition"),
+        ),
+    )
+}
+
+
+def tables_for_category(category: Optional[QuestionCategory]) -> List[DocumentTable]:
+    """카테고리에 해당하는 검색 대상 테이블 목록 (None이면 전체)"""
+    return [
+        table
+        for table in DOCUMENT_TABLES.values()
+        if category is None or table.category == category
+    ]
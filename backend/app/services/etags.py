@@ -0,0 +1,66 @@
+"""
+조회 API 조건부 요청(ETag)용 테이블 버전
+테이블 시그니처(테이블 버전, 행 수, 최대 ID, 최종 수정일)로 강한 ETag를 만들어
+If-None-Match가 일치하면 행을 조회/직렬화하지 않고 304로 응답
+
+- 시그니처는 DB 내용만으로 정해지므로 어느 워커가 응답해도 같은 ETag
+- 테이블 버전은 ORM 쓰기마다 같은 트랜잭션에서 증가하므로 같은 날 수정이나
+  활성 상태 변경처럼 행 수/수정일이 그대로인 변경도 ETag를 바꿈
+- ResidentIndex의 변경 감지를 재사용: 현재 프로세스의 ORM 변경과 Redis 테이블 변경 알림은 즉시,
+  그 밖의 다른 프로세스 변경은 refresh_interval 안에 반영
+"""
+import hashlib
+from typing import Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.services.documents import DOCUMENT_TABLES, DocumentTable
+from app.services.resident_index import ResidentIndex
+
+
+class TableETags(ResidentIndex):
+    """테이블별 시그니처 캐시 (인덱스 데이터 없이 시그니처만 보관)"""
+
+    def _row_filter(self, table: DocumentTable):
+        # 조회 API는 비활성 행도 반환하므로 전체 행 기준
+        return []
+
+    def _build_table(self, db: Session, table: DocumentTable) -> None:
+        return None
+
+    async def etag(self, db: AsyncSession, table_name: str, *variant: Any) -> str:
+        """
+        테이블 현재 내용과 요청 변형(경로, 쿼리 파라미터 등)의 강한 ETag
+
+        Args:
+            db: 비동기 DB 세션
+            table_name: 응답이 의존하는 테이블
+            variant: 같은 테이블에서 응답을 구분하는 값
+
+        Returns:
+            따옴표로 감싼 ETag 값
+        """
+        entry = await self._ensure_entry_async(db, DOCUMENT_TABLES[table_name])
+        key = repr((settings.APP_VERSION, table_name, entry.signature, variant))
+        return f'"{hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 ETag가 있는지 (RFC 9110: 약한 비교, * 허용)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+# 전역 ETag 인스턴스
+_table_etags: Optional[TableETags] = None
+
+
+def get_table_etags() -> TableETags:
+    """테이블 ETag 싱글톤 인스턴스 반환"""
+    global _table_etags
+    if _table_etags is None:
+        _table_etags = TableETags(refresh_interval=settings.ETAG_REFRESH_INTERVAL)
+        _table_etags.register_listeners()
+    return _table_etags
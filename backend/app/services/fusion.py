@@ -0,0 +1,127 @@
+"""
+하이브리드 검색 결과 통합 (score fusion)
+키워드(BM25)와 벡터(코사인) 검색 결과를 하나의 순위로 합치는 전략 모음
+
+- rrf: 순위 기반 Reciprocal Rank Fusion (점수 척도와 무관)
+- minmax: 목록별 최소-최대 정규화 후 가중합
+- zscore: 목록별 표준 점수 정규화 후 가중합
+- weighted: 원점수 가중합 (키워드 점수 / 10, 유사도 그대로, 기존 방식)
+"""
+import logging
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from app.models.question_log import QuestionCategory
+
+logger = logging.getLogger(__name__)
+
+# 목록별 정규화 점수 (결과 키 → 점수)
+_Scores = Dict[str, float]
+
+
+def _result_key(result: Dict[str, Any]) -> str:
+    """결과 식별 키 (출처 + ID)"""
+    return f"{result.get('source')}_{result.get('id')}"
+
+
+def _rrf_scores(results: List[Dict[str, Any]], field: str, rrf_k: int) -> _Scores:
+    """순위 r(1부터)에 1 / (k + r) 부여"""
+    ranked = sorted(results, key=lambda x: x.get(field, 0), reverse=True)
+    return {_result_key(result): 1.0 / (rrf_k + rank) for rank, result in enumerate(ranked, start=1)}
+
+
+def _minmax_scores(results: List[Dict[str, Any]], field: str, rrf_k: int) -> _Scores:
+    """(s - min) / (max - min), 점수가 모두 같으면 1"""
+    if not results:
+        return {}
+    scores = np.array([result.get(field, 0) for result in results], dtype=np.float64)
+    spread = scores.max() - scores.min()
+    normalized = (scores - scores.min()) / spread if spread > 0 else np.ones_like(scores)
+    return {_result_key(result): float(score) for result, score in zip(results, normalized)}
+
+
+def _zscore_scores(results: List[Dict[str, Any]], field: str, rrf_k: int) -> _Scores:
+    """(s - 평균) / 표준편차, 한쪽 목록에만 있는 결과가 불리하지 않도록 최솟값이 0이 되게 이동"""
+    if not results:
+        return {}
+    scores = np.array([result.get(field, 0) for result in results], dtype=np.float64)
+    std = scores.std()
+    normalized = (scores - scores.mean()) / std if std > 0 else np.zeros_like(scores)
+    normalized -= normalized.min()
+    return {_result_key(result): float(score) for result, score in zip(results, normalized)}
+
+
+def _raw_scores(results: List[Dict[str, Any]], field: str, rrf_k: int) -> _Scores:
+    """원점수 (키워드 점수는 기존과 같이 / 10)"""
+    scale = 10.0 if field == "relevance_score" else 1.0
+    return {_result_key(result): result.get(field, 0) / scale for result in results}
+
+
+# 전략 이름 → 목록별 점수 함수
+FUSION_STRATEGIES: Dict[str, Callable[[List[Dict[str, Any]], str, int], _Scores]] = {
+    "rrf": _rrf_scores,
+    "minmax": _minmax_scores,
+    "zscore": _zscore_scores,
+    "weighted": _raw_scores,
+}
+
+
+def fuse(
+    keyword_results: List[Dict[str, Any]],
+    vector_results: List[Dict[str, Any]],
+    limit: int,
+    strategy: str = "rrf",
+    keyword_weight: float = 0.4,
+    rrf_k: int = 60,
+) -> List[Dict[str, Any]]:
+    """
+    키워드/벡터 검색 결과 통합 (ID 기반 중복 제거 후 final_score 내림차순)
+
+    Args:
+        keyword_results: 키워드 검색 결과 (relevance_score)
+        vector_results: 벡터 검색 결과 (similarity)
+        limit: 최대 결과 수
+        strategy: 통합 전략 (FUSION_STRATEGIES)
+        keyword_weight: 키워드 점수 가중치 (벡터는 1 - keyword_weight)
+        rrf_k: RRF 순위 평활 상수
+
+    Returns:
+        keyword_score, vector_score(원점수)와 final_score가 채워진 결과
+    """
+    score_fn = FUSION_STRATEGIES.get(strategy)
+    if score_fn is None:
+        raise ValueError(f"알 수 없는 통합 전략: {strategy}")
+
+    keyword_scores = score_fn(keyword_results, "relevance_score", rrf_k)
+    vector_scores = score_fn(vector_results, "similarity", rrf_k)
+
+    combined: Dict[str, Dict[str, Any]] = {}
+    for result in keyword_results:
+        combined[_result_key(result)] = {
+            **result, "keyword_score": result.get("relevance_score", 0), "vector_score": 0,
+        }
+    for result in vector_results:
+        key = _result_key(result)
+        if key in combined:
+            combined[key]["vector_score"] = result.get("similarity", 0)
+        else:
+            combined[key] = {**result, "keyword_score": 0, "vector_score": result.get("similarity", 0)}
+
+    for key, result in combined.items():
+        result["final_score"] = (
+            keyword_weight * keyword_scores.get(key, 0.0)
+            + (1 - keyword_weight) * vector_scores.get(key, 0.0)
+        )
+
+    fused = sorted(combined.values(), key=lambda x: x["final_score"], reverse=True)
+    return fused[:limit]
+
+
+def strategy_for_category(category: Optional[QuestionCategory]) -> str:
+    """카테고리별 통합 전략 (SEARCH_FUSION_CATEGORY_STRATEGIES, 없으면 기본 전략)"""
+    from app.core.config import settings
+    key = category.value if isinstance(category, QuestionCategory) else category
+    strategy = settings.SEARCH_FUSION_CATEGORY_STRATEGIES.get(key or "", settings.SEARCH_FUSION_STRATEGY)
+    if strategy not in FUSION_STRATEGIES:
+        logger.warning(f"알 수 없는 통합 전략 {strategy}, 기본 전략 사용")
+        return settings.SEARCH_FUSION_STRATEGY
+    return strategy
@@ -0,0 +1,231 @@
+"""
+키워드 검색 인덱스 (역색인 + BM25)
+한국어 문장을 음절 바이그램으로 토큰화해 부분 일치 없이도 관련 문서를 찾음
+
+상주 인덱스는 워커마다 활성 문서의 검색 결과 형식(원문 포함)과 토큰별 포스팅 배열을 보관하고,
+테이블이 바뀌면 그 테이블 전체를 다시 읽어 재구성함. PostgreSQL에서는 기본적으로 끄고
+(KEYWORD_INDEX_POSTGRESQL) keyword_statement()의 DB 쿼리로 같은 토큰을 찾음
+"""
+import math
+import re
+import time
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy import Select, case, select
+from sqlalchemy.orm import Session
+from app.services.documents import DOCUMENT_TABLES, DocumentTable
+from app.services.resident_index import ResidentIndex, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+# 한글 음절 연속 구간 또는 한글 외 문자/숫자 연속 구간
+_WORD_PATTERN = re.compile(r"[가-힣]+|[^\W가-힣_]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]+")
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 2  # 제목 토큰 가중치 (본문 대비 반복 횟수)
+
+# DB 키워드 검색에 쓰는 최대 쿼리 토큰 수 (ILIKE 조건 수 제한)
+MAX_SQL_QUERY_TOKENS = 16
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    한국어 인식 토큰화
+
+    - 한글 구간: 음절 바이그램 ("수강신청" → 수강, 강신, 신청), 한 글자면 그대로
+    - 영문/숫자 구간: 소문자 단어 그대로
+
+    Args:
+        text: 토큰화할 텍스트
+
+    Returns:
+        토큰 리스트 (중복 포함)
+    """
+    if not text:
+        return []
+
+    tokens: List[str] = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if _HANGUL_PATTERN.fullmatch(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def keyword_statement(table: DocumentTable, query: str, limit: int) -> Optional[Select]:
+    """
+    상주 인덱스 없이 DB에서 키워드 검색하는 구문 (PostgreSQL 기본 경로)
+
+    쿼리 토큰이 제목/본문에 포함되는지 ILIKE로 확인해 일치 수(제목은 TITLE_WEIGHT배)로 점수를 매김
+
+    Args:
+        table: 검색 대상 테이블
+        query: 검색 쿼리
+        limit: 최대 결과 수
+
+    Returns:
+        (행, relevance_score)를 점수 내림차순으로 조회하는 구문 (쿼리 토큰이 없으면 None)
+    """
+    # 토큰은 한글/영문/숫자만 포함하므로 LIKE 와일드카드 이스케이프가 필요 없음
+    tokens = list(dict.fromkeys(tokenize(query)))[:MAX_SQL_QUERY_TOKENS]
+    if not tokens or limit <= 0:
+        return None
+
+    title, body = table.text_columns()
+    score = sum(
+        case((column.ilike(f"%{token}%"), weight), else_=0)
+        for token in tokens
+        for column, weight in ((title, TITLE_WEIGHT), (body, 1))
+    ).label("relevance_score")
+    return (
+        select(table.model, score)
+        .where(*table.active_filter(), score > 0)
+        .order_by(score.desc())
+        .limit(limit)
+    )
+
+
+@dataclass
+class _TableIndex:
+    """테이블 하나의 역색인"""
+    postings: Dict[str, Tuple[np.ndarray, np.ndarray]]  # 토큰 → (문서 번호, 출현 횟수)
+    doc_lengths: np.ndarray
+    avg_length: float
+    payloads: List[Dict[str, Any]]
+
+
+class KeywordIndex(ResidentIndex):
+    """테이블별 역색인을 메모리에 유지하고 BM25로 점수를 매기는 키워드 인덱스"""
+
+    def search(
+        self,
+        db: Session,
+        table_name: str,
+        query: str,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        테이블에서 쿼리와 관련된 문서 검색
+
+        Args:
+            db: 데이터베이스 세션 (인덱스 구성/갱신 확인용)
+            table_name: 검색할 테이블 이름
+            query: 검색 쿼리
+            limit: 최대 결과 수
+
+        Returns:
+            BM25 점수(relevance_score) 내림차순 검색 결과
+        """
+        return self.search_indexes({table_name: self._ensure(db, DOCUMENT_TABLES[table_name])}, query, limit)
+
+    def search_indexes(
+        self,
+        indexes: Dict[str, _TableIndex],
+        query: str,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        refresh()로 가져온 테이블 인덱스들에서 검색 (DB 조회 없음)
+
+        Args:
+            indexes: 테이블 이름 → 인덱스 데이터
+            query: 검색 쿼리
+            limit: 테이블별 최대 결과 수
+
+        Returns:
+            BM25 점수(relevance_score) 내림차순 검색 결과
+        """
+        query_tokens = set(tokenize(query))
+        if not query_tokens or limit <= 0:
+            return []
+
+        results: List[Dict[str, Any]] = []
+        for index in indexes.values():
+            if not index.payloads:
+                continue
+            scores = self._bm25(index, query_tokens)
+            matched = np.flatnonzero(scores > 0)
+            top = matched[top_k_indices(scores[matched], limit)] if matched.size else matched
+            results.extend(
+                {**index.payloads[i], "relevance_score": float(scores[i])}
+                for i in top
+            )
+        results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        return results
+
+    @staticmethod
+    def _bm25(index: _TableIndex, query_tokens: Sequence[str]) -> np.ndarray:
+        """쿼리 토큰별 포스팅 리스트만 순회하며 BM25 점수 누적"""
+        doc_count = len(index.payloads)
+        scores = np.zeros(doc_count, dtype=np.float64)
+        # 문서 길이 정규화 항은 토큰과 무관하므로 한 번만 계산
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * index.doc_lengths / index.avg_length)
+
+        for token in query_tokens:
+            posting = index.postings.get(token)
+            if posting is None:
+                continue
+            docs, freqs = posting
+            idf = math.log(1 + (doc_count - docs.size + 0.5) / (docs.size + 0.5))
+            scores[docs] += idf * freqs * (BM25_K1 + 1) / (freqs + length_norm[docs])
+
+        return scores
+
+    def _row_filter(self, table: DocumentTable) -> List[Any]:
+        """검색 대상(활성) 행만 인덱싱"""
+        return table.active_filter()
+
+    def _build_table(self, db: Session, table: DocumentTable) -> _TableIndex:
+        """DB에서 텍스트를 읽어 역색인 구성"""
+        started = time.perf_counter()
+        rows = db.query(table.model).filter(*self._row_filter(table)).all()
+
+        postings: Dict[str, Tuple[List[int], List[int]]] = defaultdict(lambda: ([], []))
+        doc_lengths: List[int] = []
+        payloads: List[Dict[str, Any]] = []
+
+        for doc, row in enumerate(rows):
+            title, body = table.texts(row)
+            counts = Counter(tokenize(title) * TITLE_WEIGHT + tokenize(body))
+            for token, count in counts.items():
+                docs, freqs = postings[token]
+                docs.append(doc)
+                freqs.append(count)
+            doc_lengths.append(sum(counts.values()))
+            payloads.append(table.to_payload(row))
+
+        lengths = np.asarray(doc_lengths, dtype=np.float64)
+        logger.info(
+            f"키워드 인덱스 구성: {table.name} {len(payloads)}개, 토큰 {len(postings)}종 "
+            f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+        return _TableIndex(
+            postings={
+                token: (np.asarray(docs, dtype=np.int64), np.asarray(freqs, dtype=np.float64))
+                for token, (docs, freqs) in postings.items()
+            },
+            doc_lengths=lengths,
+            avg_length=float(lengths.mean()) if lengths.size and lengths.mean() > 0 else 1.0,
+            payloads=payloads,
+        )
+
+
+# 전역 키워드 인덱스 인스턴스
+_keyword_index: Optional[KeywordIndex] = None
+
+
+def get_keyword_index() -> KeywordIndex:
+    """키워드 인덱스 싱글톤 인스턴스 반환"""
+    global _keyword_index
+    if _keyword_index is None:
+        from app.core.config import settings
+        _keyword_index = KeywordIndex(refresh_interval=settings.SEARCH_INDEX_REFRESH_INTERVAL)
+        _keyword_index.register_listeners()
+    return _keyword_index
@@ -0,0 +1,190 @@
+"""
+질문 로그 비동기 저장소
+요청 경로에서는 메모리 큐에 넣기만 하고, 백그라운드 스레드가 배치 단위로 일괄 INSERT
+"""
+import queue
+import threading
+import time
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.models.question_log import QuestionLog
+
+logger = logging.getLogger(__name__)
+
+# 대기 중인 저장 스레드를 즉시 깨우는 종료 신호
+_STOP = object()
+
+
+class QuestionLogSink:
+    """
+    질문 로그 배치 저장소
+
+    - 제한된 크기의 큐: 가득 차면 요청을 기다리게 하지 않고 로그를 버리고 개수를 기록 (부하 차단)
+    - 배치 크기 또는 시간 임계값에 도달하면 bulk_insert_mappings로 한 번의 트랜잭션에 저장
+    - 종료 시 남은 로그를 모두 저장
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+    ):
+        """
+        로그 저장소 초기화
+
+        Args:
+            session_factory: DB 세션 생성 함수
+            max_queue_size: 최대 대기 로그 수
+            batch_size: 한 번에 저장하는 최대 로그 수
+            flush_interval: 배치가 차지 않아도 저장하는 주기 (초)
+        """
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._flush_lock = threading.Lock()
+        self._stats: Dict[str, int] = defaultdict(int)
+
+    def start(self):
+        """백그라운드 저장 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="question-log-sink", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """스레드 종료 후 남은 로그 저장"""
+        self._stop.set()
+        if self._thread is not None:
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                pass  # 큐가 가득 차 있으면 스레드가 대기 중이 아님
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def submit(self, record: Dict[str, Any]) -> bool:
+        """
+        로그 추가 (대기 없음)
+
+        Args:
+            record: QuestionLog 컬럼 값
+
+        Returns:
+            큐에 들어갔으면 True, 큐가 가득 차서 버려졌으면 False
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._stats["dropped"] += 1
+            if self._stats["dropped"] % 100 == 1:
+                logger.warning(f"질문 로그 큐가 가득 참, 로그 버림 (누적 {self._stats['dropped']}개)")
+            return False
+        self._stats["enqueued"] += 1
+        return True
+
+    def flush(self) -> int:
+        """대기 중인 로그를 모두 저장 (저장한 개수 반환)"""
+        written = 0
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def _run(self):
+        """배치 크기 또는 flush_interval마다 저장"""
+        while not self._stop.is_set():
+            batch: List[Dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stop.is_set():
+                    break
+                try:
+                    record = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if record is _STOP:
+                    break
+                batch.append(record)
+                batch.extend(self._drain(self.batch_size - len(batch)))
+            if batch:
+                self._write(batch)
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        """큐에서 최대 limit개를 대기 없이 꺼냄"""
+        batch = []
+        while len(batch) < limit:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not _STOP:
+                batch.append(record)
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> int:
+        """배치를 한 트랜잭션으로 저장"""
+        started = time.perf_counter()
+        with self._flush_lock:
+            db = self._session_factory()
+            try:
+                db.bulk_insert_mappings(QuestionLog, batch)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                self._stats["failed"] += len(batch)
+                logger.error(f"질문 로그 {len(batch)}개 저장 실패: {e}")
+                return 0
+            finally:
+                db.close()
+        self._stats["written"] += len(batch)
+        self._stats["batches"] += 1
+        logger.debug(f"질문 로그 {len(batch)}개 저장 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+        return len(batch)
+
+    def get_stats(self) -> Dict[str, int]:
+        """큐 길이 및 저장/버림 개수"""
+        return {
+            "queue_size": self._queue.qsize(),
+            **{name: self._stats.get(name, 0) for name in
+               ("enqueued", "written", "batches", "dropped", "failed")},
+        }
+
+
+# 전역 로그 저장소 인스턴스
+_question_log_sink: Optional[QuestionLogSink] = None
+
+
+def get_question_log_sink() -> QuestionLogSink:
+    """질문 로그 저장소 싱글톤 인스턴스 반환 (처음 호출 시 저장 스레드 시작)"""
+    global _question_log_sink
+    if _question_log_sink is None:
+        from app.core.config import settings
+        from app.core.database import SessionLocal
+        _question_log_sink = QuestionLogSink(
+            SessionLocal,
+            max_queue_size=settings.QUESTION_LOG_QUEUE_SIZE,
+            batch_size=settings.QUESTION_LOG_BATCH_SIZE,
+            flush_interval=settings.QUESTION_LOG_FLUSH_INTERVAL,
+        )
+        _question_log_sink.start()
+    return _question_log_sink
+
+
+def shutdown_question_log_sink():
+    """남은 질문 로그 저장 후 저장 스레드 종료 (애플리케이션 종료 시)"""
+    global _question_log_sink
+    if _question_log_sink is not None:
+        _question_log_sink.stop()
+        logger.info(f"질문 로그 저장소 종료: {_question_log_sink.get_stats()}")
+        _question_log_sink = None
@@ -0,0 +1,208 @@
+"""
+상주 검색 인덱스 공통 기반
+DB 테이블 내용을 프로세스 메모리에 인덱싱하고 행 변경 시 자동으로 재구성
+"""
+import asyncio
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.table_version import TableVersion
+from app.services.documents import DOCUMENT_TABLES, DocumentTable
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개 인덱스 (argpartition 후 상위 k개만 정렬, 내림차순)"""
+    if k < scores.size:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+@dataclass
+class _Entry:
+    """테이블 하나의 인덱스 데이터와 갱신 정보"""
+    data: Any
+    signature: Tuple[Any, ...]
+    version: int
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class ResidentIndex(ABC):
+    """
+    테이블별 상주 인덱스 기반 클래스
+
+    - ORM insert/update/delete 이벤트나 다른 프로세스의 테이블 변경 알림(Redis)이 오면 갱신 대상으로 표시
+    - refresh_interval마다 테이블 버전/행 수/최대 ID/최종 수정일 시그니처로 다른 프로세스의 변경 확인
+    - 재구성(DB 조회)은 락 밖에서 수행하고, 결과만 락 안에서 교체
+    - 비동기 호출자는 refresh()를 사용: 같은 테이블 재구성은 이벤트 루프별로 한 번만 실행
+    - 하위 클래스는 _build_table()과 _row_filter()를 구현
+    """
+
+    def __init__(self, refresh_interval: float = 60.0):
+        """
+        인덱스 초기화
+
+        Args:
+            refresh_interval: 다른 프로세스의 변경을 확인하는 주기 (초)
+        """
+        self.refresh_interval = refresh_interval
+        self._tables: Dict[str, _Entry] = {}
+        self._versions: Dict[str, int] = {name: 0 for name in DOCUMENT_TABLES}
+        # 항목 교체/버전 증가만 보호 (DB 조회 중에는 잡지 않음)
+        self._lock = threading.Lock()
+        # 이벤트 루프별 테이블 재구성 락 (single-flight)
+        self._flights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def mark_dirty(self, table_name: str):
+        """테이블 변경 표시 (다음 검색 시 재구성)"""
+        with self._lock:
+            self._versions[table_name] = self._versions.get(table_name, 0) + 1
+
+    def invalidate(self, table_name: Optional[str] = None):
+        """인덱스 무효화"""
+        with self._lock:
+            if table_name:
+                self._tables.pop(table_name, None)
+            else:
+                self._tables.clear()
+
+    def register_listeners(self):
+        """ORM 변경 이벤트와 다른 프로세스의 테이블 변경 알림으로 인덱스를 갱신 대상으로 표시"""
+        from app.core.cache import get_cache_service
+
+        for table in DOCUMENT_TABLES.values():
+            def _on_change(mapper, connection, target, table_name=table.name):
+                self.mark_dirty(table_name)
+
+            for event_name in ("after_insert", "after_update", "after_delete"):
+                event.listen(table.model, event_name, _on_change)
+
+        get_cache_service().add_table_listener(self.mark_dirty)
+
+    def warm(self, db: Session):
+        """모든 테이블 인덱스를 미리 구성 (시작 시 워밍업)"""
+        for table in DOCUMENT_TABLES.values():
+            self._ensure(db, table)
+
+    async def refresh(self, db: AsyncSession, table_names: Sequence[str]) -> Dict[str, Any]:
+        """
+        비동기 세션으로 테이블 인덱스가 최신인지 확인하고 인덱스 데이터 반환
+
+        같은 이벤트 루프에서 동시에 들어온 요청은 테이블별로 한 번만 재구성하고 결과를 공유
+
+        Args:
+            db: 비동기 DB 세션
+            table_names: 테이블 이름 목록
+
+        Returns:
+            테이블 이름 → 인덱스 데이터
+        """
+        indexes: Dict[str, Any] = {}
+        for name in table_names:
+            entry = await self._ensure_entry_async(db, DOCUMENT_TABLES[name])
+            indexes[name] = entry.data
+        return indexes
+
+    @abstractmethod
+    def _row_filter(self, table: DocumentTable) -> List[Any]:
+        """인덱싱 대상 행 필터"""
+
+    @abstractmethod
+    def _build_table(self, db: Session, table: DocumentTable) -> Any:
+        """DB에서 테이블 인덱스 데이터 구성"""
+
+    def _ensure(self, db: Session, table: DocumentTable) -> Any:
+        """인덱스가 최신인지 확인하고 필요하면 재구성"""
+        return self._ensure_entry(db, table).data
+
+    def _fresh_entry(self, table_name: str) -> Optional[_Entry]:
+        """DB 확인 없이 사용할 수 있는 항목 (변경 표시가 없고 확인 주기 안)"""
+        entry = self._tables.get(table_name)
+        if (
+            entry is not None
+            and entry.version == self._versions.get(table_name, 0)
+            and time.monotonic() - entry.checked_at < self.refresh_interval
+        ):
+            return entry
+        return None
+
+    def _ensure_entry(self, db: Session, table: DocumentTable) -> _Entry:
+        """인덱스 항목이 최신인지 확인하고 필요하면 락 밖에서 재구성 후 교체"""
+        entry = self._fresh_entry(table.name)
+        if entry is not None:
+            return entry
+
+        # 시그니처보다 먼저 읽어야 조회 중 들어온 변경 표시를 놓치지 않음
+        version = self._versions.get(table.name, 0)
+        # 다른 프로세스(데이터 입력/임베딩 생성 스크립트 등)의 변경 확인
+        signature = self._signature(db, table)
+        entry = self._tables.get(table.name)
+        if entry is not None and entry.version == version and entry.signature == signature:
+            entry.checked_at = time.monotonic()
+            return entry
+
+        return self._swap(table.name, _Entry(self._build_table(db, table), signature, version))
+
+    async def _ensure_entry_async(self, db: AsyncSession, table: DocumentTable) -> _Entry:
+        """_ensure_entry의 비동기 버전 (테이블별 single-flight)"""
+        entry = self._fresh_entry(table.name)
+        if entry is not None:
+            return entry
+
+        async with self._flight(table.name):
+            # 기다리는 동안 다른 코루틴이 재구성했으면 그 결과 사용
+            entry = self._fresh_entry(table.name)
+            if entry is not None:
+                return entry
+            return await db.run_sync(lambda session: self._ensure_entry(session, table))
+
+    def _flight(self, table_name: str) -> asyncio.Lock:
+        """현재 이벤트 루프의 테이블 재구성 락"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            locks = self._flights.get(loop)
+            if locks is None:
+                locks = self._flights[loop] = {}
+            return locks.setdefault(table_name, asyncio.Lock())
+
+    def _swap(self, table_name: str, entry: _Entry) -> _Entry:
+        """새로 구성한 항목으로 교체 (동시에 구성된 같은 내용이나 더 최신 항목이 있으면 그것을 사용)"""
+        with self._lock:
+            current = self._tables.get(table_name)
+            if current is not None and (
+                current.version > entry.version
+                or (current.version == entry.version and current.signature == entry.signature)
+            ):
+                return current
+            self._tables[table_name] = entry
+            return entry
+
+    def _signature(self, db: Session, table: DocumentTable) -> Tuple[Any, ...]:
+        """
+        테이블 변경 감지용 시그니처 (테이블 버전, 행 수, 최대 ID, 최종 수정일)
+
+        테이블 버전은 ORM 쓰기마다 같은 트랜잭션에서 증가하므로 같은 날 수정, 활성 상태 변경,
+        임베딩 재생성처럼 행 수/수정일이 그대로인 변경도 감지
+        """
+        model = table.model
+        version = (
+            select(TableVersion.version)
+            .where(TableVersion.table_name == table.name)
+            .scalar_subquery()
+        )
+        row = (
+            db.query(version, func.count(model.id), func.max(model.id), func.max(model.updated_at))
+            .filter(*self._row_filter(table))
+            .one()
+        )
+        return tuple(row)
@@ -1,28 +1,182 @@
 """
 검색 서비스 (캐싱 및 쿼리 최적화)
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, text
+import asyncio
+import math
+import time
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, bindparam, text
+from sqlalchemy.sql.elements import TextClause
+from app.core.config import settings
+from app.core.tracing import span
 from app.models.question_log import QuestionCategory
-from app.models.academic_schedule import AcademicSchedule
-from app.models.notice import Notice
-from app.models.support_program import SupportProgram
-from app.models.academic_glossary import AcademicGlossary
+from app.models.academic_schedule import SemesterType
+from app.models.notice import NoticeType
+from app.models.support_program import ProgramType
 from app.services.ai.embeddings import get_embedding_service
-from typing import List, Dict, Any, Optional
-from datetime import date
+from app.services.documents import DocumentTable, tables_for_category
+from app.services.fusion import fuse, strategy_for_category
+from app.services.keyword_index import get_keyword_index, keyword_statement
+from app.services.vector_index import get_vector_index
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_DIMENSION = 384
+
+
+# PostgreSQL 통합 벡터 검색용 테이블별 SELECT (공통 컬럼: doc_table, id, c1~c4, label, distance)
+_PG_VECTOR_SELECTS: Dict[str, str] = {
+    "academic_schedules": """
+        SELECT 'academic_schedules' AS doc_table, id, name AS c1, description AS c2,
+               start_date::text AS c3, end_date::text AS c4, semester::text AS label,
+               embedding <=> :query_vector AS distance
+        FROM academic_schedules
+        WHERE embedding IS NOT NULL
+    """,
+    "notices": """
+        SELECT 'notices' AS doc_table, id, title AS c1, content AS c2,
+               NULL::text AS c3, NULL::text AS c4, notice_type::text AS label,
+               embedding <=> :query_vector AS distance
+        FROM notices
+        WHERE embedding IS NOT NULL AND is_active = 1
+    """,
+    "support_programs": """
+        SELECT 'support_programs' AS doc_table, id, name AS c1, description AS c2,
+               application_method AS c3, NULL::text AS c4, program_type::text AS label,
+               embedding <=> :query_vector AS distance
+        FROM support_programs
+        WHERE embedding IS NOT NULL AND is_active = 1
+    """,
+    "academic_glossary": """
+        SELECT 'academic_glossary' AS doc_table, id, term_ko AS c1, definition AS c2,
+               examples AS c3, NULL::text AS c4, NULL::text AS label,
+               embedding <=> :query_vector AS distance
+        FROM academic_glossary
+        WHERE embedding IS NOT NULL
+    """,
+}
+
+
+# 테이블 조합별 통합 벡터 검색 구문 캐시 (SQL 텍스트가 쿼리마다 동일하므로 컴파일/플랜 재사용 가능)
+_PG_VECTOR_STATEMENTS: Dict[Tuple[str, ...], TextClause] = {}
+
+
+def _pg_vector_statement(table_names: Tuple[str, ...]) -> TextClause:
+    """
+    PostgreSQL 통합 벡터 검색 구문 (테이블 조합별 1회 생성)
+    
+    테이블별 ivfflat 인덱스로 상위 k개를 뽑고 UNION ALL 후 전역 LIMIT (왕복 1회)
+    """
+    statement = _PG_VECTOR_STATEMENTS.get(table_names)
+    if statement is None:
+        from pgvector.sqlalchemy import Vector  # PostgreSQL에서만 필요하므로 지연 import
+        branches = "\n            UNION ALL\n".join(
+            f"({_PG_VECTOR_SELECTS[name]} ORDER BY distance LIMIT :limit)"
+            for name in table_names
+        )
+        statement = text(f"""
+            SELECT doc_table, id, c1, c2, c3, c4, label, 1 - distance AS similarity
+            FROM (
+            {branches}
+            ) AS candidates
+            ORDER BY distance
+            LIMIT :limit
+        """).bindparams(
+            bindparam("query_vector", type_=Vector(EMBEDDING_DIMENSION)),
+            bindparam("limit", type_=Integer),
+        )
+        _PG_VECTOR_STATEMENTS[table_names] = statement
+    return statement
+
+
+def _enum_value(enum_cls, raw: Optional[str]) -> Optional[str]:
+    """DB에 저장된 Enum 이름을 표시용 값으로 변환"""
+    try:
+        return enum_cls[raw].value
+    except KeyError:
+        return raw
+
+
+# 통합 벡터 검색 결과 행 → 검색 결과 딕셔너리 (ORM 경로와 동일한 형식)
+_PG_VECTOR_ROWS = {
+    "academic_schedules": lambda row: {
+        "doc_table": row[0],
+        "id": row[1],
+        "name": row[2],
+        "description": row[3],
+        "start_date": row[4],
+        "end_date": row[5],
+        "source": f"{_enum_value(SemesterType, row[6])} 학사일정",
+        "similarity": float(row[7]),
+    },
+    "notices": lambda row: {
+        "doc_table": row[0],
+        "id": row[1],
+        "title": row[2],
+        "content": row[3],
+        "source": f"{_enum_value(NoticeType, row[6])} 공지사항",
+        "similarity": float(row[7]),
+    },
+    "support_programs": lambda row: {
+        "doc_table": row[0],
+        "id": row[1],
+        "name": row[2],
+        "description": row[3],
+        "application_method": row[4],
+        "source": f"{_enum_value(ProgramType, row[6])} 프로그램",
+        "similarity": float(row[7]),
+    },
+    "academic_glossary": lambda row: {
+        "doc_table": row[0],
+        "id": row[1],
+        "term": row[2],
+        "definition": row[3],
+        "examples": row[4],
+        "source": "학사 용어 사전",
+        "similarity": float(row[7]),
+    },
+}
+
+
+# 기한 초과로 취소한 하이브리드 검색 분기 (취소 완료 전 가비지 컬렉션 방지)
+_cancelled_branches: Set["asyncio.Task"] = set()
+
 
 class SearchService:
-    """검색 서비스 (캐싱 최적화)"""
+    """
+    검색 서비스 (캐싱 최적화, 비동기)
     
-    def __init__(self, db: Session):
+    - PostgreSQL: pgvector 쿼리를 AsyncSession으로 직접 실행
+    - 상주 인덱스(키워드, SQLite 벡터): refresh()로 갱신 확인 후 메모리에서 검색 (재구성은 테이블별 한 번만)
+    - PostgreSQL 키워드 검색: KEYWORD_INDEX_POSTGRESQL=false(기본값)면 상주 인덱스 대신 DB 쿼리
+    - 쿼리 임베딩: 임베딩 서비스 스레드 풀에서 계산
+    - 하이브리드 검색: 상주 인덱스 갱신 확인은 요청 세션에서 한 번, 분기는 동시에 실행 (기한 초과 시 부분 결과)
+    """
+    
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.embedding_service = get_embedding_service()
         self._cache = None  # 캐시 서비스 (지연 로딩)
+        self._keyword_index = None  # 상주 키워드 인덱스 (지연 로딩)
+        self._vector_index = None  # 상주 벡터 인덱스 (지연 로딩)
+    
+    def _get_keyword_index(self):
+        """상주 키워드 인덱스 가져오기"""
+        if self._keyword_index is None:
+            self._keyword_index = get_keyword_index()
+        return self._keyword_index
+    
+    def _uses_keyword_index(self) -> bool:
+        """상주 키워드 인덱스 사용 여부 (PostgreSQL은 KEYWORD_INDEX_POSTGRESQL일 때만)"""
+        return self.db.get_bind().dialect.name != 'postgresql' or settings.KEYWORD_INDEX_POSTGRESQL
+    
+    def _get_vector_index(self):
+        """상주 벡터 인덱스 가져오기 (pgvector 미사용 환경)"""
+        if self._vector_index is None:
+            self._vector_index = get_vector_index()
+        return self._vector_index
     
     def _get_cache(self):
         """캐시 서비스 가져오기"""
@@ -35,12 +189,13 @@ class SearchService:
                 self._cache = None
         return self._cache
     
-    def search_by_vector(
+    async def search_by_vector(
         self,
         query: str,
         category: Optional[QuestionCategory] = None,
         limit: int = 5,
         use_cache: bool = True,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         벡터 기반 의미 검색 (캐싱 지원)
@@ -50,6 +205,7 @@ class SearchService:
             category: 질문 카테고리 (선택)
             limit: 최대 결과 수
             use_cache: 캐시 사용 여부
+            query_embedding: 호출자가 이미 계산한 쿼리 임베딩 (없으면 계산)
             
         Returns:
             검색 결과 리스트
@@ -59,33 +215,19 @@ class SearchService:
             cache = self._get_cache()
             if cache:
                 filters = {"category": category.value if category else None, "limit": limit}
-                cached_result = cache.get_search_result(query, filters)
+                with span("search_cache"):
+                    cached_result = cache.get_search_result(query, filters)
                 if cached_result:
                     logger.debug(f"검색 캐시 히트: {query}")
                     return cached_result
         
         try:
-            # 쿼리를 벡터로 변환 (캐싱 활성화)
-            query_embedding = self.embedding_service.get_embedding(query, use_cache=use_cache)
-            query_vector_str = str(query_embedding)
-            
-            results: List[Dict[str, Any]] = []
-            
-            if category is None or category == QuestionCategory.ACADEMIC_SCHEDULE:
-                results.extend(self._vector_search_schedules(query_vector_str, limit))
+            # 쿼리를 벡터로 변환 (캐싱 활성화, 이미 계산한 임베딩은 재사용)
+            query_embedding = await self._query_embedding(query, use_cache, query_embedding)
             
-            if category is None or category == QuestionCategory.NOTICE:
-                results.extend(self._vector_search_notices(query_vector_str, limit))
-            
-            if category is None or category == QuestionCategory.SUPPORT_PROGRAM:
-                results.extend(self._vector_search_programs(query_vector_str, limit))
-            
-            if category is None or category == QuestionCategory.ACADEMIC_INFO:
-                results.extend(self._vector_search_glossary(query_vector_str, limit))
-            
-            # 유사도 점수로 정렬
-            results.sort(key=lambda x: x.get("similarity", 0), reverse=True)
-            final_results = results[:limit]
+            # 대상 테이블 전체에서 한 번의 비교로 전역 상위 k개 검색
+            tables = tables_for_category(category)
+            final_results = await self._vector_search(query_embedding, tables, limit)
             
             # 결과 캐싱
             if use_cache:
@@ -99,83 +241,210 @@ class SearchService:
         except Exception as e:
             logger.error(f"벡터 검색 중 오류: {e}")
             # 폴백: 키워드 검색
-            return self.search(query, category or QuestionCategory.ACADEMIC_INFO, limit, use_cache=False)
+            return await self.search(query, category or QuestionCategory.ACADEMIC_INFO, limit, use_cache=False)
     
-    def hybrid_search(
+    async def hybrid_search(
         self,
         query: str,
         category: Optional[QuestionCategory] = None,
         limit: int = 5,
         use_cache: bool = True,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        하이브리드 검색 (키워드 + 벡터, 캐싱 지원)
+        하이브리드 검색 (키워드 + 벡터, 카테고리별 통합 전략, 캐싱 지원)
         
         Args:
             query: 검색 쿼리
             category: 질문 카테고리 (선택)
             limit: 최대 결과 수
             use_cache: 캐시 사용 여부
+            query_embedding: 호출자가 이미 계산한 쿼리 임베딩 (없으면 계산)
             
         Returns:
             검색 결과 리스트
         """
+        strategy = strategy_for_category(category)
+        filters = {
+            "category": category.value if category else None,
+            "limit": limit,
+            "hybrid": True,
+            "fusion": strategy,
+        }
+        
         # 캐시 확인
         if use_cache:
             cache = self._get_cache()
             if cache:
-                filters = {"category": category.value if category else None, "limit": limit, "hybrid": True}
-                cached_result = cache.get_search_result(query, filters)
+                with span("search_cache"):
+                    cached_result = cache.get_search_result(query, filters)
                 if cached_result:
                     logger.debug(f"하이브리드 검색 캐시 히트: {query}")
                     return cached_result
         
-        # 키워드 검색
-        keyword_results = self.search(query, category or QuestionCategory.ACADEMIC_INFO, limit * 2, use_cache=False)
-        
-        # 벡터 검색
-        vector_results = self.search_by_vector(query, category, limit * 2, use_cache=use_cache)
-        
-        # 결과 통합 (ID 기반 중복 제거)
-        combined_results = {}
+        # 분기별 후보 수 (순위 기반 통합은 후보를 많이 가져올 필요가 없음)
+        candidates = max(limit, math.ceil(limit * settings.HYBRID_SEARCH_CANDIDATE_FACTOR))
         
-        for result in keyword_results:
-            key = f"{result.get('source')}_{result.get('id')}"
-            combined_results[key] = result
-            combined_results[key]['keyword_score'] = result.get('relevance_score', 0)
-            combined_results[key]['vector_score'] = 0
-        
-        for result in vector_results:
-            key = f"{result.get('source')}_{result.get('id')}"
-            if key in combined_results:
-                combined_results[key]['vector_score'] = result.get('similarity', 0)
-            else:
-                combined_results[key] = result
-                combined_results[key]['keyword_score'] = 0
-                combined_results[key]['vector_score'] = result.get('similarity', 0)
-        
-        # 최종 점수 계산 (키워드 40% + 벡터 60%)
-        for key in combined_results:
-            result = combined_results[key]
-            keyword_normalized = result.get('keyword_score', 0) / 10  # 0-1 범위로 정규화
-            vector_normalized = result.get('vector_score', 0)  # 이미 0-1 범위
-            result['final_score'] = (keyword_normalized * 0.4) + (vector_normalized * 0.6)
+        partial = False
+        if settings.HYBRID_SEARCH_CONCURRENT:
+            # 쿼리 임베딩, 키워드 검색, 테이블별 벡터 검색을 동시에 실행 (지연시간 = 가장 느린 분기)
+            keyword_results, vector_results, partial = await self._retrieve_concurrently(
+                query, category, candidates, use_cache, settings.HYBRID_SEARCH_DEADLINE, query_embedding
+            )
+        else:
+            # 키워드 검색
+            keyword_results = await self.search(query, category or QuestionCategory.ACADEMIC_INFO, candidates, use_cache=False)
+            
+            # 벡터 검색
+            vector_results = await self.search_by_vector(
+                query, category, candidates, use_cache=use_cache, query_embedding=query_embedding
+            )
         
-        # 최종 점수로 정렬
-        final_results = list(combined_results.values())
-        final_results.sort(key=lambda x: x.get('final_score', 0), reverse=True)
-        final_results = final_results[:limit]
+        # 결과 통합 (카테고리별 전략)
+        with span("fusion"):
+            final_results = fuse(
+                keyword_results,
+                vector_results,
+                limit,
+                strategy=strategy,
+                keyword_weight=settings.SEARCH_FUSION_KEYWORD_WEIGHT,
+                rrf_k=settings.SEARCH_FUSION_RRF_K,
+            )
         
-        # 결과 캐싱
-        if use_cache:
+        # 결과 캐싱 (기한 초과로 일부 분기가 빠진 결과는 캐싱하지 않음)
+        if use_cache and not partial:
             cache = self._get_cache()
             if cache:
-                filters = {"category": category.value if category else None, "limit": limit, "hybrid": True}
                 cache.set_search_result(query, final_results, filters)
         
         return final_results
     
-    def search(
+    async def _retrieve_concurrently(
+        self,
+        query: str,
+        category: Optional[QuestionCategory],
+        limit: int,
+        use_cache: bool,
+        deadline: float,
+        query_embedding: Optional[List[float]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], bool]:
+        """
+        하이브리드 검색 분기 동시 실행
+        
+        - 상주 인덱스(키워드, SQLite 벡터) 갱신 확인은 분기 시작 전에 요청 세션에서 한 번만 수행
+        - 쿼리 임베딩(스레드 풀), 키워드 검색(메모리), 벡터 검색을 각각 태스크로 실행
+        - 별도 세션(연결)은 pgvector 쿼리 분기만 사용하므로 검색 하나가 쓰는 연결은 최대 2개
+        - deadline 초가 지나면 남은 분기를 취소하고 완료된 분기 결과만 반환
+        
+        Args:
+            query: 검색 쿼리
+            category: 질문 카테고리 (선택)
+            limit: 분기별 최대 결과 수
+            use_cache: 임베딩 캐시 사용 여부
+            deadline: 분기 대기 한도 (초)
+            query_embedding: 호출자가 이미 계산한 쿼리 임베딩 (없으면 임베딩 분기에서 계산)
+            
+        Returns:
+            (키워드 결과, 벡터 결과, 일부 분기 누락 여부)
+        """
+        started = time.perf_counter()
+        keyword_tables, per_table_limit = self._keyword_tables(
+            category or QuestionCategory.ACADEMIC_INFO, limit
+        )
+        vector_tables = tables_for_category(category)
+        
+        # 분기 태스크는 요청 세션을 쓰지 않도록 인덱스 갱신 확인을 먼저 수행
+        keyword_indexes = None
+        if self._uses_keyword_index():
+            keyword_indexes = await self._get_keyword_index().refresh(
+                self.db, [table.name for table in keyword_tables]
+            )
+        vector_indexes = None
+        if self.db.get_bind().dialect.name != 'postgresql':
+            vector_indexes = await self._get_vector_index().refresh(
+                self.db, [table.name for table in vector_tables]
+            )
+        
+        embedding_task = asyncio.create_task(self._query_embedding(query, use_cache, query_embedding))
+        keyword_task = asyncio.create_task(
+            self._keyword_search(query, keyword_tables, per_table_limit, indexes=keyword_indexes)
+        )
+        vector_task = asyncio.create_task(
+            self._vector_branch(embedding_task, vector_tables, limit, vector_indexes)
+        )
+        
+        tasks = [keyword_task, vector_task]
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in (*pending, embedding_task):
+            if not task.done():
+                # 취소 정리(세션 반환)가 끝날 때까지 태스크 참조 유지
+                task.cancel()
+                _cancelled_branches.add(task)
+                task.add_done_callback(_cancelled_branches.discard)
+        
+        outcomes: Dict["asyncio.Task", Optional[List[Dict[str, Any]]]] = {}
+        for task in tasks:
+            if task not in done:
+                outcomes[task] = None
+            elif task.exception() is not None:
+                logger.warning(f"하이브리드 검색 분기 실패: {task.exception()}")
+                outcomes[task] = None
+            else:
+                outcomes[task] = task.result()
+        
+        keyword_results = outcomes[keyword_task] or []
+        vector_results = outcomes[vector_task] or []
+        
+        partial = any(result is None for result in outcomes.values())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if pending:
+            logger.warning(
+                f"하이브리드 검색 기한 초과 ({deadline}s): {len(pending)}/{len(tasks)}개 분기 제외, "
+                f"완료된 결과만 사용 ({elapsed_ms:.1f}ms)"
+            )
+        else:
+            logger.debug(f"하이브리드 검색 분기 {len(tasks)}개 완료 ({elapsed_ms:.1f}ms)")
+        return keyword_results[:limit], vector_results, partial
+    
+    async def _vector_branch(
+        self,
+        embedding_task: "asyncio.Task",
+        tables: List[DocumentTable],
+        limit: int,
+        indexes: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        쿼리 임베딩 완료 후 벡터 검색
+        
+        - 상주 벡터 인덱스(indexes): 메모리에서 계산 (세션 사용 없음)
+        - PostgreSQL: 대상 테이블 전체를 통합 쿼리 하나로 별도 세션에서 실행
+        """
+        query_embedding = await embedding_task
+        if not tables:
+            return []
+        if indexes is not None:
+            return await self._vector_search(query_embedding, tables, limit, indexes=indexes)
+        return await self._isolated(
+            lambda db: self._vector_search(query_embedding, tables, limit, db=db)
+        )
+    
+    async def _query_embedding(
+        self,
+        query: str,
+        use_cache: bool,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[float]:
+        """쿼리 임베딩 (호출자가 넘긴 임베딩이 있으면 다시 계산하지 않음)"""
+        if query_embedding is not None:
+            return query_embedding
+        return await self.embedding_service.get_embedding_async(query, use_cache=use_cache)
+    
+    async def _isolated(self, operation: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        """요청 세션과 같은 엔진의 별도 세션에서 실행 (동시 분기용)"""
+        async with AsyncSession(self.db.bind, expire_on_commit=False, autoflush=False) as db:
+            return await operation(db)
+    
+    async def search(
         self,
         query: str,
         category: QuestionCategory,
@@ -204,25 +473,9 @@ class SearchService:
                     logger.debug(f"키워드 검색 캐시 히트: {query}")
                     return cached_result
         
-        results: List[Dict[str, Any]] = []
-        
-        if category == QuestionCategory.ACADEMIC_SCHEDULE:
-            results.extend(self._search_schedules(query, limit))
-        elif category == QuestionCategory.NOTICE:
-            results.extend(self._search_notices(query, limit))
-        elif category == QuestionCategory.SUPPORT_PROGRAM:
-            results.extend(self._search_programs(query, limit))
-        elif category == QuestionCategory.ACADEMIC_INFO:
-            results.extend(self._search_terms(query, limit))
-        else:
-            # 모든 카테고리에서 검색
-            results.extend(self._search_schedules(query, limit // 4))
-            results.extend(self._search_notices(query, limit // 4))
-            results.extend(self._search_programs(query, limit // 4))
-            results.extend(self._search_terms(query, limit // 4))
-        
-        # 관련성 점수로 정렬
-        results.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
+        tables, per_table_limit = self._keyword_tables(category, limit)
+        # 관련성 점수 내림차순
+        results = await self._keyword_search(query, tables, per_table_limit)
         final_results = results[:limit]
         
         # 결과 캐싱
@@ -234,350 +487,103 @@ class SearchService:
         
         return final_results
     
-    def _search_schedules(self, query: str, limit: int) -> List[Dict[str, Any]]:
-        """학사 일정 검색"""
-        schedules = (
-            self.db.query(AcademicSchedule)
-            .filter(
-                or_(
-                    AcademicSchedule.name.ilike(f"%{query}%"),
-                    AcademicSchedule.description.ilike(f"%{query}%"),
-                )
-            )
-            .order_by(AcademicSchedule.importance.desc(), AcademicSchedule.start_date.desc())
-            .limit(limit)
-            .all()
-        )
-        
-        return [
-            {
-                "id": schedule.id,
-                "name": schedule.name,
-                "description": schedule.description,
-                "start_date": schedule.start_date.isoformat() if schedule.start_date else None,
-                "end_date": schedule.end_date.isoformat() if schedule.end_date else None,
-                "source": f"{schedule.semester.value} 학사일정",
-                "relevance_score": self._calculate_relevance(query, schedule.name, schedule.description),
-            }
-            for schedule in schedules
-        ]
+    @staticmethod
+    def _keyword_tables(category: QuestionCategory, limit: int) -> Tuple[List[DocumentTable], int]:
+        """키워드 검색 대상 테이블과 테이블별 최대 결과 수"""
+        tables = tables_for_category(category)
+        if tables:
+            return tables, limit
+        # 모든 카테고리에서 검색
+        return tables_for_category(None), limit // 4
     
-    def _search_notices(self, query: str, limit: int) -> List[Dict[str, Any]]:
-        """공지사항 검색"""
-        notices = (
-            self.db.query(Notice)
-            .filter(
-                and_(
-                    Notice.is_active == 1,
-                    or_(
-                        Notice.title.ilike(f"%{query}%"),
-                        Notice.content.ilike(f"%{query}%"),
-                    ),
-                )
-            )
-            .order_by(Notice.importance.desc(), Notice.created_at.desc())
-            .limit(limit)
-            .all()
-        )
-        
-        return [
-            {
-                "id": notice.id,
-                "title": notice.title,
-                "content": notice.content,
-                "source": f"{notice.notice_type.value} 공지사항",
-                "relevance_score": self._calculate_relevance(query, notice.title, notice.content),
-            }
-            for notice in notices
-        ]
-    
-    def _search_programs(self, query: str, limit: int) -> List[Dict[str, Any]]:
-        """지원 프로그램 검색"""
-        programs = (
-            self.db.query(SupportProgram)
-            .filter(
-                and_(
-                    SupportProgram.is_active == 1,
-                    or_(
-                        SupportProgram.name.ilike(f"%{query}%"),
-                        SupportProgram.description.ilike(f"%{query}%"),
-                    ),
-                )
-            )
-            .order_by(SupportProgram.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+    async def _keyword_search(
+        self,
+        query: str,
+        tables: List[DocumentTable],
+        limit: int,
+        indexes: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        테이블 키워드 검색 (역색인 + BM25, 상주 인덱스를 쓰지 않으면 DB 쿼리)
         
-        return [
-            {
-                "id": program.id,
-                "name": program.name,
-                "description": program.description,
-                "application_method": program.application_method,
-                "source": f"{program.program_type.value} 프로그램",
-                "relevance_score": self._calculate_relevance(query, program.name, program.description),
-            }
-            for program in programs
-        ]
+        Args:
+            query: 검색 쿼리
+            tables: 검색 대상 테이블
+            limit: 테이블별 최대 결과 수
+            indexes: 이미 갱신 확인한 인덱스 (없으면 요청 세션으로 확인)
+            
+        Returns:
+            관련성 점수(relevance_score) 내림차순 검색 결과
+        """
+        with span("keyword_search"):
+            if indexes is None and not self._uses_keyword_index():
+                return await self._db_keyword_search(query, tables, limit)
+            index = self._get_keyword_index()
+            if indexes is None:
+                indexes = await index.refresh(self.db, [table.name for table in tables])
+            return index.search_indexes(indexes, query, limit)
     
-    def _search_terms(self, query: str, limit: int) -> List[Dict[str, Any]]:
-        """학사 용어 검색"""
-        from app.models.academic_glossary import AcademicGlossary
-        
-        terms = (
-            self.db.query(AcademicGlossary)
-            .filter(
-                or_(
-                    AcademicGlossary.term_ko.ilike(f"%{query}%"),
-                    AcademicGlossary.definition.ilike(f"%{query}%"),
-                )
+    async def _db_keyword_search(
+        self,
+        query: str,
+        tables: List[DocumentTable],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """DB 키워드 검색 (요청 세션 사용, 점수는 제목 가중 토큰 일치 수)"""
+        results: List[Dict[str, Any]] = []
+        for table in tables:
+            statement = keyword_statement(table, query, limit)
+            if statement is None:
+                return []
+            rows = (await self.db.execute(statement)).all()
+            results.extend(
+                {**table.to_payload(row), "relevance_score": float(score)}
+                for row, score in rows
             )
-            .limit(limit)
-            .all()
-        )
-        
-        return [
-            {
-                "id": term.id,
-                "term": term.term_ko,
-                "definition": term.definition,
-                "examples": term.examples,
-                "source": "학사 용어 사전",
-                "relevance_score": self._calculate_relevance(query, term.term_ko, term.definition),
-            }
-            for term in terms
-        ]
+        results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        return results
     
-    def _vector_search_schedules(self, query_vector: str, limit: int) -> List[Dict[str, Any]]:
-        """벡터 기반 학사 일정 검색"""
-        # 데이터베이스 타입 확인
-        bind = self.db.get_bind()
-        is_postgresql = bind.dialect.name == 'postgresql'
-        
-        if is_postgresql:
-            query = text(f"""
-                SELECT id, name, description, start_date, end_date, semester,
-                       1 - (embedding <=> '{query_vector}'::vector) as similarity
-                FROM academic_schedules
-                WHERE embedding IS NOT NULL
-                ORDER BY embedding <=> '{query_vector}'::vector
-                LIMIT :limit
-            """)
-        else:
-            # SQLite는 벡터 검색을 지원하지 않으므로 모든 레코드를 가져와서 Python에서 계산
-            schedules = self.db.query(AcademicSchedule).filter(
-                AcademicSchedule.embedding.isnot(None)
-            ).all()
-            
-            import json
-            query_embedding = json.loads(query_vector) if isinstance(query_vector, str) else query_vector
-            
-            results = []
-            for schedule in schedules:
-                if schedule.embedding:
-                    embedding = json.loads(schedule.embedding) if isinstance(schedule.embedding, str) else schedule.embedding
-                    similarity = self.embedding_service.compute_similarity(query_embedding, embedding)
-                    results.append({
-                        "id": schedule.id,
-                        "name": schedule.name,
-                        "description": schedule.description,
-                        "start_date": schedule.start_date.isoformat() if schedule.start_date else None,
-                        "end_date": schedule.end_date.isoformat() if schedule.end_date else None,
-                        "source": f"{schedule.semester.value} 학사일정",
-                        "similarity": similarity,
-                    })
-            
-            # 유사도로 정렬
-            results.sort(key=lambda x: x["similarity"], reverse=True)
-            return results[:limit]
-        
-        results = self.db.execute(query, {"limit": limit}).fetchall()
-        
-        return [
-            {
-                "id": row[0],
-                "name": row[1],
-                "description": row[2],
-                "start_date": row[3].isoformat() if row[3] else None,
-                "end_date": row[4].isoformat() if row[4] else None,
-                "source": f"{row[5]} 학사일정",
-                "similarity": float(row[6]),
-            }
-            for row in results
-        ]
-    
-    def _vector_search_notices(self, query_vector: str, limit: int) -> List[Dict[str, Any]]:
-        """벡터 기반 공지사항 검색"""
-        bind = self.db.get_bind()
-        is_postgresql = bind.dialect.name == 'postgresql'
+    async def _vector_search(
+        self,
+        query_embedding: List[float],
+        tables: List[DocumentTable],
+        limit: int,
+        db: Optional[AsyncSession] = None,
+        indexes: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 테이블 통합 벡터 검색 (단일 패스)
         
-        if is_postgresql:
-            query = text(f"""
-                SELECT id, title, content, notice_type,
-                       1 - (embedding <=> '{query_vector}'::vector) as similarity
-                FROM notices
-                WHERE embedding IS NOT NULL AND is_active = 1
-                ORDER BY embedding <=> '{query_vector}'::vector
-                LIMIT :limit
-            """)
-            results = self.db.execute(query, {"limit": limit}).fetchall()
-            
-            return [
-                {
-                    "id": row[0],
-                    "title": row[1],
-                    "content": row[2],
-                    "source": f"{row[3]} 공지사항",
-                    "similarity": float(row[4]),
-                }
-                for row in results
-            ]
-        else:
-            # SQLite: Python에서 유사도 계산
-            notices = self.db.query(Notice).filter(
-                Notice.embedding.isnot(None),
-                Notice.is_active == 1
-            ).all()
-            
-            import json
-            query_embedding = json.loads(query_vector) if isinstance(query_vector, str) else query_vector
-            
-            results = []
-            for notice in notices:
-                if notice.embedding:
-                    embedding = json.loads(notice.embedding) if isinstance(notice.embedding, str) else notice.embedding
-                    similarity = self.embedding_service.compute_similarity(query_embedding, embedding)
-                    results.append({
-                        "id": notice.id,
-                        "title": notice.title,
-                        "content": notice.content,
-                        "source": f"{notice.notice_type.value} 공지사항",
-                        "similarity": similarity,
-                    })
+        Args:
+            query_embedding: 쿼리 임베딩
+            tables: 검색 대상 테이블
+            limit: 최대 결과 수 (전역)
+            db: 사용할 세션 (기본값: 요청 세션)
+            indexes: 이미 갱신 확인한 상주 벡터 인덱스 (pgvector 미사용 환경)
             
-            results.sort(key=lambda x: x["similarity"], reverse=True)
-            return results[:limit]
-    
-    def _vector_search_programs(self, query_vector: str, limit: int) -> List[Dict[str, Any]]:
-        """벡터 기반 지원 프로그램 검색"""
-        bind = self.db.get_bind()
-        is_postgresql = bind.dialect.name == 'postgresql'
+        Returns:
+            유사도 내림차순 검색 결과
+        """
+        if not tables:
+            return []
+        db = db or self.db
         
-        if is_postgresql:
-            query = text(f"""
-                SELECT id, name, description, application_method, program_type,
-                       1 - (embedding <=> '{query_vector}'::vector) as similarity
-                FROM support_programs
-                WHERE embedding IS NOT NULL AND is_active = 1
-                ORDER BY embedding <=> '{query_vector}'::vector
-                LIMIT :limit
-            """)
-            results = self.db.execute(query, {"limit": limit}).fetchall()
-            
-            return [
-                {
-                    "id": row[0],
-                    "name": row[1],
-                    "description": row[2],
-                    "application_method": row[3],
-                    "source": f"{row[4]} 프로그램",
-                    "similarity": float(row[5]),
-                }
-                for row in results
-            ]
-        else:
-            programs = self.db.query(SupportProgram).filter(
-                SupportProgram.embedding.isnot(None),
-                SupportProgram.is_active == 1
-            ).all()
-            
-            import json
-            query_embedding = json.loads(query_vector) if isinstance(query_vector, str) else query_vector
-            
-            results = []
-            for program in programs:
-                if program.embedding:
-                    embedding = json.loads(program.embedding) if isinstance(program.embedding, str) else program.embedding
-                    similarity = self.embedding_service.compute_similarity(query_embedding, embedding)
-                    results.append({
-                        "id": program.id,
-                        "name": program.name,
-                        "description": program.description,
-                        "application_method": program.application_method,
-                        "source": f"{program.program_type.value} 프로그램",
-                        "similarity": similarity,
-                    })
-            
-            results.sort(key=lambda x: x["similarity"], reverse=True)
-            return results[:limit]
-    
-    def _vector_search_glossary(self, query_vector: str, limit: int) -> List[Dict[str, Any]]:
-        """벡터 기반 학사 용어 검색"""
-        bind = self.db.get_bind()
+        # 데이터베이스 타입 확인
+        bind = db.get_bind()
         is_postgresql = bind.dialect.name == 'postgresql'
         
-        if is_postgresql:
-            query = text(f"""
-                SELECT id, term_ko, definition, examples,
-                       1 - (embedding <=> '{query_vector}'::vector) as similarity
-                FROM academic_glossary
-                WHERE embedding IS NOT NULL
-                ORDER BY embedding <=> '{query_vector}'::vector
-                LIMIT :limit
-            """)
-            results = self.db.execute(query, {"limit": limit}).fetchall()
-            
-            return [
-                {
-                    "id": row[0],
-                    "term": row[1],
-                    "definition": row[2],
-                    "examples": row[3],
-                    "source": "학사 용어 사전",
-                    "similarity": float(row[4]),
-                }
-                for row in results
-            ]
-        else:
-            terms = self.db.query(AcademicGlossary).filter(
-                AcademicGlossary.embedding.isnot(None)
-            ).all()
+        with span("vector_search"):
+            if not is_postgresql:
+                # SQLite는 벡터 검색을 지원하지 않으므로 상주 벡터 인덱스의 통합 행렬에서 계산
+                index = self._get_vector_index()
+                if indexes is None:
+                    indexes = await index.refresh(db, [table.name for table in tables])
+                return index.search_indexes(indexes, query_embedding, limit)
             
-            import json
-            query_embedding = json.loads(query_vector) if isinstance(query_vector, str) else query_vector
-            
-            results = []
-            for term in terms:
-                if term.embedding:
-                    embedding = json.loads(term.embedding) if isinstance(term.embedding, str) else term.embedding
-                    similarity = self.embedding_service.compute_similarity(query_embedding, embedding)
-                    results.append({
-                        "id": term.id,
-                        "term": term.term_ko,
-                        "definition": term.definition,
-                        "examples": term.examples,
-                        "source": "학사 용어 사전",
-                        "similarity": similarity,
-                    })
-            
-            results.sort(key=lambda x: x["similarity"], reverse=True)
-            return results[:limit]
-    
-    def _calculate_relevance(self, query: str, *texts: str) -> int:
-        """관련성 점수 계산 (간단한 키워드 매칭 개수)"""
-        query_lower = query.lower()
-        score = 0
-        
-        for text in texts:
-            if text:
-                text_lower = text.lower()
-                # 키워드가 포함된 횟수 계산
-                score += text_lower.count(query_lower)
-                # 개별 단어 매칭
-                query_words = query_lower.split()
-                for word in query_words:
-                    if len(word) > 2 and word in text_lower:
-                        score += 1
+            # 쿼리 벡터는 pgvector 타입 파라미터로 바인딩 (테이블 조합별로 캐싱된 구문 재사용)
+            query = _pg_vector_statement(tuple(table.name for table in tables))
+            results = (await db.execute(
+                query, {"query_vector": query_embedding, "limit": limit}
+            )).fetchall()
         
-        return score
+        return [_PG_VECTOR_ROWS[row[0]](row) for row in results]
@@ -0,0 +1,197 @@
+"""
+상주 벡터 인덱스 (SQLite 등 pgvector가 없는 환경용)
+테이블별로 정규화된 float32 행렬을 메모리에 유지하고 행렬-벡터 곱 한 번으로 유사도를 계산
+"""
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
+from app.services.documents import DOCUMENT_TABLES, DocumentTable
+from app.services.resident_index import ResidentIndex, top_k_indices
+from app.utils.embedding_codec import to_vector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _TableIndex:
+    """테이블 하나의 벡터 인덱스 데이터"""
+    ids: np.ndarray
+    matrix: np.ndarray  # (N, D), 행 단위 L2 정규화
+    payloads: List[Dict[str, Any]]
+
+
+class VectorIndex(ResidentIndex):
+    """테이블별 정규화 임베딩 행렬을 메모리에 유지하는 벡터 인덱스"""
+
+    def __init__(self, refresh_interval: float = 60.0):
+        """
+        벡터 인덱스 초기화
+
+        Args:
+            refresh_interval: 다른 프로세스의 변경을 확인하는 주기 (초)
+        """
+        super().__init__(refresh_interval)
+        self._combined_cache: Dict[Tuple[str, ...], Tuple[Any, ...]] = {}
+
+    def invalidate(self, table_name: Optional[str] = None):
+        """인덱스 무효화"""
+        super().invalidate(table_name)
+        with self._lock:
+            self._combined_cache.clear()
+
+    def search(
+        self,
+        db: Session,
+        table_name: str,
+        query_embedding: Sequence[float],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        테이블에서 쿼리 벡터와 가장 유사한 문서 검색
+
+        Args:
+            db: 데이터베이스 세션 (인덱스 구성/갱신 확인용)
+            table_name: 검색할 테이블 이름
+            query_embedding: 쿼리 임베딩
+            limit: 최대 결과 수
+
+        Returns:
+            유사도 내림차순 검색 결과 (similarity: 0~1)
+        """
+        return self.search_tables(db, [table_name], query_embedding, limit)
+
+    def search_tables(
+        self,
+        db: Session,
+        table_names: Sequence[str],
+        query_embedding: Sequence[float],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 테이블을 합친 행렬에서 전역 상위 k개 검색 (행렬-벡터 곱 1회)
+
+        Args:
+            db: 데이터베이스 세션 (인덱스 구성/갱신 확인용)
+            table_names: 검색할 테이블 이름 목록
+            query_embedding: 쿼리 임베딩
+            limit: 최대 결과 수 (전역)
+
+        Returns:
+            유사도 내림차순 검색 결과 (similarity: 0~1)
+        """
+        indexes = {name: self._ensure(db, DOCUMENT_TABLES[name]) for name in table_names}
+        return self.search_indexes(indexes, query_embedding, limit)
+
+    def search_indexes(
+        self,
+        indexes: Dict[str, _TableIndex],
+        query_embedding: Sequence[float],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        refresh()로 가져온 테이블 인덱스들에서 전역 상위 k개 검색 (DB 조회 없음)
+
+        Args:
+            indexes: 테이블 이름 → 인덱스 데이터
+            query_embedding: 쿼리 임베딩
+            limit: 최대 결과 수 (전역)
+
+        Returns:
+            유사도 내림차순 검색 결과 (similarity: 0~1)
+        """
+        matrix, payloads = self._combined(indexes)
+        if not payloads or limit <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        scores = matrix @ (query / norm)
+        top = top_k_indices(scores, limit)
+
+        return [
+            {
+                **payloads[i],
+                # compute_similarity와 동일하게 -1~1 범위를 0~1 범위로 변환
+                "similarity": float((scores[i] + 1) / 2),
+            }
+            for i in top
+        ]
+
+    def _combined(
+        self, indexes: Dict[str, _TableIndex]
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """테이블 인덱스들을 이어 붙인 통합 행렬 (구성 테이블이 바뀔 때만 재생성)"""
+        table_names = tuple(indexes)
+        parts = [index for index in indexes.values() if index.ids.size]
+        if len(parts) == 1:
+            return parts[0].matrix, parts[0].payloads
+
+        key = tuple(id(index) for index in parts)
+        cached = self._combined_cache.get(table_names)
+        if cached is None or cached[0] != key:
+            if parts:
+                matrix = np.vstack([index.matrix for index in parts])
+                payloads = [payload for index in parts for payload in index.payloads]
+            else:
+                matrix, payloads = np.zeros((0, 0), dtype=np.float32), []
+            # 구성 인덱스 객체를 함께 보관해 id() 재사용으로 인한 오판을 방지
+            cached = (key, matrix, payloads, parts)
+            with self._lock:
+                self._combined_cache[table_names] = cached
+        return cached[1], cached[2]
+
+    def _row_filter(self, table: DocumentTable) -> List[Any]:
+        """임베딩이 있는 검색 대상 행만 인덱싱"""
+        return [table.model.embedding.isnot(None), *table.active_filter()]
+
+    def _build_table(self, db: Session, table: DocumentTable) -> _TableIndex:
+        """DB에서 임베딩을 읽어 인덱스 구성"""
+        started = time.perf_counter()
+        rows = db.query(table.model).filter(*self._row_filter(table)).all()
+
+        ids: List[int] = []
+        vectors: List[np.ndarray] = []
+        payloads: List[Dict[str, Any]] = []
+        for row in rows:
+            vector = to_vector(row.embedding)
+            if vector is None or not np.any(vector):
+                continue
+            ids.append(row.id)
+            vectors.append(vector)
+            payloads.append(table.to_payload(row))
+
+        if vectors:
+            matrix = np.vstack(vectors)
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        logger.info(
+            f"벡터 인덱스 구성: {table.name} {len(ids)}개 "
+            f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+        return _TableIndex(
+            ids=np.asarray(ids, dtype=np.int64),
+            matrix=matrix,
+            payloads=payloads,
+        )
+
+
+# 전역 벡터 인덱스 인스턴스
+_vector_index: Optional[VectorIndex] = None
+
+
+def get_vector_index() -> VectorIndex:
+    """벡터 인덱스 싱글톤 인스턴스 반환"""
+    global _vector_index
+    if _vector_index is None:
+        from app.core.config import settings
+        _vector_index = VectorIndex(refresh_interval=settings.SEARCH_INDEX_REFRESH_INTERVAL)
+        _vector_index.register_listeners()
+    return _vector_index
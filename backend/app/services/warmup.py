@@ -0,0 +1,258 @@
+"""
+시작 시 워밍업
+첫 요청이 임베딩 모델 로드, 검색 인덱스 구성, DB/Redis 연결 비용을 치르지 않도록
+애플리케이션 시작 직후 백그라운드에서 미리 실행하고, 필수 단계가 끝나야 /ready가 200을 반환
+
+- 필수 단계는 일시적 실패(DB 재시작, 모델 다운로드 오류 등)에 대비해 지수 백오프로 재시도
+- 재시도까지 모두 실패하면 쿨다운 이후 /ready 요청이 워밍업을 다시 시작
+"""
+import asyncio
+import time
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import text
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 워밍업 인코딩용 질문
+WARMUP_TEXT = "수강신청은 언제 하나요?"
+
+# 재시도 대기 시간 상한(초)
+MAX_RETRY_BACKOFF = 30.0
+
+# (단계 이름, 실행 함수, 필수 여부): 필수 단계가 실패하면 준비 상태가 되지 않음
+WarmupStepSpec = Tuple[str, Callable[[], Awaitable[Any]], bool]
+
+
+@dataclass
+class WarmupStep:
+    """워밍업 단계 결과"""
+    name: str
+    required: bool
+    status: str = "pending"  # pending, running, ok, failed
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+class WarmupState:
+    """워밍업 진행 상태와 단계별 소요 시간"""
+
+    def __init__(self):
+        self.steps: Dict[str, WarmupStep] = {}
+        self.started_at: Optional[datetime] = None
+        self.duration_ms: Optional[float] = None
+        self.finished_at: Optional[float] = None  # time.monotonic() 기준 완료 시각
+        self.ready = False
+
+    @property
+    def status(self) -> str:
+        if self.ready:
+            return "ready"
+        if self.duration_ms is not None:
+            return "failed"
+        return "warming_up"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """준비 상태, 전체/단계별 소요 시간"""
+        return {
+            "status": self.status,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "duration_ms": self.duration_ms,
+            "steps": {
+                name: {
+                    "status": step.status,
+                    "required": step.required,
+                    "duration_ms": step.duration_ms,
+                    "attempts": step.attempts,
+                    **({"error": step.error} if step.error else {}),
+                }
+                for name, step in self.steps.items()
+            },
+        }
+
+
+async def _prime_database():
+    """DB 연결 풀 채우기 (비동기 풀은 DB_POOL_SIZE개 연결, 동기 풀은 1개)"""
+    from app.core.database import async_engine, engine
+
+    async def ping():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    def ping_sync():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(settings.DB_POOL_SIZE)))
+    await asyncio.to_thread(ping_sync)
+
+
+async def _connect_redis():
+    """Redis 연결 확인 (실패해도 캐시 없이 동작)"""
+    from app.core.cache import get_cache_service
+
+    if settings.REDIS_ENABLED and not await asyncio.to_thread(get_cache_service().healthcheck):
+        raise ConnectionError("Redis 연결 실패")
+
+
+async def _load_embedding_model():
+    """임베딩 모델 로드 후 한 번 인코딩 (사이드카 사용 시 사이드카 연결 확인)"""
+    from app.services.ai.embeddings import get_embedding_service
+
+    await asyncio.to_thread(get_embedding_service().get_embedding, WARMUP_TEXT, False)
+
+
+async def _build_indexes():
+    """상주 검색 인덱스와 답변 캐시 테이블 버전 구성"""
+    from app.core.database import SessionLocal
+    from app.services.answer_cache import get_answer_cache
+    from app.services.keyword_index import get_keyword_index
+    from app.services.vector_index import get_vector_index
+
+    def build():
+        db = SessionLocal()
+        try:
+            # PostgreSQL은 pgvector(벡터)와 기본적으로 DB 쿼리(키워드)로 검색하므로 상주 인덱스를 만들지 않음
+            is_postgresql = db.get_bind().dialect.name == "postgresql"
+            if not is_postgresql or settings.KEYWORD_INDEX_POSTGRESQL:
+                get_keyword_index().warm(db)
+            if not is_postgresql:
+                get_vector_index().warm(db)
+            if settings.ANSWER_CACHE_ENABLED:
+                get_answer_cache().warm(db)
+        finally:
+            db.close()
+
+    await asyncio.to_thread(build)
+
+
+async def _create_gemini_client():
+    """Gemini 클라이언트와 HTTP 커넥션 풀 생성"""
+    from app.services.ai.client import get_gemini_client
+
+    get_gemini_client().warm()
+
+
+def default_steps() -> List[WarmupStepSpec]:
+    """기본 워밍업 단계"""
+    return [
+        ("database", _prime_database, True),
+        ("redis", _connect_redis, False),
+        ("embedding_model", _load_embedding_model, True),
+        ("search_indexes", _build_indexes, False),
+        ("gemini_client", _create_gemini_client, False),
+    ]
+
+
+async def _attempt(step: WarmupStep, run: Callable[[], Awaitable[Any]]) -> bool:
+    """단계 1회 실행"""
+    step.attempts += 1
+    try:
+        await run()
+    except Exception as e:
+        step.error = str(e)
+        log = logger.error if step.required else logger.warning
+        log(f"워밍업 단계 실패: {step.name} ({step.attempts}회차) - {e}")
+        return False
+    step.error = None
+    return True
+
+
+async def _run_step(step: WarmupStep, run: Callable[[], Awaitable[Any]]):
+    """단계 실행 및 소요 시간 기록 (필수 단계는 실패 시 백오프 후 재시도)"""
+    step.status = "running"
+    started = time.perf_counter()
+    retries = settings.WARMUP_RETRY_ATTEMPTS if step.required else 0
+    try:
+        for retry in range(retries + 1):
+            if retry:
+                await asyncio.sleep(min(settings.WARMUP_RETRY_BACKOFF * 2 ** (retry - 1), MAX_RETRY_BACKOFF))
+            if await _attempt(step, run):
+                break
+        step.status = "failed" if step.error else "ok"
+    finally:
+        step.duration_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"워밍업 {step.name}: {step.status} ({step.duration_ms:.0f}ms, {step.attempts}회)")
+
+
+async def run_warmup(state: WarmupState, steps: Optional[List[WarmupStepSpec]] = None) -> bool:
+    """
+    워밍업 단계를 동시에 실행
+
+    Args:
+        state: 결과를 기록할 상태
+        steps: 실행할 단계 (기본값 default_steps())
+
+    Returns:
+        필수 단계가 모두 성공했는지 여부 (= 준비 상태)
+    """
+    steps = default_steps() if steps is None else steps
+    state.started_at = datetime.now()
+    state.duration_ms = None
+    state.finished_at = None
+    state.steps = {name: WarmupStep(name, required) for name, _, required in steps}
+    started = time.perf_counter()
+
+    await asyncio.gather(*(_run_step(state.steps[name], run) for name, run, _ in steps))
+
+    state.duration_ms = (time.perf_counter() - started) * 1000
+    state.finished_at = time.monotonic()
+    state.ready = all(step.status == "ok" for step in state.steps.values() if step.required)
+    if state.ready:
+        logger.info(f"✓ 워밍업 완료 ({state.duration_ms:.0f}ms)")
+    else:
+        logger.error(f"워밍업 필수 단계 실패, 준비 상태 아님 ({state.duration_ms:.0f}ms)")
+    return state.ready
+
+
+# 전역 워밍업 상태 및 실행 태스크
+_warmup_state = WarmupState()
+_warmup_task: Optional[asyncio.Task] = None
+
+
+def get_warmup_state() -> WarmupState:
+    """워밍업 상태 반환"""
+    return _warmup_state
+
+
+def start_warmup():
+    """백그라운드 워밍업 시작 (WARMUP_ENABLED=false면 바로 준비 상태)"""
+    global _warmup_task
+    if not settings.WARMUP_ENABLED:
+        _warmup_state.ready = True
+        return
+    _warmup_task = asyncio.get_running_loop().create_task(run_warmup(_warmup_state))
+
+
+def retry_failed_warmup():
+    """
+    필수 단계 실패로 준비 상태가 아니면 쿨다운 이후 워밍업 재시작 (/ready 요청 시 호출)
+
+    재시도까지 실패한 인스턴스가 영구히 503으로 남지 않도록 함
+    """
+    global _warmup_task
+    state = _warmup_state
+    if state.ready or state.finished_at is None:
+        return
+    if _warmup_task is not None and not _warmup_task.done():
+        return
+    if time.monotonic() - state.finished_at < settings.WARMUP_RETRY_COOLDOWN:
+        return
+    logger.info("워밍업 재시작 (필수 단계 실패 후 쿨다운 경과)")
+    _warmup_task = asyncio.get_running_loop().create_task(run_warmup(state))
+
+
+async def stop_warmup():
+    """진행 중인 워밍업 취소 (애플리케이션 종료 시)"""
+    global _warmup_task
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+        try:
+            await _warmup_task
+        except asyncio.CancelledError:
+            pass
+    _warmup_task = None
@@ -0,0 +1,98 @@
+"""
+임베딩 바이너리 코덱
+JSON 텍스트 대신 리틀 엔디언 바이트로 임베딩을 저장 (Redis 캐시, SQLite BLOB 컬럼)
+
+형식: 4바이트 헤더(형식 코드 + 예약 3바이트) + [int8: float32 스케일 4바이트] + 벡터 데이터
+헤더를 4바이트로 맞춰 float32 데이터가 정렬된 위치에서 시작하므로 np.frombuffer로 복사 없이 디코딩
+"""
+import json
+from typing import Any, Optional, Sequence, Union
+import numpy as np
+
+FLOAT32 = "float32"
+FLOAT16 = "float16"
+INT8 = "int8"
+
+_FORMAT_CODES = {FLOAT32: 1, FLOAT16: 2, INT8: 3}
+_HEADER_SIZE = 4
+
+
+def encode_embedding(embedding: Sequence[float], dtype: str = FLOAT32) -> bytes:
+    """
+    임베딩을 바이트로 인코딩
+
+    Args:
+        embedding: 임베딩 벡터
+        dtype: 저장 형식 (float32: 무손실, float16: 1/2 크기, int8: 약 1/4 크기 스칼라 양자화)
+
+    Returns:
+        인코딩된 바이트
+    """
+    if dtype not in _FORMAT_CODES:
+        raise ValueError(f"지원하지 않는 임베딩 저장 형식: {dtype}")
+
+    vector = np.asarray(embedding, dtype=np.float32)
+    header = bytes((_FORMAT_CODES[dtype], 0, 0, 0))
+
+    if dtype == FLOAT32:
+        return header + vector.astype("<f4", copy=False).tobytes()
+    if dtype == FLOAT16:
+        return header + vector.astype("<f2").tobytes()
+
+    max_abs = float(np.max(np.abs(vector))) if vector.size else 0.0
+    scale = max_abs / 127 if max_abs > 0 else 1.0
+    quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+    return header + np.float32(scale).astype("<f4").tobytes() + quantized.tobytes()
+
+
+def decode_embedding(data: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """
+    바이트를 float32 임베딩으로 디코딩 (float32 형식은 복사 없이 읽기 전용 배열 반환)
+
+    Args:
+        data: encode_embedding으로 인코딩된 바이트
+
+    Returns:
+        float32 벡터
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    if len(data) < _HEADER_SIZE:
+        raise ValueError("임베딩 바이트가 너무 짧습니다")
+
+    code = data[0]
+    if code == _FORMAT_CODES[FLOAT32]:
+        return np.frombuffer(data, dtype="<f4", offset=_HEADER_SIZE)
+    if code == _FORMAT_CODES[FLOAT16]:
+        return np.frombuffer(data, dtype="<f2", offset=_HEADER_SIZE).astype(np.float32)
+    if code == _FORMAT_CODES[INT8]:
+        scale = np.frombuffer(data, dtype="<f4", count=1, offset=_HEADER_SIZE)[0]
+        quantized = np.frombuffer(data, dtype=np.int8, offset=_HEADER_SIZE + 4)
+        return quantized.astype(np.float32) * scale
+
+    raise ValueError(f"알 수 없는 임베딩 형식 코드: {code}")
+
+
+def to_vector(value: Any) -> Optional[np.ndarray]:
+    """
+    저장된 임베딩 값(바이트, JSON/pgvector 텍스트, 리스트, 배열)을 float32 벡터로 변환
+
+    Args:
+        value: DB/캐시에 저장된 임베딩 값
+
+    Returns:
+        float32 벡터 (값이 없거나 형식이 잘못되면 None)
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        vector = decode_embedding(value)
+    else:
+        if isinstance(value, str):
+            # 기존 JSON 문자열 또는 pgvector 텍스트 형식 ("[0.1,0.2,...]")
+            value = json.loads(value)
+        vector = np.asarray(value, dtype=np.float32)
+    if vector.ndim != 1 or vector.size == 0:
+        return None
+    return vector
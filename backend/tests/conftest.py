@@ -2,18 +2,26 @@
 Pytest configuration and fixtures for all tests.
 """
 
+import os
+
+# Skip model/index warm-up when the app starts under TestClient.
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 from fastapi.testclient import TestClient
 
-from app.core.database import Base, get_db
+from app.core.database import Base, async_database_url, get_async_db, get_db
 from app.main import app
 
 
 # Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Shared-cache in-memory database so the sync session and the async
+# (aiosqlite) sessions used by the API routers see the same tables.
+SQLALCHEMY_DATABASE_URL = "sqlite:///file:testdb?mode=memory&cache=shared&uri=true"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -22,6 +30,11 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# The StaticPool connection above keeps the in-memory database alive, so async
+# connections can be opened per request (each TestClient runs its own loop).
+async_engine = create_async_engine(async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -44,7 +57,12 @@ def client(db_session):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
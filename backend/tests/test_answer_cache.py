@@ -0,0 +1,76 @@
+"""
+Unit tests for the semantic answer cache.
+"""
+
+import pytest
+import numpy as np
+from datetime import date
+from unittest.mock import patch
+from app.models.academic_glossary import AcademicGlossary
+from app.models.question_log import QuestionCategory
+from app.services.answer_cache import DocumentVersions, SemanticAnswerCache
+
+
+def _vector(seed, noise=0.0, base_seed=None):
+    """Deterministic unit vector, optionally perturbed around another seed."""
+    base = np.random.default_rng(base_seed if base_seed is not None else seed).standard_normal(384)
+    if noise:
+        base = base + noise * np.random.default_rng(seed).standard_normal(384)
+    return (base / np.linalg.norm(base)).tolist()
+
+
+RESPONSE = {"answer": "3월 1일입니다.", "sources": [], "category": "학사 일정",
+            "search_results_count": 1, "success": True}
+
+
+@pytest.fixture
+def cache():
+    versions = DocumentVersions()
+    versions.register_listeners()
+    return SemanticAnswerCache(versions, threshold=0.9, ttl=60, max_entries=3)
+
+
+@pytest.mark.unit
+class TestSemanticAnswerCache:
+    """Test cases for SemanticAnswerCache."""
+
+    def test_near_duplicate_hits_and_unrelated_misses(self, cache, db_session):
+        """Paraphrases above the threshold hit; unrelated questions and other categories miss."""
+        cache.store(db_session, _vector(1), QuestionCategory.ACADEMIC_SCHEDULE, RESPONSE)
+
+        hit = cache.lookup(db_session, _vector(2, noise=0.2, base_seed=1), QuestionCategory.ACADEMIC_SCHEDULE)
+        assert hit["answer"] == RESPONSE["answer"]
+        assert hit["cached"] is True
+        assert hit["cache_similarity"] >= 0.9
+
+        assert cache.lookup(db_session, _vector(3), QuestionCategory.ACADEMIC_SCHEDULE) is None
+        assert cache.lookup(db_session, _vector(1), QuestionCategory.NOTICE) is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    def test_source_table_change_invalidates(self, cache, db_session):
+        """Changing a table the answer depends on evicts the entry."""
+        cache.store(db_session, _vector(1), QuestionCategory.ACADEMIC_INFO, RESPONSE)
+        db_session.add(AcademicGlossary(term_ko="학점", definition="이수 단위", created_at=date(2025, 1, 1)))
+        db_session.commit()
+
+        assert cache.lookup(db_session, _vector(1), QuestionCategory.ACADEMIC_INFO) is None
+        assert cache.get_stats()["stale"] == 1
+        assert cache.get_stats()["size"] == 0
+
+    def test_ttl_and_capacity_eviction(self, cache, db_session):
+        """Expired entries miss and the least recently used entry is evicted when full."""
+        with patch("app.services.answer_cache.time.monotonic", return_value=0.0):
+            cache.store(db_session, _vector(1), None, RESPONSE)
+        with patch("app.services.answer_cache.time.monotonic", return_value=61.0):
+            assert cache.lookup(db_session, _vector(1), None) is None
+        assert cache.get_stats()["expired"] == 1
+
+        for seed in (10, 11, 12, 13):
+            cache.store(db_session, _vector(seed), None, RESPONSE)
+        assert cache.get_stats()["size"] == 3
+        assert cache.lookup(db_session, _vector(10), None) is None
+        assert cache.lookup(db_session, _vector(13), None) is not None
@@ -2,8 +2,12 @@
 Integration tests for Chat API endpoints.
 """
 
+import json
 import pytest
 from unittest.mock import patch, AsyncMock, Mock
+from sqlalchemy.orm import sessionmaker
+from app.models.question_log import QuestionLog, QuestionCategory, QuestionStatus
+from app.services.question_log_sink import QuestionLogSink
 
 
 @pytest.mark.integration
@@ -93,3 +97,66 @@ class TestChatAPI:
             
             # Should handle long questions gracefully
             assert response.status_code in [200, 400, 422]
+
+
+@pytest.mark.unit
+class TestChatStreamAPI:
+    """Test cases for the SSE chat endpoint."""
+
+    @staticmethod
+    def _parse_events(body):
+        events = []
+        for block in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.split("\n"))
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_sends_meta_tokens_and_logs(self, client, db_session):
+        """Sources arrive first, then tokens; the question log is written at the end."""
+        async def fake_stream(self, question, use_hybrid_search=True):
+            yield {"event": "meta", "data": {"category": "학사 일정", "sources": [{"name": "학사일정", "url": None}],
+                                             "search_results_count": 1}}
+            yield {"event": "token", "data": {"text": "3월 "}}
+            yield {"event": "token", "data": {"text": "1일입니다."}}
+            yield {"event": "done", "data": {"answer": "3월 1일입니다.", "success": True}}
+
+        sink = QuestionLogSink(sessionmaker(bind=db_session.get_bind()))
+        with patch('app.services.ai.rag.RAGPipeline.stream_question', fake_stream), \
+                patch('app.api.v1.chat.get_question_log_sink', return_value=sink):
+            response = client.post("/api/v1/chat/stream", json={"message": "수강신청은 언제 하나요?"})
+        sink.flush()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._parse_events(response.text)
+        assert [name for name, _ in events] == ["meta", "token", "token", "done"]
+        assert events[0][1]["sources"][0]["name"] == "학사일정"
+
+        log = db_session.query(QuestionLog).one()
+        assert log.answer == "3월 1일입니다."
+        assert log.category == QuestionCategory.ACADEMIC_SCHEDULE
+        assert log.status == QuestionStatus.COMPLETED
+
+    def test_stream_records_request_id_and_stage_timings(self, client, db_session):
+        """The caller's request id is echoed and stored with the per-stage timings."""
+        from app.core.tracing import span
+
+        async def fake_stream(self, question, use_hybrid_search=True):
+            with span("classify"):
+                pass
+            yield {"event": "done", "data": {"answer": "답변", "success": True}}
+
+        sink = QuestionLogSink(sessionmaker(bind=db_session.get_bind()))
+        with patch('app.services.ai.rag.RAGPipeline.stream_question', fake_stream), \
+                patch('app.api.v1.chat.get_question_log_sink', return_value=sink), \
+                patch('app.api.v1.chat.settings.SERVER_TIMING_ENABLED', True):
+            response = client.post("/api/v1/chat/stream", json={"message": "질문"},
+                                   headers={"X-Request-ID": "req-123"})
+        sink.flush()
+
+        assert response.headers["X-Request-ID"] == "req-123"
+        done = self._parse_events(response.text)[-1][1]
+        assert set(done["timings"]) == {"classify", "total"}
+        log = db_session.query(QuestionLog).one()
+        assert log.request_id == "req-123"
+        assert set(log.timings) == {"classify", "total"}
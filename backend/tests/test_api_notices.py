@@ -75,3 +75,62 @@ class TestNoticesAPI:
         assert response.status_code == 200
         data = response.json()
         assert all(item["category"] == "장학금" for item in data)
+
+
+@pytest.mark.unit
+class TestNoticesConditionalGet:
+    """Test cases for ETag revalidation of the notices list."""
+
+    def test_if_none_match_returns_304_until_table_changes(self, client, db_session, monkeypatch):
+        """A matching ETag gets an empty 304; a new notice changes the ETag."""
+        from app.models.notice import NoticeType
+        from app.services.etags import TableETags
+
+        monkeypatch.setattr("app.services.etags._table_etags", TableETags(refresh_interval=0))
+        db_session.add(Notice(title="장학금 신청 안내", content="내용", notice_type=NoticeType.SCHOLARSHIP,
+                              created_at=datetime(2025, 1, 15).date()))
+        db_session.commit()
+
+        first = client.get("/api/v1/notices")
+        etag = first.headers["ETag"]
+        revalidated = client.get("/api/v1/notices", headers={"If-None-Match": etag})
+        other_query = client.get("/api/v1/notices?limit=1", headers={"If-None-Match": etag})
+
+        db_session.add(Notice(title="등록금 납부 안내", content="내용", notice_type=NoticeType.TUITION,
+                              created_at=datetime(2025, 2, 1).date()))
+        db_session.commit()
+        changed = client.get("/api/v1/notices", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200 and etag.startswith('"')
+        assert revalidated.status_code == 304 and revalidated.content == b""
+        assert revalidated.headers["ETag"] == etag
+        assert revalidated.headers["Cache-Control"] == "public, max-age=300"
+        assert other_query.status_code == 200
+        assert changed.status_code == 200 and len(changed.json()) == 2
+        assert changed.headers["ETag"] != etag
+
+    def test_edit_without_new_rows_changes_etag(self, client, db_session, monkeypatch):
+        """A same-day content edit or an is_active toggle is a new representation, not a 304."""
+        from datetime import date
+        from app.models.notice import NoticeType
+        from app.services.etags import TableETags
+
+        monkeypatch.setattr("app.services.etags._table_etags", TableETags(refresh_interval=0))
+        notice = Notice(title="장학금 신청 안내", content="내용", notice_type=NoticeType.SCHOLARSHIP,
+                        created_at=date(2025, 1, 15), updated_at=date.today())
+        db_session.add(notice)
+        db_session.commit()
+        etag = client.get("/api/v1/notices").headers["ETag"]
+
+        notice.title = "장학금 신청 기간 연장 안내"
+        db_session.commit()
+        edited = client.get("/api/v1/notices", headers={"If-None-Match": etag})
+
+        notice.is_active = 0
+        db_session.commit()
+        toggled = client.get("/api/v1/notices", headers={"If-None-Match": edited.headers["ETag"]})
+
+        assert edited.status_code == 200 and edited.headers["ETag"] != etag
+        assert edited.json()[0]["title"] == "장학금 신청 기간 연장 안내"
+        assert toggled.status_code == 200
+        assert toggled.headers["ETag"] not in (etag, edited.headers["ETag"])
@@ -0,0 +1,38 @@
+"""
+Unit tests for the async database layer.
+"""
+
+import pytest
+from datetime import date
+from sqlalchemy import select
+from app.core.database import async_database_url
+from app.models.notice import Notice, NoticeType
+from tests.conftest import TestingAsyncSessionLocal
+
+
+@pytest.mark.unit
+class TestAsyncDatabase:
+    """Test cases for the async session used by the API routers."""
+
+    def test_async_database_url(self):
+        """Sync URLs map to the async driver of the same database."""
+        assert async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+        assert async_database_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+        assert async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+        assert async_database_url("sqlite+aiosqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+
+    async def test_async_session_reads_committed_rows(self, db_session):
+        """Rows committed through the sync session are visible to async sessions."""
+        db_session.add(Notice(title="휴강 안내", content="내용", notice_type=NoticeType.ACADEMIC,
+                              created_at=date(2025, 3, 1)))
+        db_session.commit()
+
+        async with TestingAsyncSessionLocal() as db:
+            notices = (await db.execute(select(Notice))).scalars().all()
+
+        assert [notice.title for notice in notices] == ["휴강 안내"]
+
+    def test_router_uses_async_session(self, client):
+        """API routes resolve through the async session dependency."""
+        assert client.get("/api/v1/notices").status_code == 200
+        assert client.get("/api/v1/notices/999").status_code == 404
@@ -0,0 +1,179 @@
+"""
+Unit tests for the two-tier cache service.
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+from app.core.cache import CacheService, LocalCache
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Test cases for the in-process L1 cache."""
+
+    def test_lru_eviction_per_prefix(self):
+        """Each prefix is bounded by its own capacity."""
+        cache = LocalCache(default_capacity=2, prefix_capacity={"embedding": 1}, ttl=60)
+        cache.set("search", "a", 1)
+        cache.set("search", "b", 2)
+        cache.get("search", "a")  # a becomes most recently used
+        cache.set("search", "c", 3)
+        cache.set("embedding", "x", 1)
+        cache.set("embedding", "y", 2)
+
+        assert cache.get("search", "a") == 1
+        assert cache.get("search", "b") is None
+        assert cache.get("embedding", "x") is None
+        assert cache.size() == 3
+
+    def test_ttl_expiry(self):
+        """Entries expire after the shorter of their own TTL and the L1 TTL."""
+        cache = LocalCache(default_capacity=10, prefix_capacity={}, ttl=60)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("search", "a", 1, ttl=5)
+        with patch("app.core.cache.time.monotonic", return_value=106.0):
+            assert cache.get("search", "a") is None
+
+    def test_delete_prefix(self):
+        """Deleting without a key drops the whole prefix."""
+        cache = LocalCache(default_capacity=10, prefix_capacity={}, ttl=60)
+        cache.set("search", "a", 1)
+        cache.delete("search")
+        assert cache.size("search") == 0
+
+
+@pytest.mark.unit
+class TestCacheService:
+    """Test cases for CacheService with L1 in front of Redis."""
+
+    @pytest.fixture
+    def service(self):
+        with patch("app.core.cache.settings") as settings:
+            settings.REDIS_ENABLED = False
+            settings.CACHE_L1_ENABLED = True
+            settings.CACHE_L1_MAX_ITEMS = 10
+            settings.CACHE_L1_PREFIX_CAPACITY = {}
+            settings.CACHE_L1_TTL = 60
+            service = CacheService()
+        redis = Mock()
+        # set() pipelines [EXISTS, SET]; default to writing a new key
+        redis.pipeline.return_value.execute.return_value = [0, True]
+        service._client = redis
+        service._binary_client = Mock()
+        service._binary_client.pipeline.return_value.execute.return_value = [0, True]
+        service._enabled = True
+        return service
+
+    def test_l2_hit_fills_l1(self, service):
+        """A Redis hit is copied into L1 so the next read skips the network."""
+        service._client.get.return_value = json.dumps([0.1, 0.2])
+
+        assert service.get("embedding", "k") == [0.1, 0.2]
+        assert service.get("embedding", "k") == [0.1, 0.2]
+
+        assert service._client.get.call_count == 1
+        stats = service.get_stats()
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"]["hits"] == 1
+
+    def test_l1_returns_independent_copies(self, service):
+        """Mutating a returned value does not corrupt the cached entry."""
+        service.set("search", "q", [{"id": 1}])
+        first = service.get("search", "q")
+        first[0]["final_score"] = 0.9
+
+        assert service.get("search", "q") == [{"id": 1}]
+
+    def test_embedding_stored_as_binary(self, service):
+        """Embeddings go to Redis as codec bytes and legacy JSON entries count as a miss."""
+        with patch("app.core.cache.settings") as settings:
+            settings.EMBEDDING_STORAGE_DTYPE = "float32"
+            settings.CACHE_TTL_EMBEDDING = 60
+            service.set_embedding("text", [0.5, 0.25])
+        stored = service._binary_client.pipeline.return_value.setex.call_args[0][2]
+        assert isinstance(stored, bytes)
+
+        service._local.delete("embedding")
+        service._binary_client.get.return_value = stored
+        assert service.get_embedding("text").tolist() == [0.5, 0.25]
+
+        service._local.delete("embedding")
+        service._binary_client.get.return_value = json.dumps([0.5, 0.25]).encode()
+        assert service.get_embedding("text") is None
+        service._client.delete.assert_called_once()
+
+    def test_delete_publishes_invalidation(self, service):
+        """Deletes are broadcast so other workers drop their L1 copy."""
+        service.set("search", "q", [1])
+        service.delete("search", "q")
+
+        channel, payload = service._client.publish.call_args[0]
+        assert json.loads(payload)["key"] == "q"
+        assert service._local.get("search", "q") is None
+
+    def test_overwrite_publishes_invalidation_after_write(self, service):
+        """Overwriting an existing key tells other workers to drop their stale L1 copy; new keys do not."""
+        pipeline = service._client.pipeline.return_value
+        calls = []
+        pipeline.execute.side_effect = lambda: calls.append("write") or [0, True]
+        service._client.publish.side_effect = lambda *args: calls.append("publish")
+
+        service.set("search", "q", [1])
+        assert calls == ["write"]
+
+        pipeline.execute.side_effect = lambda: calls.append("write") or [1, True]
+        service.set("search", "q", [2])
+        assert calls == ["write", "write", "publish"]
+        assert json.loads(service._client.publish.call_args[0][1])["key"] == "q"
+
+    def test_clear_prefix_publishes_after_delete(self, service):
+        """Peers are told to drop L1 only once the Redis keys are gone."""
+        calls = []
+        service._client.keys.return_value = ["search:q"]
+        service._client.delete.side_effect = lambda *keys: calls.append("delete") or len(keys)
+        service._client.publish.side_effect = lambda *args: calls.append("publish")
+
+        assert service.clear_prefix("search") == 1
+        assert calls == ["delete", "publish"]
+
+    def test_invalidation_from_other_worker(self, service):
+        """Messages from other workers evict the local entry; own messages are ignored."""
+        service.set("search", "q", [1])
+        service._on_invalidation({"data": json.dumps({"sender": service._instance_id, "prefix": "search", "key": "q"})})
+        assert service._local.get("search", "q") is not None
+
+        service._on_invalidation({"data": json.dumps({"sender": "other", "prefix": "search", "key": "q"})})
+        assert service._local.get("search", "q") is None
+
+    def test_invalidate_documents_drops_only_their_results(self, service):
+        """Search results are indexed by document so one edit evicts just the queries that returned it."""
+        pipeline = service._client.pipeline.return_value
+        with patch("app.core.cache.settings") as settings:
+            settings.CACHE_TTL_SEARCH = 60
+            service.set_search_result("q1", [{"doc_table": "notices", "id": 7}, {"doc_table": "notices", "id": 8}])
+            service.set_search_result("q2", [{"doc_table": "notices", "id": 8}])
+        key1 = service._hash_key({"query": "q1", "filters": {}})
+        pipeline.sadd.assert_any_call("search_doc:notices:7", key1)
+
+        pipeline.execute.return_value = [{key1}]
+        assert service.invalidate_documents("notices", [7]) == 1
+
+        service._client.delete.assert_any_call(f"search:{key1}")
+        service._client.delete.assert_any_call("search_doc:notices:7")
+        assert service._local.get("search", key1) is None
+        assert service.get_search_result("q2") == [{"doc_table": "notices", "id": 8}]
+        assert json.loads(service._client.publish.call_args[0][1])["keys"] == [key1]
+
+    def test_table_change_reaches_listeners(self, service):
+        """A table change published by another process marks local indexes dirty."""
+        changed = []
+        service.add_table_listener(changed.append)
+        service.publish_table_change("notices")
+        payload = service._client.publish.call_args[0][1]
+
+        service._on_invalidation({"data": payload})
+        assert changed == []
+
+        service._on_invalidation({"data": json.dumps({"sender": "script", "table": "notices"})})
+        assert changed == ["notices"]
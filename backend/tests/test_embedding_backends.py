@@ -0,0 +1,96 @@
+"""
+Unit tests for embedding inference backends.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services.ai import embeddings
+from app.services.ai.embedding_backends import (
+    ONNX_MODEL_FILE,
+    ONNX_QUANTIZED_MODEL_FILE,
+    load_backend,
+    mean_pooling,
+)
+
+SENTENCES = [
+    "수강신청은 언제 하나요?",
+    "장학금 신청 방법이 궁금해요",
+    "학사 일정을 알려주세요",
+    "How do I register for classes?",
+]
+
+
+@pytest.mark.unit
+class TestEmbeddingBackends:
+    """Test cases for backend selection and ONNX pooling."""
+
+    def test_mean_pooling_ignores_padding(self):
+        """Padded positions must not change the sentence embedding."""
+        tokens = np.array([[[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]]], dtype=np.float32)
+        mask = np.array([[1, 1, 0]])
+
+        pooled = mean_pooling(tokens, mask)
+
+        np.testing.assert_allclose(pooled, [[2.0, 3.0]])
+
+    def test_backend_must_implement_interface(self):
+        """Subclasses missing dimension or _encode_batch fail at construction."""
+        from app.services.ai.embedding_backends import EmbeddingBackend
+
+        class NoDimension(EmbeddingBackend):
+            def _encode_batch(self, texts):
+                return np.ones((len(texts), 2), dtype=np.float32)
+
+        class Ones(NoDimension):
+            dimension = 2
+
+        with pytest.raises(TypeError):
+            NoDimension()
+        assert Ones().encode(["a", "b", "c"], batch_size=2).shape == (3, 2)
+        assert Ones().encode([]).shape == (0, 2)
+
+    def test_unknown_backend_is_rejected(self):
+        """Unsupported backend names raise instead of silently loading torch."""
+        with pytest.raises(ValueError):
+            load_backend("tensorrt", settings.EMBEDDING_MODEL)
+
+    def test_missing_onnx_model_falls_back_to_torch(self, monkeypatch):
+        """A missing ONNX export degrades to the PyTorch backend."""
+        loaded = []
+
+        def fake_load_backend(backend, *args, **kwargs):
+            loaded.append(backend)
+            if backend == "onnx":
+                raise FileNotFoundError("model.int8.onnx")
+            return SimpleNamespace(name=backend)
+
+        monkeypatch.setattr(embeddings, "load_backend", fake_load_backend)
+        service = embeddings.EmbeddingService(backend="onnx", onnx_dir="/nonexistent")
+
+        service.load_model()
+
+        assert loaded == ["onnx", "torch"]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("quantized,min_cosine", [(False, 0.999), (True, 0.98)])
+def test_onnx_matches_torch(quantized, min_cosine):
+    """Exported ONNX models agree with the PyTorch model (scripts/export_onnx.py output)."""
+    pytest.importorskip("onnxruntime")
+    model_dir = Path(settings.EMBEDDING_ONNX_DIR)
+    if not (model_dir / (ONNX_QUANTIZED_MODEL_FILE if quantized else ONNX_MODEL_FILE)).exists():
+        pytest.skip(f"ONNX model not exported to {model_dir}")
+
+    reference = load_backend("torch", settings.EMBEDDING_MODEL).encode(SENTENCES)
+    candidate = load_backend("onnx", settings.EMBEDDING_MODEL, model_dir, quantized=quantized).encode(SENTENCES)
+
+    cosines = (reference * candidate).sum(axis=1) / (
+        np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    )
+    assert candidate.shape == reference.shape
+    assert cosines.min() >= min_cosine
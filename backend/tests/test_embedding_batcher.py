@@ -0,0 +1,86 @@
+"""
+Unit tests for the query embedding micro-batcher.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.monitoring import Histogram
+from app.services.ai.embedding_batcher import EmbeddingBatcher
+
+
+def fake_encode(calls):
+    """Encode each text as [len(text)] and record the batch."""
+    def encode(texts):
+        calls.append(list(texts))
+        return np.array([[float(len(text))] for text in texts])
+    return encode
+
+
+@pytest.mark.unit
+class TestEmbeddingBatcher:
+    """Test cases for EmbeddingBatcher."""
+
+    async def test_concurrent_requests_share_one_encode_call(self):
+        """Concurrent callers are encoded together and get their own result."""
+        calls = []
+        batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=8, max_wait_ms=20)
+        texts = ["a", "bb", "ccc", "dddd"]
+
+        results = await asyncio.gather(*(batcher.embed(text) for text in texts))
+        await batcher.close()
+
+        assert calls == [texts]
+        assert [result[0] for result in results] == [1.0, 2.0, 3.0, 4.0]
+        assert batcher.get_stats()["batch_size"]["count"] == 1
+
+    async def test_batches_are_capped_at_max_batch_size(self):
+        """More concurrent requests than max_batch_size are split into batches."""
+        calls = []
+        batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=3, max_wait_ms=20)
+
+        await asyncio.gather(*(batcher.embed("x" * i) for i in range(1, 8)))
+        await batcher.close()
+
+        assert [len(batch) for batch in calls] == [3, 3, 1]
+        assert batcher.get_stats()["requests"] == 7
+
+    async def test_encode_error_reaches_every_caller(self):
+        """A failed batch raises in each waiting caller and the batcher keeps serving."""
+        def failing(texts):
+            if "boom" in texts:
+                raise RuntimeError("model failed")
+            return [np.zeros(1) for _ in texts]
+
+        batcher = EmbeddingBatcher(failing, max_batch_size=8, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.embed("boom"), batcher.embed("other"), return_exceptions=True
+        )
+        recovered = await batcher.embed("fine")
+        await batcher.close()
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert recovered.shape == (1,)
+        assert batcher.get_stats()["errors"] == 1
+
+
+@pytest.mark.unit
+class TestHistogram:
+    """Test cases for the fixed-bucket histogram."""
+
+    def test_snapshot_counts_and_quantiles(self):
+        """Buckets are cumulative and quantiles interpolate within a bucket."""
+        histogram = Histogram([1, 5, 10])
+        for value in (0.5, 2, 3, 4, 20):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"] == {"1": 1, "5": 4, "10": 4, "+Inf": 5}
+        assert snapshot["p50"] == pytest.approx(3.0)
+        assert snapshot["p99"] == 10
+        assert (snapshot["min"], snapshot["max"]) == (0.5, 20)
@@ -0,0 +1,83 @@
+"""
+Unit tests for binary embedding storage.
+"""
+
+import json
+import pytest
+import numpy as np
+from datetime import date
+from sqlalchemy import text
+from app.models.academic_glossary import AcademicGlossary
+from app.utils.embedding_codec import FLOAT16, FLOAT32, INT8, decode_embedding, encode_embedding, to_vector
+
+
+@pytest.fixture
+def embedding():
+    rng = np.random.default_rng(0)
+    vector = rng.standard_normal(384).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.mark.unit
+class TestEmbeddingCodec:
+    """Test cases for encode_embedding / decode_embedding."""
+
+    def test_float32_round_trip_is_lossless(self, embedding):
+        """float32 encoding is exact and 4 bytes per dimension plus header."""
+        data = encode_embedding(embedding, FLOAT32)
+
+        assert len(data) == 4 + 384 * 4
+        np.testing.assert_array_equal(decode_embedding(data), embedding)
+
+    @pytest.mark.parametrize("dtype,size,tolerance", [(FLOAT16, 4 + 384 * 2, 1e-3), (INT8, 8 + 384, 1e-2)])
+    def test_quantized_formats(self, embedding, dtype, size, tolerance):
+        """Quantized formats shrink the payload and keep cosine similarity close."""
+        data = encode_embedding(embedding, dtype)
+        decoded = decode_embedding(data)
+
+        assert len(data) == size
+        cosine = float(decoded @ embedding / np.linalg.norm(decoded))
+        assert cosine == pytest.approx(1.0, abs=tolerance)
+
+    def test_legacy_json_is_rejected_by_decoder(self):
+        """Old JSON cache entries fail to decode so they are treated as a miss."""
+        with pytest.raises(ValueError):
+            decode_embedding(json.dumps([0.1, 0.2]).encode())
+
+    def test_to_vector_accepts_all_stored_forms(self, embedding):
+        """Bytes, JSON text and lists all convert to the same float32 vector."""
+        expected = embedding.astype(np.float32)
+        for value in (encode_embedding(embedding), json.dumps(embedding.tolist()), embedding.tolist()):
+            np.testing.assert_allclose(to_vector(value), expected, rtol=1e-6)
+        assert to_vector(None) is None
+        assert to_vector([]) is None
+
+
+@pytest.mark.unit
+class TestEmbeddingVectorColumn:
+    """Test cases for the EmbeddingVector column type on SQLite."""
+
+    def test_stored_as_blob_and_read_back(self, db_session, embedding):
+        """Embeddings are written as BLOBs and loaded as float32 arrays."""
+        db_session.add(AcademicGlossary(term_ko="학점", definition="이수 단위",
+                                        embedding=embedding.tolist(), created_at=date(2025, 1, 1)))
+        db_session.commit()
+
+        stored_type = db_session.execute(text("SELECT typeof(embedding) FROM academic_glossary")).scalar()
+        assert stored_type == "blob"
+
+        db_session.expire_all()
+        loaded = db_session.query(AcademicGlossary).one().embedding
+        np.testing.assert_array_equal(loaded, embedding)
+
+    def test_legacy_json_rows_are_readable(self, db_session, embedding):
+        """Rows written as JSON text before migration still load."""
+        db_session.execute(
+            text("INSERT INTO academic_glossary (term_ko, definition, embedding, created_at) "
+                 "VALUES ('학점', '이수 단위', :embedding, '2025-01-01')"),
+            {"embedding": json.dumps(embedding.tolist())},
+        )
+        db_session.commit()
+
+        loaded = db_session.query(AcademicGlossary).one().embedding
+        np.testing.assert_allclose(loaded, embedding, rtol=1e-6)
@@ -0,0 +1,81 @@
+"""
+Unit tests for the embedding sidecar protocol, server and client fallback.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.services.ai.embedding_batcher import EmbeddingBatcher
+from app.services.ai.embedding_sidecar import (
+    EmbeddingSidecarClient,
+    EmbeddingSidecarServer,
+    decode_request,
+    encode_request,
+)
+from app.services.ai.embeddings import EmbeddingService
+
+
+class FakeModel:
+    """Encodes each text as [len(text), 1.0]."""
+
+    name = "fake"
+    dimension = 2
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False):
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+class FakeEmbeddingService:
+    """Just enough of EmbeddingService for the sidecar server."""
+
+    def __init__(self):
+        self.model = FakeModel()
+        self._batcher = EmbeddingBatcher(self.model.encode, max_batch_size=16, max_wait_ms=2)
+
+    def load_model(self):
+        pass
+
+    def get_batcher(self):
+        return self._batcher
+
+
+@pytest.mark.unit
+class TestEmbeddingSidecar:
+    """Test cases for the sidecar round trip and fallback."""
+
+    def test_request_frame_round_trip(self):
+        """Texts survive encoding, including non-ASCII and empty strings."""
+        texts = ["수강신청은 언제 하나요?", "", "hello"]
+
+        frame = encode_request(texts)
+
+        assert decode_request(frame[4:]) == texts
+
+    async def test_client_receives_embeddings_from_server(self, tmp_path):
+        """Worker-side client gets one row per text, in order, over the Unix socket."""
+        socket_path = str(tmp_path / "embedding.sock")
+        service = FakeEmbeddingService()
+        server = EmbeddingSidecarServer(service, socket_path)
+        await server.start()
+        client = EmbeddingSidecarClient(socket_path, timeout=2.0)
+        loop = asyncio.get_running_loop()
+        try:
+            embeddings = await loop.run_in_executor(None, client.encode, ["a", "bbb", "학사"])
+        finally:
+            await loop.run_in_executor(None, client.close)
+            server._server.close()
+            await service.get_batcher().close()
+
+        np.testing.assert_array_equal(embeddings, [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]])
+
+    def test_unreachable_sidecar_falls_back_to_local_model(self, tmp_path):
+        """When the socket is missing the service encodes in-process and backs off."""
+        service = EmbeddingService(sidecar_socket=str(tmp_path / "missing.sock"))
+        service.model = FakeModel()
+
+        embedding = service.get_embedding("abcd", use_cache=False)
+
+        assert embedding == [4.0, 1.0]
+        assert service._sidecar_down_until > 0
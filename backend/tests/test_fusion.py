@@ -0,0 +1,60 @@
+"""
+Unit tests for hybrid search score fusion.
+"""
+
+import pytest
+from unittest.mock import patch
+from app.core.config import settings
+from app.models.question_log import QuestionCategory
+from app.services.fusion import fuse, strategy_for_category
+
+
+def _keyword(doc_id, score):
+    return {"id": doc_id, "source": "공지사항", "relevance_score": score}
+
+
+def _vector(doc_id, similarity):
+    return {"id": doc_id, "source": "공지사항", "similarity": similarity}
+
+
+KEYWORD = [_keyword(1, 25.0), _keyword(2, 12.0), _keyword(3, 11.0)]
+VECTOR = [_vector(3, 0.91), _vector(4, 0.90), _vector(1, 0.62)]
+
+
+@pytest.mark.unit
+class TestFusion:
+    """Test cases for fuse()."""
+
+    @pytest.mark.parametrize("strategy", ["rrf", "minmax", "zscore", "weighted"])
+    def test_deduplicates_and_keeps_raw_scores(self, strategy):
+        """Each document appears once with both raw scores and a descending final_score."""
+        results = fuse(KEYWORD, VECTOR, limit=10, strategy=strategy)
+
+        assert sorted(result["id"] for result in results) == [1, 2, 3, 4]
+        by_id = {result["id"]: result for result in results}
+        assert by_id[3]["keyword_score"] == 11.0
+        assert by_id[3]["vector_score"] == 0.91
+        scores = [result["final_score"] for result in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_rank_fusion_ignores_score_scale(self):
+        """RRF rewards documents ranked well by both retrievers regardless of BM25 magnitude."""
+        results = fuse(KEYWORD, VECTOR, limit=2, strategy="rrf", keyword_weight=0.5)
+        assert {result["id"] for result in results} == {1, 3}
+
+        # Raw-score blending lets one large BM25 score dominate
+        weighted = fuse(KEYWORD, VECTOR, limit=1, strategy="weighted")
+        assert weighted[0]["id"] == 1
+        assert weighted[0]["final_score"] == pytest.approx(0.4 * 2.5 + 0.6 * 0.62)
+
+    def test_unknown_strategy_and_category_override(self):
+        """Strategies are chosen per category with a validated default."""
+        with pytest.raises(ValueError):
+            fuse(KEYWORD, VECTOR, limit=3, strategy="nope")
+
+        overrides = {QuestionCategory.NOTICE.value: "zscore", QuestionCategory.ACADEMIC_INFO.value: "nope"}
+        with patch.object(settings, "SEARCH_FUSION_STRATEGY", "rrf"), \
+                patch.object(settings, "SEARCH_FUSION_CATEGORY_STRATEGIES", overrides):
+            assert strategy_for_category(QuestionCategory.NOTICE) == "zscore"
+            assert strategy_for_category(QuestionCategory.ACADEMIC_INFO) == "rrf"
+            assert strategy_for_category(None) == "rrf"
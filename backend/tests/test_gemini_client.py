@@ -0,0 +1,123 @@
+"""
+Unit tests for the async Gemini client.
+"""
+
+import asyncio
+import json
+import httpx
+import pytest
+from app.services.ai.client import GeminiAPIError, GeminiClient
+
+
+def _answer(text):
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+def _client(handler, concurrency=16, timeout=5.0):
+    """GeminiClient whose HTTP calls are served by an async handler."""
+    client = GeminiClient()
+    client.timeout = timeout
+    client.max_concurrency = concurrency
+    client._transport = httpx.MockTransport(handler)
+    return client
+
+
+@pytest.mark.unit
+class TestGeminiClient:
+    """Test cases for GeminiClient."""
+
+    async def test_generate_response(self):
+        """The prompt is sent as a generateContent body and the text is extracted."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=_answer("답변"))
+
+        client = _client(handler)
+        answer = await client.generate_response("질문", system_prompt="시스템", max_tokens=100)
+
+        assert answer == "답변"
+        body = json.loads(requests[0].content)
+        assert requests[0].url.path.endswith(":generateContent")
+        assert body["contents"][0]["parts"][0]["text"] == "시스템\n\n질문"
+        assert body["generationConfig"]["maxOutputTokens"] == 100
+
+    async def test_calls_run_concurrently_up_to_limit(self):
+        """Calls overlap instead of blocking the loop, capped by the semaphore."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200, json=_answer("ok"))
+
+        client = _client(handler, concurrency=3)
+        answers = await asyncio.gather(*(client.generate_response("q", "s") for _ in range(8)))
+
+        assert answers == ["ok"] * 8
+        assert peak == 3
+
+    async def test_timeout_and_http_errors(self):
+        """Slow calls, HTTP errors and empty candidates raise GeminiAPIError."""
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json=_answer("late"))
+
+        with pytest.raises(GeminiAPIError, match="시간 초과"):
+            await _client(slow, timeout=0.05).generate_response("q", "s")
+
+        async def error(request):
+            return httpx.Response(503, json={"error": {"message": "overloaded"}})
+
+        with pytest.raises(GeminiAPIError, match="503"):
+            await _client(error).generate_response("q", "s")
+
+        async def empty(request):
+            return httpx.Response(200, json={"candidates": []})
+
+        with pytest.raises(GeminiAPIError):
+            await _client(empty).generate_response("q", "s")
+
+    async def test_stream_response_yields_chunks(self):
+        """SSE chunks from streamGenerateContent are yielded as they arrive."""
+        async def handler(request):
+            assert request.url.params["alt"] == "sse"
+            body = "".join(f"data: {json.dumps(_answer(text))}\r\n\r\n" for text in ("안녕", "하세요"))
+            return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+
+        client = _client(handler)
+        chunks = [chunk async for chunk in client.stream_response("q", "s")]
+
+        assert chunks == ["안녕", "하세요"]
+        assert client._resources()[0]._value == 16
+
+    def test_singleton_survives_event_loop_changes(self):
+        """Each event loop gets its own semaphore and HTTP client, closed on shutdown."""
+        async def handler(request):
+            return httpx.Response(200, json=_answer("ok"))
+
+        client = _client(handler, concurrency=2)
+
+        async def call():
+            answer = await client.generate_response("q", "s")
+            return answer, client._http
+
+        first_answer, first_http = asyncio.run(call())
+        second_answer, second_http = asyncio.run(call())
+
+        async def shutdown():
+            client.warm()
+            http = client._http
+            await client.aclose()
+            return http
+
+        closed = asyncio.run(shutdown())
+
+        assert first_answer == second_answer == "ok"
+        assert first_http is not second_http
+        assert closed.is_closed and client._http is None
@@ -0,0 +1,123 @@
+"""
+Unit tests for concurrent hybrid search.
+"""
+
+import asyncio
+import time
+import pytest
+from datetime import date
+from unittest.mock import patch
+from app.core.config import settings
+from app.models.notice import Notice, NoticeType
+from app.models.question_log import QuestionCategory
+from app.services.search import SearchService
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class _SlowEmbeddings:
+    """Embedding service stub whose query embedding takes `delay` seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def get_embedding_async(self, text, use_cache=True):
+        await asyncio.sleep(self.delay)
+        return [1.0] + [0.0] * 383
+
+
+def _service(db, embedding_delay=0.1, keyword_delays=None, vector_delay=0.05):
+    """SearchService whose branches sleep instead of querying."""
+    keyword_delays = keyword_delays or {}
+
+    async def keyword_search(query, tables, limit, indexes=None):
+        await asyncio.sleep(max(keyword_delays.get(table.name, 0.15) for table in tables))
+        return [{"id": 1, "source": table.name, "relevance_score": 5.0} for table in tables]
+
+    async def vector_search(query_embedding, tables, limit, db=None, indexes=None):
+        await asyncio.sleep(vector_delay)
+        return [{"id": 2, "source": tables[0].name, "similarity": 0.8}]
+
+    service = SearchService(db)
+    service.embedding_service = _SlowEmbeddings(embedding_delay)
+    service._keyword_search = keyword_search
+    service._vector_search = vector_search
+    return service
+
+
+@pytest.mark.unit
+class TestConcurrentHybridSearch:
+    """Test cases for SearchService.hybrid_search with concurrent branches."""
+
+    async def test_wall_time_is_slowest_branch(self, db_session):
+        """Branches overlap: wall time tracks the slowest branch, not the sum."""
+        async with TestingAsyncSessionLocal() as db:
+            service = _service(db)
+            # Build the resident indexes first; steady-state refreshes are in-memory checks.
+            await service.hybrid_search("장학금", None, limit=5, use_cache=False)
+            started = time.perf_counter()
+            results = await service.hybrid_search("장학금", None, limit=5, use_cache=False)
+            elapsed = time.perf_counter() - started
+
+        # Sequential: 0.15s keyword + 0.1s embedding + 0.05s vector = 0.3s
+        assert elapsed < 0.3
+        assert {result["source"] for result in results} == {"academic_schedules", "academic_glossary"}
+        assert any(result["vector_score"] == 0.8 for result in results)
+
+    async def test_deadline_returns_partial_results(self, db_session):
+        """Branches still running at the deadline are dropped and the result is not cached."""
+        async with TestingAsyncSessionLocal() as db:
+            service = _service(db, keyword_delays={"notices": 5.0})
+            with patch.object(settings, "HYBRID_SEARCH_DEADLINE", 0.3), \
+                    patch.object(service, "_get_cache") as get_cache:
+                get_cache.return_value.get_search_result.return_value = None
+                started = time.perf_counter()
+                results = await service.hybrid_search("공지", QuestionCategory.NOTICE, limit=5)
+                elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert [result["vector_score"] for result in results] == [0.8]
+        get_cache.return_value.set_search_result.assert_not_called()
+
+    async def test_resident_branches_use_request_session_only(self, db_session):
+        """Without pgvector, index checks run once on the request session and no branch opens its own."""
+        async with TestingAsyncSessionLocal() as db:
+            service = SearchService(db)
+            service.embedding_service = _SlowEmbeddings(0.0)
+            with patch.object(service, "_isolated", side_effect=AssertionError("extra session")):
+                results = await service.hybrid_search("장학금", None, limit=5, use_cache=False)
+
+        assert results == []
+
+    async def test_keyword_search_without_resident_index(self, db_session):
+        """With the resident keyword index off (PostgreSQL default), keyword search queries the DB instead."""
+        db_session.add(Notice(
+            title="장학금 신청 안내", content="신청 기간", notice_type=NoticeType.SCHOLARSHIP,
+            created_at=date(2025, 1, 1), is_active=1,
+        ))
+        db_session.commit()
+        async with TestingAsyncSessionLocal() as db:
+            service = SearchService(db)
+            service.embedding_service = _SlowEmbeddings(0.0)
+            with patch.object(service, "_uses_keyword_index", return_value=False), \
+                    patch.object(service, "_get_keyword_index", side_effect=AssertionError("resident index")):
+                keyword = await service.search("장학금 신청", QuestionCategory.NOTICE, use_cache=False)
+                hybrid = await service.hybrid_search("장학금 신청", QuestionCategory.NOTICE, limit=5, use_cache=False)
+
+        assert [result["title"] for result in keyword] == ["장학금 신청 안내"]
+        assert keyword[0]["relevance_score"] > 0
+        assert [result["title"] for result in hybrid] == ["장학금 신청 안내"]
+
+    async def test_precomputed_query_embedding_is_not_recomputed(self, db_session):
+        """An embedding passed by the caller (RAG answer cache) skips the embedding service."""
+        async with TestingAsyncSessionLocal() as db:
+            service = _service(db)
+            service.embedding_service = None  # any call would fail
+            results = await service.hybrid_search(
+                "장학금", None, limit=5, use_cache=False, query_embedding=[1.0] + [0.0] * 383
+            )
+            sequential = await service.search_by_vector(
+                "장학금", None, limit=5, use_cache=False, query_embedding=[1.0] + [0.0] * 383
+            )
+
+        assert any(result["vector_score"] == 0.8 for result in results)
+        assert sequential[0]["similarity"] == 0.8
@@ -0,0 +1,91 @@
+"""
+Import-time budget for the FastAPI app (python -X importtime).
+
+Heavy dependencies (model runtimes, pgvector, the search/RAG stack) must stay
+behind lazy import boundaries so workers start quickly.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that must not be imported by `import app.main`
+LAZY_MODULES = (
+    "torch",
+    "sentence_transformers",
+    "transformers",
+    "onnxruntime",
+    "google.generativeai",
+    "pgvector",
+    "httpx",
+    "app.services.search",
+    "app.services.ai.rag",
+    "app.services.ai.embeddings",
+)
+
+# Cumulative import time budget for app.main; override on slow machines
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "3000"))
+
+
+@pytest.fixture(scope="module")
+def app_import():
+    """Import app.main in a fresh interpreter and return (importtime stderr, loaded modules)."""
+    env = {**os.environ, "REDIS_ENABLED": "false", "WARMUP_ENABLED": "false", "DEBUG": "false"}
+    code = "import sys, app.main; print('MODULES=' + ','.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120, check=True,
+    )
+    modules_line = next(line for line in result.stdout.splitlines() if line.startswith("MODULES="))
+    return result.stderr, set(modules_line[len("MODULES="):].split(","))
+
+
+def _loaded_modules(module: str) -> set:
+    """Modules loaded by importing `module` in a fresh interpreter."""
+    env = {**os.environ, "REDIS_ENABLED": "false", "WARMUP_ENABLED": "false", "DEBUG": "false"}
+    code = f"import sys, {module}; print('MODULES=' + ','.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120, check=True,
+    )
+    modules_line = next(line for line in result.stdout.splitlines() if line.startswith("MODULES="))
+    return set(modules_line[len("MODULES="):].split(","))
+
+
+def _cumulative_ms(importtime_output: str, module: str) -> float:
+    """Cumulative import time of a module from -X importtime output."""
+    for line in importtime_output.splitlines():
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+            return int(line.split("|")[1]) / 1000
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+@pytest.mark.slow
+class TestImportTime:
+    """Test cases for the app import budget."""
+
+    def test_heavy_modules_are_lazy(self, app_import):
+        """Model runtimes and the search/RAG stack are imported on first use only."""
+        _, modules = app_import
+
+        loaded = sorted(module for module in LAZY_MODULES if module in modules)
+
+        assert loaded == [], f"imported at startup: {loaded}"
+
+    @pytest.mark.parametrize("module", ["app.services.search", "app.services.ai.rag"])
+    def test_search_stack_does_not_load_pgvector(self, module):
+        """pgvector is imported only when a PostgreSQL vector statement is built."""
+        assert "pgvector" not in _loaded_modules(module)
+
+    def test_app_import_within_budget(self, app_import):
+        """Importing app.main stays under IMPORT_TIME_BUDGET_MS."""
+        importtime_output, _ = app_import
+
+        elapsed = _cumulative_ms(importtime_output, "app.main")
+
+        assert elapsed < IMPORT_TIME_BUDGET_MS, f"app.main import took {elapsed:.0f}ms"
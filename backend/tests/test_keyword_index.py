@@ -0,0 +1,97 @@
+"""
+Unit tests for the keyword (BM25) index.
+"""
+
+import pytest
+from datetime import date
+from app.models.notice import Notice, NoticeType
+from app.models.academic_glossary import AcademicGlossary
+from app.services.documents import DOCUMENT_TABLES
+from app.services.keyword_index import KeywordIndex, keyword_statement, tokenize
+
+
+def _notice(title, content, is_active=1):
+    return Notice(
+        title=title,
+        content=content,
+        notice_type=NoticeType.ACADEMIC,
+        created_at=date(2025, 1, 1),
+        is_active=is_active,
+    )
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Test cases for the Korean-aware tokenizer."""
+
+    def test_hangul_bigrams(self):
+        """Hangul runs are split into syllable bigrams."""
+        assert tokenize("수강신청") == ["수강", "강신", "신청"]
+
+    def test_mixed_text(self):
+        """Latin words and numbers are kept whole and lowercased."""
+        assert tokenize("GPA 4.5 학점") == ["gpa", "4", "5", "학점"]
+
+    def test_single_syllable_and_empty(self):
+        """Single syllables are kept; empty text yields no tokens."""
+        assert tokenize("책") == ["책"]
+        assert tokenize("") == []
+        assert tokenize(None) == []
+
+
+@pytest.mark.unit
+class TestKeywordIndex:
+    """Test cases for KeywordIndex."""
+
+    def test_sentence_query_matches_without_substring(self, db_session):
+        """A full question finds documents even when it is not a substring."""
+        db_session.add_all([
+            _notice("2025학년도 1학기 수강신청 안내", "수강신청 기간은 2월 25일부터입니다."),
+            _notice("등록금 납부 안내", "등록금 납부 기간을 안내합니다."),
+        ])
+        db_session.commit()
+
+        results = KeywordIndex().search(db_session, "notices", "수강신청은 언제 하나요?", 5)
+
+        assert results[0]["title"] == "2025학년도 1학기 수강신청 안내"
+        assert results[0]["relevance_score"] > 0
+        assert all("등록금" not in r["title"] for r in results)
+
+    def test_title_match_ranks_higher(self, db_session):
+        """Matches in the title outrank matches only in the body."""
+        db_session.add_all([
+            AcademicGlossary(term_ko="학점", definition="과목 이수 단위", created_at=date(2025, 1, 1)),
+            AcademicGlossary(term_ko="졸업", definition="졸업에 필요한 학점을 채워야 합니다",
+                             created_at=date(2025, 1, 1)),
+        ])
+        db_session.commit()
+
+        results = KeywordIndex().search(db_session, "academic_glossary", "학점", 5)
+
+        assert [r["term"] for r in results] == ["학점", "졸업"]
+
+    def test_inactive_rows_and_no_match(self, db_session):
+        """Inactive rows are not indexed and unrelated queries return nothing."""
+        db_session.add(_notice("장학금 신청 안내", "장학금", is_active=0))
+        db_session.commit()
+
+        index = KeywordIndex()
+        assert index.search(db_session, "notices", "장학금", 5) == []
+        assert index.search(db_session, "notices", "존재하지않는검색어", 5) == []
+
+    def test_db_statement_without_resident_index(self, db_session):
+        """The PostgreSQL default path matches the same bigrams in SQL, weights titles, and skips inactive rows."""
+        db_session.add_all([
+            _notice("2025학년도 1학기 수강신청 안내", "수강신청 기간은 2월 25일부터입니다."),
+            _notice("휴학 안내", "수강신청 전에 휴학을 신청하세요."),
+            _notice("수강신청 정정 안내", "정정 기간", is_active=0),
+            _notice("등록금 납부 안내", "등록금 납부 기간을 안내합니다."),
+        ])
+        db_session.commit()
+
+        table = DOCUMENT_TABLES["notices"]
+        rows = db_session.execute(keyword_statement(table, "수강신청은 언제 하나요?", 5)).all()
+
+        assert [row.title for row, _ in rows] == ["2025학년도 1학기 수강신청 안내", "휴학 안내"]
+        assert rows[0].relevance_score > rows[1].relevance_score
+        assert keyword_statement(table, "?!", 5) is None
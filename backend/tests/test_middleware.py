@@ -0,0 +1,97 @@
+"""
+Unit tests for the pure-ASGI performance and cache middlewares.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware import NO_CACHE, cache_control_for, setup_middlewares
+
+
+@pytest.fixture
+def app_client():
+    """Minimal app with the production middleware stack."""
+    app = FastAPI()
+
+    @app.get("/api/v1/notices/{notice_id}")
+    async def notice(notice_id: int):
+        if notice_id == 0:
+            return JSONResponse({"detail": "not found"}, status_code=404)
+        return {"id": notice_id}
+
+    @app.get("/api/v1/programs")
+    async def programs():
+        return JSONResponse([], headers={"Cache-Control": "private, max-age=10"})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    setup_middlewares(app)
+    return TestClient(app)
+
+
+@pytest.fixture
+def gzip_client():
+    """App with the production middleware stack and bodies above the GZip threshold."""
+    app = FastAPI()
+
+    def chunked(chunks, media_type):
+        return StreamingResponse(iter(chunks), media_type=media_type)
+
+    @app.get("/large")
+    async def large():
+        return chunked(["x" * 2000] * 3, "text/plain")
+
+    @app.get("/large-stream")
+    async def large_stream():
+        return chunked([f"data: {'x' * 2000}\n\n"] * 3, "text/event-stream")
+
+    setup_middlewares(app)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestMiddleware:
+    """Test cases for timing and Cache-Control headers."""
+
+    def test_cache_control_route_table(self):
+        """List and detail paths share a policy; lookalike paths do not match."""
+        assert cache_control_for("/api/v1/schedules") == "public, max-age=3600"
+        assert cache_control_for("/api/v1/notices/42") == "public, max-age=300"
+        assert cache_control_for("/api/v1/notices-archive") == NO_CACHE
+        assert cache_control_for("/health") == NO_CACHE
+
+    def test_headers_on_get_responses(self, app_client):
+        """GET responses get timing and route policy; errors and endpoint policies are respected."""
+        ok = app_client.get("/api/v1/notices/1")
+        missing = app_client.get("/api/v1/notices/0")
+        custom = app_client.get("/api/v1/programs")
+
+        assert float(ok.headers["X-Process-Time"]) >= 0
+        assert ok.headers["Cache-Control"] == "public, max-age=300"
+        assert missing.headers["Cache-Control"] == NO_CACHE
+        assert custom.headers["Cache-Control"] == "private, max-age=10"
+
+    def test_streaming_body_passes_through(self, app_client):
+        """Streaming responses keep every chunk and still get the headers."""
+        response = app_client.get("/stream")
+
+        assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+        assert "X-Process-Time" in response.headers
+
+    def test_event_streams_are_not_gzipped(self, gzip_client):
+        """SSE bypasses GZip without a Content-Encoding header; other large bodies are compressed."""
+        headers = {"Accept-Encoding": "gzip"}
+        sse = gzip_client.get("/large-stream", headers=headers)
+        text = gzip_client.get("/large", headers=headers)
+
+        assert "content-encoding" not in sse.headers
+        assert sse.text.count("data: ") == 3
+        assert text.headers["content-encoding"] == "gzip"
+        assert text.text == "x" * 6000
@@ -0,0 +1,93 @@
+"""
+Unit tests for the metrics registry, Prometheus exposition and PerformanceMonitor.
+"""
+
+import threading
+
+import pytest
+
+from app.core.monitoring import Histogram, MetricsRegistry, PerformanceMonitor
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Test cases for counters, histograms and text exposition."""
+
+    def test_histogram_merges_per_thread_shards(self):
+        """Observations from many threads are all counted."""
+        histogram = Histogram([0.1, 1.0])
+
+        def observe():
+            for _ in range(1000):
+                histogram.observe(0.05)
+
+        threads = [threading.Thread(target=observe) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert histogram.snapshot()["count"] == 8000
+        assert histogram.snapshot()["buckets"]["0.1"] == 8000
+
+    def test_prometheus_text_exposition(self):
+        """Histograms render cumulative buckets, _sum and _count with escaped labels."""
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests", labelnames=("path",)).labels("/a").inc(2)
+        registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0), labelnames=("op",)).labels('say "hi"').observe(0.5)
+        registry.register_callback("queue_size", "Queue size", "gauge", lambda: 3)
+
+        text = registry.render()
+
+        assert "# TYPE app_requests_total counter" in text
+        assert 'app_requests_total{path="/a"} 2' in text
+        assert 'app_latency_seconds_bucket{op="say \\"hi\\"",le="0.1"} 0' in text
+        assert 'app_latency_seconds_bucket{op="say \\"hi\\"",le="+Inf"} 1' in text
+        assert 'app_latency_seconds_count{op="say \\"hi\\""} 1' in text
+        assert "app_queue_size 3" in text
+
+    def test_performance_monitor_stats(self):
+        """Per-operation stats come from the histogram, not stored samples."""
+        monitor = PerformanceMonitor(MetricsRegistry())
+        for duration in (0.01, 0.02, 0.03, 2.0):
+            monitor.record("search", duration)
+
+        stats = monitor.get_all_stats()["search"]
+
+        assert stats["count"] == 4
+        assert stats["max"] == 2.0
+        assert stats["mean"] == pytest.approx(0.515)
+        assert stats["p99"] == pytest.approx(2.44)
+        assert monitor.get_stats("missing") is None
+
+    def test_metrics_endpoint_content_negotiation(self, client):
+        """Prometheus scrapers get text, everyone else keeps the JSON payload."""
+        prometheus = client.get("/metrics", headers={"Accept": "text/plain"})
+        json_response = client.get("/metrics")
+
+        assert prometheus.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE app_ready gauge" in prometheus.text
+        assert json_response.json()["status"] == "ok"
+
+
+@pytest.mark.unit
+class TestRequestTrace:
+    """Test cases for per-request stage timings."""
+
+    async def test_concurrent_tasks_share_the_request_trace(self):
+        """Spans in child tasks land in the trace of the request that spawned them."""
+        import asyncio
+
+        from app.core.tracing import resolve_request_id, span, start_trace
+
+        async def branch(name):
+            with span(name):
+                await asyncio.sleep(0.01)
+
+        trace = start_trace(resolve_request_id("bad id\r\n"))
+        await asyncio.gather(asyncio.create_task(branch("keyword_search")), asyncio.create_task(branch("vector_search")))
+
+        timings = trace.timings()
+        assert len(trace.request_id) == 32
+        assert timings["keyword_search"] >= 10 and timings["vector_search"] >= 10
+        assert "vector_search;dur=" in trace.server_timing()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the background question-log sink.
+"""
+
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy.orm import sessionmaker
+from app.models.question_log import QuestionLog, QuestionCategory, QuestionStatus
+from app.services.question_log_sink import QuestionLogSink
+
+
+def _record(i):
+    return {
+        "question": f"질문 {i}",
+        "answer": "답변",
+        "category": QuestionCategory.OTHER,
+        "status": QuestionStatus.COMPLETED,
+        "created_at": datetime(2025, 3, 1),
+    }
+
+
+@pytest.fixture
+def factory(db_session):
+    return sessionmaker(bind=db_session.get_bind())
+
+
+@pytest.mark.unit
+class TestQuestionLogSink:
+    """Test cases for QuestionLogSink."""
+
+    def test_flush_writes_in_batches(self, factory, db_session):
+        """Queued records are written with one bulk insert per batch."""
+        sink = QuestionLogSink(factory, batch_size=2)
+        for i in range(5):
+            assert sink.submit(_record(i))
+
+        with patch.object(sink, "_write", wraps=sink._write) as write:
+            assert sink.flush() == 5
+        assert [len(call.args[0]) for call in write.call_args_list] == [2, 2, 1]
+        assert db_session.query(QuestionLog).count() == 5
+
+    def test_full_queue_drops_and_counts(self, factory):
+        """Submissions beyond the queue bound are dropped without blocking."""
+        sink = QuestionLogSink(factory, max_queue_size=2)
+        results = [sink.submit(_record(i)) for i in range(4)]
+
+        assert results == [True, True, False, False]
+        stats = sink.get_stats()
+        assert stats["dropped"] == 2
+        assert stats["queue_size"] == 2
+
+    def test_background_thread_flushes_on_interval_and_stop(self, factory, db_session):
+        """The worker flushes on the time threshold and drains everything on stop."""
+        sink = QuestionLogSink(factory, batch_size=100, flush_interval=0.05)
+        sink.start()
+        sink.submit(_record(0))
+        deadline = time.monotonic() + 2
+        while sink.get_stats()["written"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sink.get_stats()["written"] == 1
+
+        for i in range(1, 4):
+            sink.submit(_record(i))
+        sink.stop()
+        assert db_session.query(QuestionLog).count() == 4
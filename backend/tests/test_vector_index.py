@@ -0,0 +1,179 @@
+"""
+Unit tests for the in-memory vector index.
+"""
+
+import pytest
+import numpy as np
+from datetime import date
+from app.models.academic_schedule import AcademicSchedule, SemesterType, ScheduleType
+from app.models.notice import Notice, NoticeType
+from app.services.vector_index import VectorIndex
+
+
+def _unit(*values):
+    """Pad a short vector to 384 dimensions."""
+    vector = np.zeros(384, dtype=np.float32)
+    vector[: len(values)] = values
+    return vector.tolist()
+
+
+def _schedule(name, embedding):
+    return AcademicSchedule(
+        name=name,
+        start_date=date(2025, 3, 1),
+        semester=SemesterType.FIRST,
+        schedule_type=ScheduleType.COURSE_REGISTRATION,
+        embedding=embedding,
+        created_at=date(2025, 1, 1),
+    )
+
+
+@pytest.mark.unit
+class TestVectorIndex:
+    """Test cases for VectorIndex."""
+
+    def test_search_orders_by_similarity(self, db_session):
+        """Rows should come back in descending cosine similarity."""
+        db_session.add_all([
+            _schedule("수강신청", _unit(1.0, 0.0)),
+            _schedule("등록금 납부", _unit(0.0, 1.0)),
+            _schedule("수강정정", _unit(0.8, 0.2)),
+        ])
+        db_session.commit()
+
+        index = VectorIndex()
+        results = index.search(db_session, "academic_schedules", _unit(1.0, 0.0), limit=2)
+
+        assert [r["name"] for r in results] == ["수강신청", "수강정정"]
+        assert results[0]["similarity"] == pytest.approx(1.0)
+        assert results[0]["source"] == "1학기 학사일정"
+
+    def test_inactive_and_missing_embeddings_are_skipped(self, db_session):
+        """Inactive notices and rows without embeddings are not indexed."""
+        db_session.add_all([
+            Notice(title="활성", content="내용", notice_type=NoticeType.ACADEMIC,
+                   embedding=_unit(1.0), created_at=date(2025, 1, 1), is_active=1),
+            Notice(title="비활성", content="내용", notice_type=NoticeType.ACADEMIC,
+                   embedding=_unit(1.0), created_at=date(2025, 1, 1), is_active=0),
+            Notice(title="임베딩 없음", content="내용", notice_type=NoticeType.ACADEMIC,
+                   created_at=date(2025, 1, 1), is_active=1),
+        ])
+        db_session.commit()
+
+        results = VectorIndex().search(db_session, "notices", _unit(1.0), limit=10)
+
+        assert [r["title"] for r in results] == ["활성"]
+
+    def test_rebuilds_after_row_change(self, db_session):
+        """ORM writes mark the table dirty so the next search sees them."""
+        index = VectorIndex()
+        index.register_listeners()
+        db_session.add(_schedule("수강신청", _unit(1.0, 0.0)))
+        db_session.commit()
+        assert len(index.search(db_session, "academic_schedules", _unit(0.0, 1.0), 5)) == 1
+
+        db_session.add(_schedule("등록금 납부", _unit(0.0, 1.0)))
+        db_session.commit()
+        results = index.search(db_session, "academic_schedules", _unit(0.0, 1.0), 5)
+
+        assert results[0]["name"] == "등록금 납부"
+
+    def test_empty_table(self, db_session):
+        """An empty table returns no results."""
+        assert VectorIndex().search(db_session, "academic_glossary", _unit(1.0), 5) == []
+
+    def test_search_tables_returns_global_top_k(self, db_session):
+        """One pass over the combined matrix ranks rows across tables."""
+        db_session.add_all([
+            _schedule("수강신청", _unit(0.6, 0.4)),
+            _schedule("등록금 납부", _unit(0.0, 1.0)),
+            Notice(title="수강신청 안내", content="내용", notice_type=NoticeType.ACADEMIC,
+                   embedding=_unit(1.0, 0.0), created_at=date(2025, 1, 1), is_active=1),
+        ])
+        db_session.commit()
+
+        results = VectorIndex().search_tables(
+            db_session, ["academic_schedules", "notices"], _unit(1.0, 0.0), limit=2
+        )
+
+        assert [r.get("title") or r.get("name") for r in results] == ["수강신청 안내", "수강신청"]
+
+
+@pytest.mark.unit
+class TestResidentIndexRefresh:
+    """Test cases for the shared ResidentIndex refresh logic."""
+
+    def test_subclass_without_build_table_cannot_be_created(self):
+        """Missing abstract hooks fail at construction, not on the first search."""
+        from app.services.resident_index import ResidentIndex
+
+        class Incomplete(ResidentIndex):
+            def _row_filter(self, table):
+                return []
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    async def test_concurrent_refresh_builds_table_once(self, db_session):
+        """Coroutines refreshing the same stale table share a single build."""
+        import asyncio
+        from tests.conftest import TestingAsyncSessionLocal
+
+        db_session.add(_schedule("수강신청", _unit(1.0, 0.0)))
+        db_session.commit()
+
+        index = VectorIndex()
+        builds = []
+        build_table = index._build_table
+        index._build_table = lambda db, table: builds.append(table.name) or build_table(db, table)
+
+        async def refresh():
+            async with TestingAsyncSessionLocal() as db:
+                return await index.refresh(db, ["academic_schedules"])
+
+        results = await asyncio.gather(*(refresh() for _ in range(5)))
+
+        assert builds == ["academic_schedules"]
+        assert all(r["academic_schedules"] is results[0]["academic_schedules"] for r in results)
+        assert index.search_indexes(results[0], _unit(1.0, 0.0), 1)[0]["name"] == "수강신청"
+
+    def test_bulk_reembedding_changes_signature(self, db_session):
+        """A bulk UPDATE of embeddings bumps the table version, so other processes rebuild."""
+        from sqlalchemy import update
+        from app.models.academic_schedule import AcademicSchedule
+
+        db_session.add(_schedule("수강신청", _unit(1.0, 0.0)))
+        db_session.commit()
+        index = VectorIndex(refresh_interval=0)
+        assert index.search(db_session, "academic_schedules", _unit(1.0, 0.0), 1)[0]["similarity"] == pytest.approx(1.0)
+
+        row_id = db_session.query(AcademicSchedule.id).scalar()
+        db_session.execute(
+            update(AcademicSchedule),
+            [{"id": row_id, "embedding": _unit(0.0, 1.0), "embedding_model": "other-model"}],
+        )
+        db_session.commit()
+
+        results = index.search(db_session, "academic_schedules", _unit(1.0, 0.0), 1)
+        assert results[0]["similarity"] == pytest.approx(0.5)
+
+    def test_table_version_bumps_once_per_commit(self, db_session):
+        """Several flushes in one transaction bump the version once; a rollback bumps nothing."""
+        from app.models.table_version import TableVersion
+
+        def version():
+            return db_session.get(TableVersion, "academic_schedules", populate_existing=True).version
+
+        db_session.add(_schedule("수강신청", _unit(1.0, 0.0)))
+        db_session.flush()
+        db_session.add(_schedule("개강", _unit(0.0, 1.0)))
+        db_session.flush()
+        db_session.commit()
+        assert version() == 1
+
+        db_session.add(_schedule("종강", _unit(1.0, 1.0)))
+        db_session.commit()
+        db_session.add(_schedule("휴강", _unit(1.0, 1.0)))
+        db_session.flush()
+        db_session.rollback()
+        assert version() == 2
@@ -0,0 +1,104 @@
+"""
+Unit tests for startup warm-up and readiness.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services import warmup
+from app.services.warmup import WarmupState, run_warmup
+
+
+async def ok():
+    await asyncio.sleep(0)
+
+
+async def boom():
+    raise RuntimeError("model download failed")
+
+
+def flaky(failures):
+    """Step that fails `failures` times before succeeding."""
+    calls = []
+
+    async def run():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise ConnectionError("database restarting")
+    return run
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(settings, "WARMUP_RETRY_ATTEMPTS", 2)
+    monkeypatch.setattr(settings, "WARMUP_RETRY_BACKOFF", 0.0)
+
+
+@pytest.mark.unit
+class TestWarmup:
+    """Test cases for warm-up steps and the /ready endpoint."""
+
+    async def test_ready_after_all_required_steps_succeed(self):
+        """Optional failures are recorded but do not block readiness."""
+        state = WarmupState()
+
+        ready = await run_warmup(state, [("database", ok, True), ("redis", boom, False)])
+
+        snapshot = state.snapshot()
+        assert ready and snapshot["status"] == "ready"
+        assert snapshot["steps"]["database"]["status"] == "ok"
+        assert snapshot["steps"]["redis"]["error"] == "model download failed"
+        assert all(step["duration_ms"] is not None for step in snapshot["steps"].values())
+
+    async def test_required_failure_keeps_instance_unready(self, fast_retries):
+        """A required step failing every retry leaves the instance out of rotation."""
+        state = WarmupState()
+
+        ready = await run_warmup(state, [("database", ok, True), ("embedding_model", boom, True)])
+
+        assert not ready
+        assert state.snapshot()["status"] == "failed"
+        assert state.steps["embedding_model"].attempts == 3
+
+    async def test_transient_required_failure_is_retried(self, fast_retries):
+        """A required step that recovers within the retry budget makes the instance ready."""
+        state = WarmupState()
+
+        ready = await run_warmup(state, [("database", flaky(2), True), ("redis", flaky(1), False)])
+
+        assert ready
+        assert state.steps["database"].attempts == 3
+        assert state.steps["redis"].status == "failed" and state.steps["redis"].attempts == 1
+
+    async def test_failed_warmup_restarts_after_cooldown(self, fast_retries, monkeypatch):
+        """After the cooldown, a /ready probe re-runs a failed warm-up instead of staying 503 forever."""
+        state = WarmupState()
+        database = flaky(3)
+        monkeypatch.setattr(warmup, "_warmup_state", state)
+        monkeypatch.setattr(warmup, "_warmup_task", None)
+        monkeypatch.setattr(warmup, "default_steps", lambda: [("database", database, True)])
+        monkeypatch.setattr(settings, "WARMUP_RETRY_COOLDOWN", 60.0)
+
+        assert not await run_warmup(state)
+        warmup.retry_failed_warmup()
+        assert warmup._warmup_task is None  # still cooling down
+
+        state.finished_at = time.monotonic() - 60.0
+        warmup.retry_failed_warmup()
+        await warmup._warmup_task
+
+        assert state.ready
+
+    def test_ready_endpoint(self, client, monkeypatch):
+        """/ready is 503 while warming up and 200 once ready, /health stays 200."""
+        state = WarmupState()
+        monkeypatch.setattr("app.main.get_warmup_state", lambda: state)
+
+        assert client.get("/ready").status_code == 503
+        assert client.get("/health").status_code == 200
+
+        state.ready = True
+        assert client.get("/ready").status_code == 200
@@ -0,0 +1,154 @@
+"""
+미들웨어 요청당 오버헤드 벤치마크
+기존 BaseHTTPMiddleware 기반 성능/캐시 미들웨어와 현재 순수 ASGI 미들웨어를
+같은 전체 미들웨어 구성(CORS, GZip, 성능 측정, 캐시 정책)에 넣고 요청당 지연시간을 비교합니다.
+
+네트워크와 서버 없이 ASGI 앱을 직접 호출하므로 미들웨어 자체 비용만 측정합니다.
+미들웨어가 없는 앱을 기준선으로 함께 측정합니다.
+
+사용법:
+    python scripts/benchmark_middleware.py --requests 5000
+"""
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.middleware import CacheMiddleware, PerformanceMiddleware, StreamingAwareGZipMiddleware
+
+
+class LegacyPerformanceMiddleware(BaseHTTPMiddleware):
+    """기존 구현: BaseHTTPMiddleware 성능 측정"""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+
+class LegacyCacheMiddleware(BaseHTTPMiddleware):
+    """기존 구현: BaseHTTPMiddleware 경로 문자열 포함 검사 캐시 정책"""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method == "GET":
+            if "/api/v1/schedules" in request.url.path:
+                response.headers["Cache-Control"] = "public, max-age=3600"
+            elif "/api/v1/notices" in request.url.path:
+                response.headers["Cache-Control"] = "public, max-age=300"
+            elif "/api/v1/programs" in request.url.path:
+                response.headers["Cache-Control"] = "public, max-age=1800"
+            else:
+                response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+        return response
+
+
+def build_app(performance=None, cache=None) -> FastAPI:
+    """main.py와 같은 순서로 미들웨어를 붙인 최소 앱 (JSON 엔드포인트, 스트리밍 엔드포인트)"""
+    app = FastAPI()
+
+    @app.get("/api/v1/notices")
+    async def notices():
+        return [{"id": i, "title": f"공지 {i}"} for i in range(5)]
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(10):
+                yield f"data: {i}\n\n"
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    if performance is not None:
+        app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"], allow_methods=["*"])
+        app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1000)
+        app.add_middleware(performance)
+        app.add_middleware(cache)
+    return app
+
+
+async def call(app, path: str):
+    """ASGI 앱에 GET 요청 하나를 직접 전달하고 본문 끝까지 수신"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "server": ("testserver", 80), "client": ("127.0.0.1", 1234),
+        "headers": [(b"host", b"testserver"), (b"origin", b"http://localhost:3000")],
+    }
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        # 첫 호출은 요청 본문, 이후에는 응답이 끝난 뒤 연결 종료 (BaseHTTPMiddleware의 연결 끊김 감시용)
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_done.set()
+
+    await app(scope, receive, send)
+
+
+async def measure(app, path: str, requests: int, warmup: int) -> List[float]:
+    """요청별 지연시간 (µs)"""
+    for _ in range(warmup):
+        await call(app, path)
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await call(app, path)
+        latencies.append((time.perf_counter() - started) * 1e6)
+    return latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미들웨어 요청당 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000, help="경로별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=200, help="측정 전 워밍업 요청 수")
+    args = parser.parse_args()
+
+    stacks: Dict[str, Callable[[], FastAPI]] = {
+        "미들웨어 없음": lambda: build_app(),
+        "BaseHTTPMiddleware (기존)": lambda: build_app(LegacyPerformanceMiddleware, LegacyCacheMiddleware),
+        "순수 ASGI (현재)": lambda: build_app(PerformanceMiddleware, CacheMiddleware),
+    }
+
+    for path in ("/api/v1/notices", "/stream"):
+        print(f"\n{path} ({args.requests}회, 단위 µs)")
+        print(f"{'구성':<28}{'mean':>10}{'p50':>10}{'p99':>10}{'오버헤드':>12}")
+        baseline = None
+        for name, build in stacks.items():
+            stats = summarize(asyncio.run(measure(build(), path, args.requests, args.warmup)))
+            baseline = stats["mean"] if baseline is None else baseline
+            print(
+                f"{name:<28}{stats['mean']:>10.1f}{stats['p50']:>10.1f}{stats['p99']:>10.1f}"
+                f"{stats['mean'] - baseline:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+하이브리드 검색 결과 통합 전략 오프라인 평가
+scripts/data/*.json 코퍼스를 임시 SQLite DB에 넣고 임베딩을 생성한 뒤,
+질문마다 키워드/벡터 후보를 한 번 검색하고 통합 전략별 recall@k, MRR, 지연시간을 비교합니다.
+
+평가 질문:
+    - 기본: 코퍼스 문서마다 제목과 본문 첫 문장을 질문으로 사용 (정답 = 해당 문서)
+    - --queries: 직접 만든 질문 파일
+      [{"query": "...", "table": "notices", "title": "정답 문서 제목"}, ...]
+
+사용법:
+    python scripts/evaluate_search.py
+    python scripts/evaluate_search.py --strategies rrf,zscore --candidate-factors 1,2 --k 1,3,5
+    python scripts/evaluate_search.py --queries my_queries.json --json results.json
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models.question_log import QuestionCategory
+from app.services.ai.embeddings import get_embedding_service
+from app.services.classifier import QuestionClassifier
+from app.services.documents import DOCUMENT_TABLES
+from app.services.fusion import FUSION_STRATEGIES, fuse
+from app.services.search import SearchService
+from seed_data import seed_academic_schedules, seed_glossary, seed_notices, seed_support_programs
+
+# (정답 문서 출처 표시, 문서 ID): 검색 결과의 source/id와 같은 형식
+DocKey = Tuple[str, int]
+
+
+def build_corpus(db_path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """임시 SQLite DB에 코퍼스와 임베딩을 넣고 테이블별 문서 반환"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    embedding_service = get_embedding_service()
+    documents: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        for seed in (seed_academic_schedules, seed_notices, seed_support_programs, seed_glossary):
+            seed(db)
+
+        for table in DOCUMENT_TABLES.values():
+            rows = db.query(table.model).all()
+            texts = [table.texts(row) for row in rows]
+            embeddings = embedding_service.get_embeddings_batch(
+                [table.embedding_text(row) for row in rows], use_cache=False
+            )
+            for row, embedding in zip(rows, embeddings):
+                row.embedding = embedding
+            documents[table.name] = [
+                {"key": (table.to_payload(row)["source"], row.id), "title": title, "body": body}
+                for row, (title, body) in zip(rows, texts)
+            ]
+        db.commit()
+    finally:
+        db.close()
+        engine.dispose()
+    return documents
+
+
+def _first_sentence(text: str) -> str:
+    """본문 첫 문장 (글머리표/줄바꿈 기준)"""
+    for line in text.replace("•", "\n").split("\n"):
+        sentence = line.strip().split(". ")[0].strip()
+        if len(sentence) >= 8:
+            return sentence
+    return ""
+
+
+def corpus_queries(documents: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """코퍼스 문서에서 평가 질문 생성 (제목, 본문 첫 문장)"""
+    queries = []
+    for table_name, docs in documents.items():
+        for doc in docs:
+            for kind, query in (("title", doc["title"]), ("body", _first_sentence(doc["body"]))):
+                if query:
+                    queries.append({"query": query, "table": table_name, "kind": kind, "relevant": doc["key"]})
+    return queries
+
+
+def file_queries(path: Path, documents: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """질문 파일 로드 (정답 문서는 테이블과 제목으로 지정)"""
+    by_title = {
+        (table_name, doc["title"]): doc["key"]
+        for table_name, docs in documents.items()
+        for doc in docs
+    }
+    queries = []
+    for item in json.loads(path.read_text(encoding="utf-8")):
+        key = by_title.get((item["table"], item["title"]))
+        if key is None:
+            print(f"  정답 문서를 찾을 수 없어 건너뜀: {item['table']} / {item['title']}")
+            continue
+        queries.append({"query": item["query"], "table": item["table"], "kind": "file", "relevant": key})
+    return queries
+
+
+def _rank(results: List[Dict[str, Any]], relevant: DocKey) -> Optional[int]:
+    """정답 문서 순위 (1부터, 없으면 None)"""
+    for rank, result in enumerate(results, start=1):
+        if (result.get("source"), result.get("id")) == relevant:
+            return rank
+    return None
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def evaluate(
+    async_url: str,
+    queries: List[Dict[str, Any]],
+    strategies: List[str],
+    candidate_factors: List[float],
+    ks: List[int],
+    oracle_category: bool,
+    keyword_weight: float,
+    rrf_k: int,
+) -> List[Dict[str, Any]]:
+    """후보 배수 × 통합 전략별 검색 품질/지연시간 측정"""
+    engine = create_async_engine(async_url)
+    classifier = QuestionClassifier()
+    limit = max(ks)
+    rows = []
+
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            service = SearchService(db)
+            for factor in candidate_factors:
+                candidates = max(limit, int(limit * factor + 0.999))
+                ranks: Dict[str, List[Tuple[str, Optional[int]]]] = defaultdict(list)
+                retrieval_ms: List[float] = []
+                fusion_ms: Dict[str, List[float]] = defaultdict(list)
+
+                for item in queries:
+                    category = (
+                        DOCUMENT_TABLES[item["table"]].category if oracle_category
+                        else classifier.classify(item["query"])
+                    )
+                    if category == QuestionCategory.OTHER:
+                        category = None
+
+                    started = time.perf_counter()
+                    keyword_results, vector_results, _ = await service._retrieve_concurrently(
+                        item["query"], category, candidates, use_cache=False, deadline=60.0
+                    )
+                    retrieval_ms.append((time.perf_counter() - started) * 1000)
+
+                    for strategy in strategies:
+                        started = time.perf_counter()
+                        results = fuse(
+                            keyword_results, vector_results, limit,
+                            strategy=strategy, keyword_weight=keyword_weight, rrf_k=rrf_k,
+                        )
+                        fusion_ms[strategy].append((time.perf_counter() - started) * 1000)
+                        ranks[strategy].append((item["table"], _rank(results, item["relevant"])))
+
+                for strategy in strategies:
+                    row = {
+                        "strategy": strategy,
+                        "candidate_factor": factor,
+                        "candidates": candidates,
+                        "queries": len(queries),
+                        "mrr": statistics.mean(1 / rank if rank else 0.0 for _, rank in ranks[strategy]),
+                        "retrieval_mean_ms": statistics.mean(retrieval_ms),
+                        "retrieval_p95_ms": _percentile(retrieval_ms, 0.95),
+                        "fusion_mean_ms": statistics.mean(fusion_ms[strategy]),
+                        "fusion_p95_ms": _percentile(fusion_ms[strategy], 0.95),
+                        "by_table": {},
+                    }
+                    for k in ks:
+                        row[f"recall@{k}"] = statistics.mean(
+                            1.0 if rank and rank <= k else 0.0 for _, rank in ranks[strategy]
+                        )
+                    # 카테고리(정답 테이블)별 recall: 카테고리별 전략 선택 근거
+                    for table_name in DOCUMENT_TABLES:
+                        table_ranks = [rank for name, rank in ranks[strategy] if name == table_name]
+                        if table_ranks:
+                            row["by_table"][table_name] = {
+                                f"recall@{k}": statistics.mean(
+                                    1.0 if rank and rank <= k else 0.0 for rank in table_ranks
+                                )
+                                for k in ks
+                            }
+                    rows.append(row)
+    finally:
+        await engine.dispose()
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]], ks: List[int]):
+    """결과 표 출력"""
+    recall_columns = "".join(f"{'R@' + str(k):>8}" for k in ks)
+    print(f"{'strategy':<10}{'cand':>6}{recall_columns}{'MRR':>8}{'retr ms':>10}{'p95':>8}{'fuse ms':>10}")
+    print("-" * (42 + 8 * len(ks) + 8))
+    for row in rows:
+        recalls = "".join(f"{row[f'recall@{k}']:>8.3f}" for k in ks)
+        print(
+            f"{row['strategy']:<10}{row['candidates']:>6}{recalls}{row['mrr']:>8.3f}"
+            f"{row['retrieval_mean_ms']:>10.2f}{row['retrieval_p95_ms']:>8.2f}{row['fusion_mean_ms']:>10.3f}"
+        )
+
+    k = max(ks)
+    print(f"\n테이블별 recall@{k}")
+    table_names = list(DOCUMENT_TABLES)
+    print(f"{'strategy':<10}{'cand':>6}" + "".join(f"{name:>20}" for name in table_names))
+    for row in rows:
+        print(
+            f"{row['strategy']:<10}{row['candidates']:>6}"
+            + "".join(f"{row['by_table'].get(name, {}).get(f'recall@{k}', float('nan')):>20.3f}" for name in table_names)
+        )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="하이브리드 검색 통합 전략 오프라인 평가")
+    parser.add_argument("--strategies", default=",".join(FUSION_STRATEGIES), help="평가할 통합 전략 (쉼표 구분)")
+    parser.add_argument("--candidate-factors", default="1,2", help="분기별 후보 배수 목록 (limit × 배수)")
+    parser.add_argument("--k", default="1,3,5", help="recall@k의 k 목록 (최댓값이 limit)")
+    parser.add_argument("--queries", type=Path, help="직접 만든 질문 파일 (JSON)")
+    parser.add_argument("--oracle-category", action="store_true", help="분류기 대신 정답 테이블의 카테고리 사용")
+    parser.add_argument("--keyword-weight", type=float, default=0.4)
+    parser.add_argument("--rrf-k", type=int, default=60)
+    parser.add_argument("--json", type=Path, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    strategies = [name.strip() for name in args.strategies.split(",") if name.strip()]
+    unknown = [name for name in strategies if name not in FUSION_STRATEGIES]
+    if unknown:
+        parser.error(f"알 수 없는 통합 전략: {', '.join(unknown)}")
+    ks = sorted(int(k) for k in args.k.split(","))
+    candidate_factors = [float(factor) for factor in args.candidate_factors.split(",")]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        print("코퍼스 로드 및 임베딩 생성 중...")
+        db_path = Path(workdir) / "evaluate_search.db"
+        documents = build_corpus(db_path)
+        queries = file_queries(args.queries, documents) if args.queries else corpus_queries(documents)
+        print(f"✓ 문서 {sum(len(docs) for docs in documents.values())}개, 질문 {len(queries)}개\n")
+
+        rows = asyncio.run(evaluate(
+            f"sqlite+aiosqlite:///{db_path}",
+            queries,
+            strategies,
+            candidate_factors,
+            ks,
+            args.oracle_category,
+            args.keyword_weight,
+            args.rrf_k,
+        ))
+
+    print_report(rows, ks)
+    if args.json:
+        args.json.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n✓ 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+임베딩 모델 ONNX 변환 스크립트
+sentence-transformers 모델의 트랜스포머 부분을 ONNX로 내보내고 int8 동적 양자화 모델을 함께 생성합니다.
+풀링(평균)과 토큰화는 ONNX 백엔드(app/services/ai/embedding_backends.py)가 직접 수행합니다.
+
+출력 디렉터리:
+    model.onnx              float32 모델
+    model.int8.onnx         int8 동적 양자화 모델 (--no-quantize 시 생략)
+    tokenizer.json          fast tokenizer
+    embedding_config.json   최대 길이, 패딩 토큰, 차원, 정규화 여부
+
+변환 후 PyTorch 모델과의 코사인 유사도 및 질문 1개당 지연시간을 비교합니다.
+
+사용법:
+    python scripts/export_onnx.py
+    python scripts/export_onnx.py --output backend/models/embedding-onnx --opset 17
+    EMBEDDING_BACKEND=onnx EMBEDDING_ONNX_DIR=./models/embedding-onnx uvicorn app.main:app
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+import numpy as np
+from app.core.config import settings
+from app.services.ai.embedding_backends import (
+    ONNX_CONFIG_FILE,
+    ONNX_MODEL_FILE,
+    ONNX_QUANTIZED_MODEL_FILE,
+    ONNX_TOKENIZER_FILE,
+    OnnxBackend,
+)
+
+DEFAULT_OUTPUT = Path(__file__).parent.parent / "backend" / "models" / "embedding-onnx"
+
+# 비교용 문장 (scripts/data 코퍼스가 있으면 문서 제목을 추가로 사용)
+SAMPLE_SENTENCES = [
+    "수강신청은 언제 하나요?",
+    "장학금 신청 방법이 궁금해요",
+    "학사 일정을 알려주세요",
+    "기숙사 입사 신청 기간",
+    "졸업 요건과 학점 기준",
+    "How do I register for classes?",
+]
+
+
+def export(model_name: str, output: Path, opset: int, quantize: bool):
+    """트랜스포머 ONNX 변환, 토크나이저/설정 저장, int8 양자화"""
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
+
+    model = SentenceTransformer(model_name, device="cpu")
+    pooling = next((module for module in model if isinstance(module, Pooling)), None)
+    if pooling is None or not pooling.pooling_mode_mean_tokens:
+        raise SystemExit("평균 풀링 모델만 지원합니다")
+    transformer = model[0].auto_model.eval()
+    tokenizer = model.tokenizer
+
+    output.mkdir(parents=True, exist_ok=True)
+    dummy = tokenizer(["예시 문장입니다"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in dummy]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["token_embeddings"] = {0: "batch", 1: "sequence"}
+
+    print(f"ONNX 변환 중: {model_name} (opset {opset})")
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(dummy[name] for name in input_names),
+            str(output / ONNX_MODEL_FILE),
+            input_names=input_names,
+            output_names=["token_embeddings"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            dynamo=False,  # TorchScript 기반 변환 (onnxscript 불필요, 동적 배치/길이 축 지원)
+        )
+
+    tokenizer.backend_tokenizer.save(str(output / ONNX_TOKENIZER_FILE))
+    config = {
+        "model_name": model_name,
+        "max_seq_length": model.max_seq_length,
+        "pad_token": tokenizer.pad_token,
+        "pad_token_id": tokenizer.pad_token_id,
+        "dimension": model.get_sentence_embedding_dimension(),
+        "normalize": any(isinstance(module, Normalize) for module in model),
+    }
+    (output / ONNX_CONFIG_FILE).write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"✓ {output / ONNX_MODEL_FILE}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantize_dynamic(
+            str(output / ONNX_MODEL_FILE),
+            str(output / ONNX_QUANTIZED_MODEL_FILE),
+            weight_type=QuantType.QInt8,
+        )
+        print(f"✓ {output / ONNX_QUANTIZED_MODEL_FILE}")
+    return model
+
+
+def _cosines(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """행별 코사인 유사도"""
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    return (reference * candidate).sum(axis=1) / np.clip(norms, 1e-12, None)
+
+
+def _per_query_ms(encode, sentences: List[str], repeat: int) -> float:
+    """질문 1개씩 인코딩할 때의 중앙값 지연시간 (ms)"""
+    encode(sentences[0])  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        for sentence in sentences:
+            started = time.perf_counter()
+            encode(sentence)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def compare(model, output: Path, sentences: List[str], repeat: int):
+    """PyTorch 모델 대비 ONNX 모델의 코사인 일치도와 지연시간 출력"""
+    reference = model.encode(sentences, convert_to_numpy=True)
+    torch_ms = _per_query_ms(lambda text: model.encode(text, convert_to_numpy=True), sentences, repeat)
+    print(f"\n{'backend':<12}{'min cos':>10}{'mean cos':>10}{'ms/query':>10}")
+    print(f"{'torch':<12}{1.0:>10.4f}{1.0:>10.4f}{torch_ms:>10.2f}")
+
+    for quantized in (False, True):
+        if not (output / (ONNX_QUANTIZED_MODEL_FILE if quantized else ONNX_MODEL_FILE)).exists():
+            continue
+        backend = OnnxBackend(output, quantized=quantized)
+        cosines = _cosines(reference, backend.encode(sentences))
+        onnx_ms = _per_query_ms(backend.encode, sentences, repeat)
+        label = "onnx-int8" if quantized else "onnx"
+        print(f"{label:<12}{cosines.min():>10.4f}{cosines.mean():>10.4f}{onnx_ms:>10.2f}")
+
+
+def _corpus_titles() -> List[str]:
+    """scripts/data/*.json 문서 제목"""
+    titles = []
+    for path in sorted((Path(__file__).parent / "data").glob("*.json")):
+        for item in json.loads(path.read_text(encoding="utf-8")):
+            if isinstance(item, dict):
+                title = item.get("title") or item.get("name") or item.get("term_ko")
+                if title:
+                    titles.append(title)
+    return titles
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="임베딩 모델 ONNX 변환 및 int8 양자화")
+    parser.add_argument("--model", default=settings.EMBEDDING_MODEL, help="sentence-transformers 모델명")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="출력 디렉터리")
+    parser.add_argument("--opset", type=int, default=17)
+    parser.add_argument("--no-quantize", action="store_true", help="int8 양자화 모델 생성 생략")
+    parser.add_argument("--repeat", type=int, default=5, help="지연시간 측정 반복 횟수")
+    args = parser.parse_args()
+
+    model = export(args.model, args.output, args.opset, not args.no_quantize)
+    compare(model, args.output, SAMPLE_SENTENCES + _corpus_titles(), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
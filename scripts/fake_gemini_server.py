@@ -0,0 +1,108 @@
+"""
+로컬 가짜 Gemini API 서버 (부하 테스트용)
+generateContent / streamGenerateContent(SSE) REST 엔드포인트를 흉내 내며
+설정한 지연시간 동안 고정 답변을 반환합니다 (스트리밍은 지연시간에 걸쳐 조각으로 나눠 전송).
+
+사용법:
+    python scripts/fake_gemini_server.py --port 8090 --latency 1.5
+    # 백엔드는 가짜 서버를 바라보도록 실행
+    GEMINI_API_BASE_URL=http://127.0.0.1:8090/v1beta uvicorn app.main:app --workers 1
+"""
+import json
+import asyncio
+import random
+import argparse
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+FAKE_ANSWER = (
+    "# 안내\n\n**요약**: 가짜 Gemini 서버의 테스트 답변입니다.\n\n"
+    "## 상세 설명\n요청하신 내용에 대한 예시 답변입니다.\n\n**출처**: 테스트 데이터"
+)
+STREAM_CHUNKS = 20  # 스트리밍 응답 조각 수
+
+
+def _candidate(text: str) -> dict:
+    return {
+        "candidates": [{
+            "content": {"role": "model", "parts": [{"text": text}]},
+            "finishReason": "STOP",
+        }],
+    }
+
+
+def create_app(latency: float, jitter: float, error_rate: float) -> FastAPI:
+    """가짜 Gemini 서버 애플리케이션 생성"""
+    app = FastAPI(title="Fake Gemini API")
+    app.state.requests = 0
+    app.state.in_flight = 0
+    app.state.max_in_flight = 0
+
+    @app.post("/v1beta/models/{model_method}")
+    async def generate_content(model_method: str, request: Request):
+        await request.json()
+        app.state.requests += 1
+        app.state.in_flight += 1
+        app.state.max_in_flight = max(app.state.max_in_flight, app.state.in_flight)
+        delay = max(0.0, latency + random.uniform(-jitter, jitter))
+
+        if random.random() < error_rate:
+            await asyncio.sleep(delay)
+            app.state.in_flight -= 1
+            return JSONResponse(
+                status_code=503,
+                content={"error": {"code": 503, "message": "fake overload", "status": "UNAVAILABLE"}},
+            )
+
+        if model_method.endswith(":streamGenerateContent"):
+            async def stream():
+                try:
+                    size = -(-len(FAKE_ANSWER) // STREAM_CHUNKS)
+                    for start in range(0, len(FAKE_ANSWER), size):
+                        await asyncio.sleep(delay / STREAM_CHUNKS)
+                        chunk = _candidate(FAKE_ANSWER[start:start + size])
+                        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\r\n\r\n"
+                finally:
+                    app.state.in_flight -= 1
+
+            return StreamingResponse(stream(), media_type="text/event-stream")
+
+        try:
+            await asyncio.sleep(delay)
+            return _candidate(FAKE_ANSWER)
+        finally:
+            app.state.in_flight -= 1
+
+    @app.get("/stats")
+    async def stats():
+        return {
+            "requests": app.state.requests,
+            "in_flight": app.state.in_flight,
+            "max_in_flight": app.state.max_in_flight,
+        }
+
+    return app
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="가짜 Gemini API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=1.5, help="응답 지연시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="지연시간 편차 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 비율 (0~1)")
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(args.latency, args.jitter, args.error_rate),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,108 +1,401 @@
 """
-기존 데이터에 대한 임베딩 생성 스크립트
+기존 데이터에 대한 임베딩 생성 스크립트 (스트리밍 배치 백필)
+
+- 청크 단위 읽기: id 순서로 chunk-size개씩 조회하고, 청크 안에서는 yield_per로 모델 배치 크기만큼 스트리밍
+- 배치 인코딩: 모델 배치마다 한 번의 forward pass (Redis 캐시 왕복 없음)
+- 청크 단위 쓰기: 청크마다 bulk UPDATE 후 커밋하고 체크포인트(마지막 id) 기록
+- 중단 후 다시 실행하면 체크포인트 다음 id부터 재개
+- 증분: 행마다 내용 해시(제목/본문 SHA-256)와 모델 id를 저장하고, 둘 중 하나라도 다른 행만 다시 임베딩
+  (야간 실행 시 수정된 문서만 처리, 해당 문서가 포함된 검색 캐시만 무효화)
+- --workers N: 청크(id 범위)를 프로세스 풀에 나눠 인코딩 (프로세스마다 모델 1회 로드),
+  DB 쓰기는 메인 프로세스 하나가 id 순서대로 담당 (SQLite 잠금 경합 없음)
+
+사용법:
+    python scripts/generate_embeddings.py
+    python scripts/generate_embeddings.py --chunk-size 2000 --batch-size 64
+    python scripts/generate_embeddings.py --all --reset   # 모든 행 다시 생성
+    EMBEDDING_MODEL=... python scripts/generate_embeddings.py --workers 16   # 모델 변경 후 재생성
 """
 import sys
+import json
+import os
+import time
+import argparse
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
+import numpy as np
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.services.ai.embeddings import get_embedding_service
-from app.models import AcademicSchedule, Notice, SupportProgram, AcademicGlossary
+from app.services.documents import DOCUMENT_TABLES, DocumentTable
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHECKPOINT = Path(__file__).parent / ".generate_embeddings.checkpoint.json"
+
+
+class Checkpoint:
+    """테이블별 마지막 처리 id 기록 (모델이 바뀌면 무시)"""
+
+    def __init__(self, path: Path, model_name: str):
+        self.path = path
+        self.model_name = model_name
+        self.tables: Dict[str, int] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("model") == model_name:
+                self.tables = data.get("tables", {})
+            else:
+                logger.warning(f"체크포인트 모델이 다름 ({data.get('model')}), 처음부터 시작")
+
+    def last_id(self, table_name: str) -> Optional[int]:
+        return self.tables.get(table_name)
+
+    def save(self, table_name: str, last_id: int):
+        """임시 파일에 쓴 뒤 교체 (중단 시에도 파일이 깨지지 않음)"""
+        self.tables[table_name] = last_id
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(
+            json.dumps({"model": self.model_name, "tables": self.tables}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        self.tables = {}
+        if self.path.exists():
+            self.path.unlink()
+
+
+def _scan_filter(table: DocumentTable, after_id: Optional[int]) -> List[Any]:
+    """검사 대상 행 조건 (체크포인트 이후)"""
+    return [table.model.id > after_id] if after_id is not None else []
+
+
+def iter_chunks(
+    db: Session,
+    table: DocumentTable,
+    after_id: Optional[int],
+    chunk_size: int,
+    batch_size: int,
+) -> Iterator[Iterator[List[Any]]]:
+    """
+    id 순서 청크 반복 (청크마다 모델 배치 크기 행 묶음을 스트리밍)
+
+    텍스트와 함께 저장된 내용 해시/모델 id만 읽고 임베딩 값은 읽지 않음.
+    청크 조회 커서는 쓰기 전에 모두 소비되므로, 같은 연결에서 청크별 커밋이 가능
+    (PostgreSQL 서버 측 커서는 커밋 시 닫히고, SQLite는 읽는 중인 연결이 있으면 다른 연결의 커밋이 막힘)
+    """
+    model = table.model
+    while True:
+        query = (
+            select(
+                model.id,
+                *table.text_columns(),
+                model.embedding_hash,
+                model.embedding_model,
+                model.embedding.is_(None).label("missing"),
+            )
+            .where(*_scan_filter(table, after_id))
+            .order_by(model.id)
+            .limit(chunk_size)
+            .execution_options(yield_per=batch_size)
+        )
+        batches = db.execute(query).partitions()
+        first = next(batches, None)
+        if first is None:
+            return
+        last_ids: List[int] = []
+
+        def chunk() -> Iterator[List[Any]]:
+            for batch in (first, *batches):
+                last_ids.append(batch[-1].id)
+                yield batch
+
+        yield chunk()
+        if not last_ids:
+            return
+        after_id = last_ids[-1]
+
+
+def stale_rows(
+    table: DocumentTable,
+    batch: List[Any],
+    model_name: str,
+    recompute: bool,
+) -> List[Tuple[Any, str]]:
+    """
+    다시 임베딩할 행과 새 내용 해시
+
+    임베딩이 없거나, 다른 모델로 생성됐거나, 생성 이후 제목/본문이 바뀐 행
+    """
+    stale = []
+    for row in batch:
+        content_hash = table.content_hash(row)
+        if (
+            recompute
+            or row.missing
+            or row.embedding_model != model_name
+            or row.embedding_hash != content_hash
+        ):
+            stale.append((row, content_hash))
+    return stale
+
+
+@dataclass
+class EncodedChunk:
+    """인코딩된 청크 (id 오름차순)"""
+    last_id: int  # 청크에서 검사한 마지막 id (체크포인트)
+    scanned: int  # 검사한 행 수
+    ids: List[int] = field(default_factory=list)  # 다시 임베딩한 행
+    hashes: List[str] = field(default_factory=list)
+    embeddings: Sequence[Any] = field(default_factory=list)
+
+
+def encode_in_process(
+    chunks: Iterator[Iterator[List[Any]]],
+    table: DocumentTable,
+    embedding_service,
+    batch_size: int,
+    recompute: bool,
+) -> Iterator[EncodedChunk]:
+    """현재 프로세스에서 모델 배치 단위로 인코딩"""
+    for chunk in chunks:
+        encoded = None
+        for batch in chunk:
+            if encoded is None:
+                encoded = EncodedChunk(last_id=batch[-1].id, scanned=0)
+            encoded.last_id = batch[-1].id
+            encoded.scanned += len(batch)
+            stale = stale_rows(table, batch, embedding_service.model_name, recompute)
+            if not stale:
+                continue
+            encoded.ids.extend(row.id for row, _ in stale)
+            encoded.hashes.extend(content_hash for _, content_hash in stale)
+            encoded.embeddings.extend(embedding_service.get_embeddings_batch(
+                [table.embedding_text(row) for row, _ in stale], use_cache=False, batch_size=batch_size
+            ))
+        if encoded is not None:
+            yield encoded
+
+
+# 워커 프로세스별 임베딩 서비스 (초기화 시 1회 로드)
+_worker_service = None
 
-def generate_embeddings_for_schedules(db: Session, embedding_service):
-    """학사 일정 임베딩 생성"""
-    logger.info("학사 일정 임베딩 생성 중...")
-    schedules = db.query(AcademicSchedule).filter(AcademicSchedule.embedding == None).all()
-    
-    for schedule in schedules:
-        # 이름 + 설명을 합쳐서 임베딩 생성
-        text = f"{schedule.name}. {schedule.description or ''}"
-        embedding = embedding_service.get_embedding(text)
-        schedule.embedding = embedding
-    
-    db.commit()
-    logger.info(f"✓ 학사 일정 {len(schedules)}개 임베딩 생성 완료")
-
-
-def generate_embeddings_for_notices(db: Session, embedding_service):
-    """공지사항 임베딩 생성"""
-    logger.info("공지사항 임베딩 생성 중...")
-    notices = db.query(Notice).filter(Notice.embedding == None).all()
-    
-    for notice in notices:
-        # 제목 + 내용을 합쳐서 임베딩 생성
-        text = f"{notice.title}. {notice.content}"
-        embedding = embedding_service.get_embedding(text)
-        notice.embedding = embedding
-    
-    db.commit()
-    logger.info(f"✓ 공지사항 {len(notices)}개 임베딩 생성 완료")
-
-
-def generate_embeddings_for_programs(db: Session, embedding_service):
-    """지원 프로그램 임베딩 생성"""
-    logger.info("지원 프로그램 임베딩 생성 중...")
-    programs = db.query(SupportProgram).filter(SupportProgram.embedding == None).all()
-    
-    for program in programs:
-        # 이름 + 설명을 합쳐서 임베딩 생성
-        text = f"{program.name}. {program.description or ''}"
-        embedding = embedding_service.get_embedding(text)
-        program.embedding = embedding
-    
-    db.commit()
-    logger.info(f"✓ 지원 프로그램 {len(programs)}개 임베딩 생성 완료")
-
-
-def generate_embeddings_for_glossary(db: Session, embedding_service):
-    """학사 용어 임베딩 생성"""
-    logger.info("학사 용어 임베딩 생성 중...")
-    glossary = db.query(AcademicGlossary).filter(AcademicGlossary.embedding == None).all()
-    
-    for term in glossary:
-        # 용어 + 정의를 합쳐서 임베딩 생성
-        text = f"{term.term_ko}. {term.definition}"
-        embedding = embedding_service.get_embedding(text)
-        term.embedding = embedding
-    
-    db.commit()
-    logger.info(f"✓ 학사 용어 {len(glossary)}개 임베딩 생성 완료")
+
+def _init_worker(model_name: str, threads: int):
+    """워커 프로세스 초기화: 코어를 나눠 쓰도록 스레드 수 제한 후 모델 로드"""
+    global _worker_service
+    from app.services.ai.embeddings import EmbeddingService
+    _worker_service = EmbeddingService(model_name, threads=threads)
+    _worker_service.load_model()
+
+
+def _encode_in_worker(texts: List[str], batch_size: int) -> np.ndarray:
+    """워커 프로세스에서 청크 인코딩 (float32 행렬로 반환해 프로세스 간 전송량 최소화)"""
+    return _worker_service.model.encode(
+        texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False
+    ).astype(np.float32, copy=False)
+
+
+def encode_in_pool(
+    chunks: Iterator[Iterator[List[Any]]],
+    table: DocumentTable,
+    pool: ProcessPoolExecutor,
+    model_name: str,
+    batch_size: int,
+    recompute: bool,
+    max_in_flight: int,
+) -> Iterator[EncodedChunk]:
+    """
+    청크의 변경된 행을 프로세스 풀에 나눠 인코딩하고 제출 순서(id 순)대로 반환
+
+    진행 중인 청크를 max_in_flight개로 제한해 메모리 사용량을 고정하고,
+    순서대로 반환하므로 체크포인트가 항상 연속된 id 범위를 가리킴
+    """
+    pending = deque()
+
+    def resolve(encoded: EncodedChunk, future) -> EncodedChunk:
+        if future is not None:
+            encoded.embeddings = future.result()
+        return encoded
+
+    for chunk in chunks:
+        rows = [row for batch in chunk for row in batch]
+        stale = stale_rows(table, rows, model_name, recompute)
+        encoded = EncodedChunk(
+            last_id=rows[-1].id,
+            scanned=len(rows),
+            ids=[row.id for row, _ in stale],
+            hashes=[content_hash for _, content_hash in stale],
+        )
+        future = None
+        if stale:
+            future = pool.submit(_encode_in_worker, [table.embedding_text(row) for row, _ in stale], batch_size)
+        pending.append((encoded, future))
+        if len(pending) >= max_in_flight:
+            yield resolve(*pending.popleft())
+    while pending:
+        yield resolve(*pending.popleft())
+
+
+def backfill_table(
+    db: Session,
+    table: DocumentTable,
+    encode_chunks: Callable[[Iterator[Iterator[List[Any]]], DocumentTable], Iterator[EncodedChunk]],
+    checkpoint: Checkpoint,
+    chunk_size: int,
+    batch_size: int,
+    model_name: str,
+    cache=None,
+) -> int:
+    """테이블 증분 임베딩 (다시 임베딩한 행 수 반환)"""
+    after_id = checkpoint.last_id(table.name)
+    total = db.execute(
+        select(func.count()).select_from(table.model).where(*_scan_filter(table, after_id))
+    ).scalar()
+    logger.info(
+        f"{table.name} 임베딩 확인 중... 대상 {total}개"
+        + (f" (체크포인트 id > {after_id}부터 재개)" if after_id is not None else "")
+    )
+
+    scanned = 0
+    done = 0
+    started = time.perf_counter()
+    chunks = iter_chunks(db, table, after_id, chunk_size, batch_size)
+    for encoded in encode_chunks(chunks, table):
+        if encoded.ids:
+            # 청크의 변경 행을 한 번의 bulk UPDATE (기본 키 기준 executemany)로 쓰고 커밋
+            # (같은 트랜잭션에서 테이블 버전도 증가하므로 워커의 상주 인덱스가 변경을 감지)
+            db.execute(
+                update(table.model),
+                [
+                    {
+                        "id": row_id,
+                        "embedding": embedding,
+                        "embedding_hash": content_hash,
+                        "embedding_model": model_name,
+                    }
+                    for row_id, content_hash, embedding in zip(encoded.ids, encoded.hashes, encoded.embeddings)
+                ],
+            )
+            db.commit()
+            # 바뀐 문서가 포함된 검색 결과 캐시만 삭제
+            if cache is not None:
+                cache.invalidate_documents(table.name, encoded.ids)
+        checkpoint.save(table.name, encoded.last_id)
+
+        scanned += encoded.scanned
+        done += len(encoded.ids)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"  {table.name}: {scanned}/{total}개 확인, {done}개 재임베딩 "
+            f"({scanned / elapsed:.1f} rows/s 확인, {done / elapsed:.1f} rows/s 임베딩)"
+        )
+
+    # 실행 중인 워커가 확인 주기를 기다리지 않고 벡터/키워드 인덱스를 다시 구성하도록 알림
+    if cache is not None and done:
+        cache.publish_table_change(table.name)
+
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"✓ {table.name} {scanned}개 중 {done}개 임베딩 생성 완료 ({elapsed:.1f}s, {rate:.1f} rows/s)"
+    )
+    return done
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="문서 임베딩 백필")
+    parser.add_argument("--tables", default=",".join(DOCUMENT_TABLES), help="대상 테이블 (쉼표 구분)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="커밋 단위 행 수")
+    parser.add_argument("--batch-size", type=int, default=64, help="모델 배치 크기 (yield_per 단위)")
+    parser.add_argument("--all", action="store_true", help="내용/모델이 같은 행도 모두 다시 생성")
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT, help="체크포인트 파일")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터 시작")
+    parser.add_argument("--workers", type=int, default=1, help="인코딩 프로세스 수 (1이면 현재 프로세스)")
+    parser.add_argument("--skip-cache", action="store_true", help="검색 캐시 무효화 건너뛰기")
+    args = parser.parse_args()
+
+    table_names = [name.strip() for name in args.tables.split(",") if name.strip()]
+    unknown = [name for name in table_names if name not in DOCUMENT_TABLES]
+    if unknown:
+        parser.error(f"알 수 없는 테이블: {', '.join(unknown)}")
+
     logger.info("=" * 50)
     logger.info("임베딩 생성 시작")
     logger.info("=" * 50)
-    
+
     # 데이터베이스 세션 및 임베딩 서비스
     db = SessionLocal()
     embedding_service = get_embedding_service()
-    
+    checkpoint = Checkpoint(args.checkpoint, embedding_service.model_name)
+    if args.reset:
+        checkpoint.clear()
+
+    pool = None
+    if args.workers > 1:
+        # 프로세스마다 코어를 나눠 쓰도록 스레드 수 제한 (과다 구독 방지)
+        threads = max(1, (os.cpu_count() or args.workers) // args.workers)
+        logger.info(f"인코딩 워커 {args.workers}개 시작 (워커당 스레드 {threads}개)")
+        pool = ProcessPoolExecutor(
+            max_workers=args.workers,
+            mp_context=multiprocessing.get_context("spawn"),  # torch 스레드 상태를 fork로 복제하지 않음
+            initializer=_init_worker,
+            initargs=(embedding_service.model_name, threads),
+        )
+
+        def encode_chunks(chunks, table):
+            return encode_in_pool(
+                chunks, table, pool, embedding_service.model_name, args.batch_size, args.all,
+                max_in_flight=args.workers * 2,
+            )
+    else:
+        def encode_chunks(chunks, table):
+            return encode_in_process(chunks, table, embedding_service, args.batch_size, args.all)
+
+    cache = None
+    if settings.REDIS_ENABLED and not args.skip_cache:
+        from app.core.cache import get_cache_service
+        cache = get_cache_service()
+
     try:
-        # 각 테이블의 데이터에 대해 임베딩 생성
-        generate_embeddings_for_schedules(db, embedding_service)
-        generate_embeddings_for_notices(db, embedding_service)
-        generate_embeddings_for_programs(db, embedding_service)
-        generate_embeddings_for_glossary(db, embedding_service)
-        
+        started = time.perf_counter()
+        total = sum(
+            backfill_table(
+                db, DOCUMENT_TABLES[name], encode_chunks, checkpoint,
+                args.chunk_size, args.batch_size, embedding_service.model_name, cache,
+            )
+            for name in table_names
+        )
+        elapsed = time.perf_counter() - started
+        # 모든 테이블 완료 시 체크포인트 삭제 (다음 실행은 처음부터 변경 여부 확인)
+        checkpoint.clear()
+
         logger.info("=" * 50)
-        logger.info("✓ 모든 임베딩 생성 완료!")
+        logger.info(f"✓ 모든 임베딩 생성 완료! {total}개, {total / elapsed if elapsed > 0 else 0.0:.1f} rows/s")
         logger.info("=" * 50)
-        
+
     except Exception as e:
-        logger.error(f"✗ 오류 발생: {e}")
+        logger.error(f"✗ 오류 발생: {e} (다시 실행하면 체크포인트부터 재개)")
         db.rollback()
         raise
     finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
         db.close()
 
 
@@ -0,0 +1,133 @@
+"""
+채팅 API 동시 처리량 부하 테스트
+동시 요청 수를 늘려 가며 워커 하나가 처리하는 초당 채팅 수와 지연시간 분포를 측정합니다.
+
+사용법:
+    # 1) 가짜 Gemini 서버
+    python scripts/fake_gemini_server.py --port 8090 --latency 1.5
+    # 2) 단일 워커 백엔드
+    cd backend && GEMINI_API_BASE_URL=http://127.0.0.1:8090/v1beta \\
+        uvicorn app.main:app --port 8000 --workers 1
+    # 3) 부하 테스트
+    python scripts/load_test_chat.py --url http://127.0.0.1:8000 --concurrency 1,8,32 --requests 64
+
+    # 백엔드 없이 GeminiClient만 측정
+    GEMINI_API_BASE_URL=http://127.0.0.1:8090/v1beta python scripts/load_test_chat.py --client-only
+"""
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+from typing import Awaitable, Callable, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+import httpx
+
+QUESTIONS = [
+    "수강신청은 언제 하나요?",
+    "등록금 납부 기간이 궁금해요",
+    "장학금 신청 방법 알려주세요",
+    "학점이 뭔가요?",
+]
+
+
+async def run_level(
+    concurrency: int,
+    total: int,
+    call: Callable[[int], Awaitable[bool]],
+) -> Tuple[float, List[float], int]:
+    """동시 요청 수 하나에 대해 total개 요청 실행 (처리 시간, 지연시간 목록, 실패 수)"""
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    latencies: List[float] = []
+    failures = 0
+
+    async def worker():
+        nonlocal failures
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            ok = await call(i)
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, failures
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def main_async(args):
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    if args.client_only:
+        from app.services.ai.client import GeminiAPIError, get_gemini_client
+
+        client = get_gemini_client()
+
+        async def call(i: int) -> bool:
+            try:
+                await client.generate_response(QUESTIONS[i % len(QUESTIONS)], system_prompt="테스트")
+                return True
+            except GeminiAPIError:
+                return False
+
+        target = f"GeminiClient → {client._get_http().base_url}"
+    else:
+        http = httpx.AsyncClient(
+            base_url=args.url,
+            timeout=args.timeout,
+            limits=httpx.Limits(max_connections=max(levels)),
+        )
+
+        async def call(i: int) -> bool:
+            try:
+                response = await http.post(
+                    "/api/v1/chat", json={"message": QUESTIONS[i % len(QUESTIONS)]}
+                )
+                return response.status_code == 200
+            except httpx.HTTPError:
+                return False
+
+        target = f"{args.url}/api/v1/chat"
+
+    print(f"대상: {target}")
+    print(f"{'동시성':>6} {'요청':>6} {'실패':>6} {'처리량(req/s)':>14} {'p50(ms)':>9} {'p95(ms)':>9} {'max(ms)':>9}")
+    for concurrency in levels:
+        elapsed, latencies, failures = await run_level(concurrency, args.requests, call)
+        print(
+            f"{concurrency:>6} {len(latencies):>6} {failures:>6} "
+            f"{len(latencies) / elapsed:>14.2f} "
+            f"{statistics.median(latencies) * 1000:>9.0f} "
+            f"{_percentile(latencies, 0.95) * 1000:>9.0f} "
+            f"{max(latencies) * 1000:>9.0f}"
+        )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="채팅 API 동시 처리량 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="백엔드 주소")
+    parser.add_argument("--concurrency", default="1,4,16,32", help="동시 요청 수 목록 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=64, help="동시성 단계별 요청 수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 제한 시간 (초)")
+    parser.add_argument("--client-only", action="store_true", help="GeminiClient만 직접 측정")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
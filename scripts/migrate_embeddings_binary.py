@@ -0,0 +1,118 @@
+"""
+임베딩 바이너리 저장 형식 마이그레이션 스크립트
+- SQLite: JSON 텍스트로 저장된 embedding 컬럼을 바이너리 BLOB(embedding_codec 형식)으로 변환
+- Redis: JSON 형식의 embedding:* 캐시 키 삭제 (다음 조회 시 바이너리로 다시 저장됨)
+PostgreSQL(pgvector)은 VECTOR 타입을 그대로 사용하므로 DB 변환이 필요 없습니다.
+
+사용법:
+    python scripts/migrate_embeddings_binary.py --dtype float32
+    python scripts/migrate_embeddings_binary.py --dry-run
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.database import engine
+from app.services.documents import DOCUMENT_TABLES
+from app.utils.embedding_codec import decode_embedding, encode_embedding, to_vector
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def migrate_table(conn, table_name: str, dtype: str, dry_run: bool, batch_size: int) -> int:
+    """테이블의 텍스트 임베딩을 바이너리로 변환"""
+    rows = conn.execute(
+        text(f"SELECT id, embedding FROM {table_name} WHERE typeof(embedding) = 'text'")
+    ).fetchall()
+
+    updates = []
+    skipped = 0
+    for row_id, value in rows:
+        try:
+            vector = to_vector(value)
+        except ValueError:
+            vector = None
+        if vector is None:
+            skipped += 1
+            continue
+        updates.append({"id": row_id, "embedding": encode_embedding(vector, dtype)})
+
+    if not dry_run:
+        statement = text(f"UPDATE {table_name} SET embedding = :embedding WHERE id = :id")
+        for start in range(0, len(updates), batch_size):
+            conn.execute(statement, updates[start:start + batch_size])
+
+    if skipped:
+        logger.warning(f"  {table_name}: 형식이 잘못된 임베딩 {skipped}개 건너뜀")
+    logger.info(f"✓ {table_name}: {len(updates)}개 변환{' (dry-run)' if dry_run else ''}")
+    return len(updates)
+
+
+def clear_json_cache(dry_run: bool) -> int:
+    """바이너리 형식이 아닌 Redis 임베딩 캐시 키 삭제"""
+    from redis import Redis
+    from redis.exceptions import RedisError
+
+    try:
+        client = Redis.from_url(settings.REDIS_URL, decode_responses=False, socket_connect_timeout=5)
+        client.ping()
+    except RedisError as e:
+        logger.warning(f"Redis 연결 실패, 캐시 정리 건너뜀: {e}")
+        return 0
+
+    stale = []
+    for key in client.scan_iter(match="embedding:*", count=500):
+        value = client.get(key)
+        if value is None:
+            continue
+        try:
+            decode_embedding(value)
+        except ValueError:
+            stale.append(key)
+
+    if stale and not dry_run:
+        for start in range(0, len(stale), 500):
+            client.delete(*stale[start:start + 500])
+    logger.info(f"✓ Redis: JSON 임베딩 캐시 {len(stale)}개 삭제{' (dry-run)' if dry_run else ''}")
+    return len(stale)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="임베딩 바이너리 저장 형식 마이그레이션")
+    parser.add_argument("--dtype", default=settings.EMBEDDING_STORAGE_DTYPE,
+                        choices=["float32", "float16", "int8"], help="BLOB 저장 형식")
+    parser.add_argument("--batch-size", type=int, default=500, help="UPDATE 배치 크기")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상 개수만 출력")
+    parser.add_argument("--skip-redis", action="store_true", help="Redis 캐시 정리 건너뛰기")
+    args = parser.parse_args()
+
+    logger.info("=" * 50)
+    logger.info(f"임베딩 바이너리 마이그레이션 시작 (형식: {args.dtype})")
+    logger.info("=" * 50)
+
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            total = sum(
+                migrate_table(conn, name, args.dtype, args.dry_run, args.batch_size)
+                for name in DOCUMENT_TABLES
+            )
+        logger.info(f"DB 변환 합계: {total}개")
+    else:
+        logger.info(f"{engine.dialect.name}: pgvector 컬럼은 변환이 필요 없습니다")
+
+    if settings.REDIS_ENABLED and not args.skip_redis:
+        clear_json_cache(args.dry_run)
+
+    logger.info("✓ 마이그레이션 완료")
+
+
+if __name__ == "__main__":
+    main()